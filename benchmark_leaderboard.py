@@ -0,0 +1,80 @@
+import argparse
+import random
+import time
+
+from game_logic.ranked_index import RankedIndex
+
+
+class SortedListLeaderboard:
+    """The leaderboard PlayerManager used before RankedIndex: a list re-sorted on every update."""
+
+    def __init__(self):
+        self.leaderboard = []
+
+    def update(self, key, score):
+        existing_entry = next((entry for entry in self.leaderboard if entry[0] == key), None)
+        if existing_entry:
+            max_score = max(existing_entry[1], score)
+            self.leaderboard = [(k, max_score if k == key else s) for k, s in self.leaderboard]
+        else:
+            self.leaderboard.append((key, score))
+        self.leaderboard = sorted(self.leaderboard, key=lambda x: x[1], reverse=True)
+
+    def get_rank(self, key):
+        sorted_leaderboard = sorted(self.leaderboard, key=lambda x: x[1], reverse=True)
+        for rank, (player_key, score) in enumerate(sorted_leaderboard, start=1):
+            if player_key == key:
+                return rank
+        return -1
+
+    def get_top(self, limit):
+        return self.leaderboard[:limit]
+
+
+def time_per_call_us(function, calls):
+    """Return the average time of function(*args) over the given argument tuples in microseconds."""
+    start = time.perf_counter()
+    for args in calls:
+        function(*args)
+    return (time.perf_counter() - start) / len(calls) * 1e6
+
+
+def benchmark(leaderboard, n_players, n_calls, rng):
+    """
+    Fill a leaderboard with synthetic players, then time score updates, rank lookups and top-5 queries.
+
+    Returns:
+    tuple: (update_us, rank_us, top_us) - Average time per call in microseconds.
+    """
+    keys = [(f"player{i}", f"Cluster {i % 22 + 1}") for i in range(n_players)]
+    if isinstance(leaderboard, SortedListLeaderboard):
+        # Filling it one update at a time would take minutes, sort once instead
+        leaderboard.leaderboard = sorted(((key, rng.randint(0, 300)) for key in keys), key=lambda x: x[1], reverse=True)
+    else:
+        for key in keys:
+            leaderboard.update(key, rng.randint(0, 300))
+
+    players = [rng.choice(keys) for _ in range(n_calls)]
+    update_us = time_per_call_us(leaderboard.update, [(key, rng.randint(0, 400)) for key in players])
+    rank_us = time_per_call_us(leaderboard.get_rank, [(key,) for key in players])
+    top_us = time_per_call_us(leaderboard.get_top, [(5,)] * n_calls)
+    return update_us, rank_us, top_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the ranked leaderboard index with a re-sorted list.")
+    parser.add_argument('--players', type=int, nargs='+', default=[1000, 10000, 100000], help="Leaderboard sizes.")
+    parser.add_argument('--calls', type=int, default=20, help="Timed calls per operation for the re-sorted list.")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed.")
+    args = parser.parse_args()
+
+    print(f"{'players':>8}  {'structure':<12} {'update':>12} {'rank':>12} {'top 5':>12}")
+    for n_players in args.players:
+        for name, leaderboard, n_calls in (('sorted list', SortedListLeaderboard(), args.calls),
+                                           ('RankedIndex', RankedIndex(), args.calls * 100)):
+            update_us, rank_us, top_us = benchmark(leaderboard, n_players, n_calls, random.Random(args.seed))
+            print(f"{n_players:>8}  {name:<12} {update_us:>9.1f} us {rank_us:>9.1f} us {top_us:>9.1f} us")
+
+
+if __name__ == '__main__':
+    main()
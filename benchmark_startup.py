@@ -0,0 +1,79 @@
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# Modules that must not be loaded before the main menu is shown
+HEAVY_MODULES = ['cv2', 'mediapipe', 'scipy', 'matplotlib', 'jax']
+
+# Code importing what each startup phase needs
+PHASES = {
+    'menu': "import main; import gui.main_menu, gui.game_review",
+    'vision': "import game_logic.vision_service",
+}
+
+
+def run_importtime(code):
+    """
+    Import modules in a fresh interpreter with -X importtime.
+
+    Parameters:
+    code (str): Python code doing the imports.
+
+    Returns:
+    tuple: (wall_ms, imports) - Wall time of the interpreter in milliseconds and a list of
+           (module, self_us, cumulative_us, depth) in import order.
+    """
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, check=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return wall_ms, imports
+
+
+def report_phase(phase, code, repeats, top):
+    """Print the wall time, the slowest top-level imports and the heavy modules loaded by one phase."""
+    wall_times = []
+    for _ in range(repeats):
+        wall_ms, imports = run_importtime(code)
+        wall_times.append(wall_ms)
+
+    total_ms = sum(cumulative for _, _, cumulative, depth in imports if depth == 0) / 1000
+    loaded = {name.split('.')[0] for name, _, _, _ in imports}
+    heavy = [module for module in HEAVY_MODULES if module in loaded]
+
+    print(f"[{phase}] {code}")
+    print(f"  interpreter wall time: median {statistics.median(wall_times):.0f} ms over {repeats} run(s)")
+    print(f"  import time: {total_ms:.0f} ms for {len(imports)} modules")
+    print(f"  heavy modules loaded: {', '.join(heavy) if heavy else 'none'}")
+    print("  slowest top-level imports:")
+    top_level = sorted((item for item in imports if item[3] <= 1), key=lambda item: -item[2])
+    for name, _, cumulative, _ in top_level[:top]:
+        print(f"    {cumulative / 1000:8.1f} ms  {name}")
+    return heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import time of the menu and of the vision stack.")
+    parser.add_argument('--repeats', type=int, default=5, help="Number of fresh interpreters per phase.")
+    parser.add_argument('--top', type=int, default=10, help="Number of slowest imports to list per phase.")
+    args = parser.parse_args()
+
+    heavy = report_phase('menu', PHASES['menu'], args.repeats, args.top)
+    report_phase('vision', PHASES['vision'], args.repeats, args.top)
+
+    if heavy:
+        print(f"The menu loads {', '.join(heavy)}, it should only need tkinter and PIL")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
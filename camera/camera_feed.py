@@ -1,33 +1,177 @@
+import threading
+import time
 import cv2
 from PIL import Image, ImageTk
+from camera.frame_buffer import FrameRingBuffer
 
 # from game_logic.pose_detector import PoseDetector
 
 class CameraFeed:
-    def __init__(self, label):
-        self.label = label
+    def __init__(self, label=None, threaded=True, ring_size=3):
+        """
+        Initialize the camera feed and start displaying it on the label.
+
+        Parameters:
+        label (tk.Label, optional): Label the camera frames are displayed on. Defaults to None (attach one later).
+        threaded (bool, optional): Whether a background thread owns the camera. If False, frames are
+            read on the Tk main loop. Defaults to True.
+        ring_size (int, optional): Number of preallocated frame buffers. Defaults to 3.
+        """
+        self.label = None
+        self.display_job = None  # Pending after() call of update_feed while a label is attached
         self.cap = cv2.VideoCapture(0)
         self.running = True
-        self.frame = None
+        self.threaded = threaded
+        self.frame_buffer = FrameRingBuffer(ring_size)
+        self.displayed_seq = 0
+        self.annotated_frame = None  # (frame, time) of the newest RGB frame annotated by the pose loop
+        self.displayed_annotated_frame = None
+        self.annotated_timeout = 0.2  # Seconds without annotated frames before falling back to raw frames
+        self.n_displayed = 0  # Number of frames displayed
+        self.n_display_copies = 0  # Number of full-frame copies made to display them
         # self.pose_detector = PoseDetector()
+
+        if self.threaded:
+            self.capture_thread = threading.Thread(target=self.capture_loop, daemon=True)
+            self.capture_thread.start()
+        if label is not None:
+            self.attach(label)
+
+    def attach(self, label):
+        """
+        Start displaying frames on a label. The camera keeps running between attach() and detach() calls.
+
+        Parameters:
+        label (tk.Label): Label the camera frames are displayed on.
+        """
+        self.detach()
+        self.label = label
+        self.annotated_frame = None  # Frames annotated for a previous label are stale
+        self.displayed_annotated_frame = None
         self.update_feed()
 
-    def update_feed(self):
-        if self.running:
-            ret, self.frame = self.cap.read()
+    def detach(self):
+        """Stop displaying frames on the attached label."""
+        if self.display_job is not None:
+            self.label.after_cancel(self.display_job)
+            self.display_job = None
+        self.label = None
+
+    def capture_loop(self):
+        """
+        Read frames from the camera in a background thread and publish them to the ring buffer.
+        """
+        raw_frame = None
+        while self.running:
+            ret, raw_frame = self.cap.read(raw_frame)  # Reuse the same decode buffer for every frame
             if ret:
-                self.frame = cv2.flip(self.frame, 1)
-                # self.frame = self.pose_detector.get_pose_img(self.frame)
-                frame = cv2.cvtColor(self.frame, cv2.COLOR_BGR2RGB)
-                img = Image.fromarray(frame)
-                imgtk = ImageTk.PhotoImage(image=img)
-                self.label.imgtk = imgtk
-                self.label.config(image=imgtk)
-            self.label.after(10, self.update_feed)
-
-    def stop(self):
-        self.running = False
+                self.publish_frame(raw_frame)
+            else:
+                time.sleep(0.01)  # Camera stalled, do not spin
         self.cap.release()
-    
+
+    def publish_frame(self, raw_frame):
+        """Mirror a raw camera frame into the next ring buffer slot and publish it."""
+        buffer = self.frame_buffer.begin_write(raw_frame.shape, raw_frame.dtype)
+        cv2.flip(raw_frame, 1, dst=buffer)
+        self.frame_buffer.commit(time.monotonic())
+
+    def update_feed(self):
+        self.display_job = None
+        if self.running and self.label is not None:
+            if not self.threaded:
+                ret, frame = self.cap.read()
+                if ret:
+                    self.publish_frame(frame)
+
+            # Prefer frames annotated by the pose loop, fall back to raw frames when it is not running
+            annotated_frame = self.annotated_frame
+            if annotated_frame is not None and annotated_frame is not self.displayed_annotated_frame:
+                self.displayed_annotated_frame = annotated_frame
+                self.display(annotated_frame[0])
+            elif annotated_frame is None or time.monotonic() - annotated_frame[1] > self.annotated_timeout:
+                # Only convert and display frames that have not been shown yet
+                frame, seq, _ = self.frame_buffer.get_latest(self.displayed_seq)
+                if frame is not None:
+                    self.displayed_seq = seq
+                    self.display(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame))
+            self.display_job = self.label.after(10, self.update_feed)
+
+    def display(self, frame):
+        """Show an RGB frame on the label."""
+        img = Image.fromarray(frame)
+        imgtk = ImageTk.PhotoImage(image=img)
+        self.n_displayed += 1
+        self.n_display_copies += 2  # Into the PIL image and into the Tk photo image
+        self.label.imgtk = imgtk
+        self.label.config(image=imgtk)
+
+    def show_annotated_frame(self, frame):
+        """
+        Hand an annotated frame to the display. Can be called from any thread.
+
+        Parameters:
+        frame (numpy.ndarray): Frame in RGB format. It must not be modified afterwards.
+        """
+        self.annotated_frame = (frame, time.monotonic())
+
+    def get_copy_stats(self):
+        """
+        Return full-frame copy statistics of the display pipeline.
+
+        Returns:
+        dict: Number of displayed frames, copies taken from the ring buffer, copies made for display and
+              the average number of copies per displayed frame.
+        """
+        ring_copies = self.frame_buffer.n_copies
+        return {
+            'displayed_frames': self.n_displayed,
+            'ring_buffer_copies': ring_copies,
+            'display_copies': self.n_display_copies,
+            'copies_per_displayed_frame': (ring_copies + self.n_display_copies) / max(1, self.n_displayed),
+        }
+
+    def stop(self, timeout=1.0):
+        """
+        Stop capturing and release the camera.
+
+        Parameters:
+        timeout (float, optional): Maximum time in seconds to wait for the capture thread to release the
+            camera, so the next feed can open it again. Defaults to 1.0.
+        """
+        self.detach()
+        self.running = False
+        if self.threaded:
+            self.capture_thread.join(timeout)  # The capture thread releases the camera when it exits
+        else:
+            self.cap.release()
+
     def get_frame(self):
-        return self.frame
+        frame, _, _ = self.frame_buffer.get_latest()
+        return frame
+
+    def get_latest_frame(self, last_seq=0):
+        """
+        Return the newest camera frame with its sequence number and capture timestamp.
+
+        Parameters:
+        last_seq (int, optional): Sequence number the caller has already processed. Defaults to 0.
+
+        Returns:
+        tuple: (frame, seq, timestamp) - A copy of the newest frame (None if there is no frame newer
+               than last_seq), its sequence number and its time.monotonic() capture timestamp.
+        """
+        return self.frame_buffer.get_latest(last_seq)
+
+    def wait_for_frame(self, last_seq=0, timeout=None):
+        """
+        Block until a camera frame newer than last_seq is available and return it.
+
+        Parameters:
+        last_seq (int, optional): Sequence number the caller has already processed. Defaults to 0.
+        timeout (float, optional): Maximum time to wait in seconds. Defaults to None (wait forever).
+
+        Returns:
+        tuple: (frame, seq, timestamp) as returned by get_latest_frame(). frame is None on timeout.
+        """
+        return self.frame_buffer.wait_for_frame(last_seq, timeout)
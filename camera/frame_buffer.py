@@ -0,0 +1,114 @@
+import threading
+import time
+import numpy as np
+
+
+class FrameRingBuffer:
+    def __init__(self, size=3):
+        """
+        Initialize a single-writer ring of preallocated frame buffers.
+
+        The writer fills the slot after the newest one and then publishes it, so readers never wait on
+        a lock. Every slot carries a sequence number that is set to -1 while the slot is being written;
+        readers copy a slot and retry if its sequence number changed meanwhile (a seqlock), which keeps
+        torn frames from ever reaching a consumer.
+
+        Parameters:
+        size (int, optional): Number of preallocated frame buffers. Defaults to 3.
+        """
+        self.size = size
+        self.buffers = None  # Array of shape (size, h, w, c), allocated on the first frame
+        self.slot_seqs = [0] * size  # Sequence number of the frame in each slot, -1 while writing
+        self.timestamps = [0.0] * size  # Capture timestamp of the frame in each slot
+        self.latest = -1  # Slot index of the newest published frame
+        self.seq = 0  # Sequence number of the newest published frame
+        self.write_slot = 0
+        self.new_frame = threading.Condition()  # Only used by consumers that block for a new frame
+        self.n_copies = 0  # Number of full-frame copies handed out to readers
+
+    def begin_write(self, shape, dtype=np.uint8):
+        """
+        Return the buffer the next frame should be written into.
+
+        Parameters:
+        shape (tuple): Shape of the frame.
+        dtype (numpy.dtype, optional): Data type of the frame. Defaults to numpy.uint8.
+
+        Returns:
+        numpy.ndarray: Preallocated buffer to fill before calling commit().
+        """
+        if self.buffers is None or self.buffers.shape[1:] != shape or self.buffers.dtype != dtype:
+            # (Re)allocate when the camera resolution changes, invalidating older frames. Resetting every
+            # slot's sequence number makes readers that picked a slot before this point retry or give up
+            # instead of copying the uninitialized new buffer.
+            self.latest = -1
+            self.slot_seqs = [0] * self.size
+            self.buffers = np.empty((self.size, *shape), dtype=dtype)
+
+        self.write_slot = (self.latest + 1) % self.size
+        self.slot_seqs[self.write_slot] = -1
+        return self.buffers[self.write_slot]
+
+    def commit(self, timestamp):
+        """
+        Publish the buffer returned by begin_write() as the newest frame.
+
+        Parameters:
+        timestamp (float): Capture time of the frame in seconds.
+
+        Returns:
+        int: Sequence number of the published frame.
+        """
+        self.seq += 1
+        self.timestamps[self.write_slot] = timestamp
+        self.slot_seqs[self.write_slot] = self.seq
+        self.latest = self.write_slot
+        with self.new_frame:
+            self.new_frame.notify_all()
+        return self.seq
+
+    def wait_for_frame(self, last_seq=0, timeout=None):
+        """
+        Block until a frame newer than last_seq is published and return a copy of the newest frame.
+
+        Parameters:
+        last_seq (int, optional): Sequence number the caller has already processed. Defaults to 0.
+        timeout (float, optional): Maximum time to wait in seconds. Defaults to None (wait forever).
+
+        Returns:
+        tuple: (frame, seq, timestamp) as returned by get_latest(). frame is None on timeout.
+        """
+        with self.new_frame:
+            self.new_frame.wait_for(lambda: self.seq > last_seq, timeout)
+        return self.get_latest(last_seq)
+
+    def get_latest(self, last_seq=0):
+        """
+        Return a copy of the newest frame.
+
+        Parameters:
+        last_seq (int, optional): Sequence number the caller has already processed. If no newer frame
+            was published, no copy is made. Defaults to 0.
+
+        Returns:
+        tuple: (frame, seq, timestamp) - The newest frame (None if there is no frame newer than
+               last_seq), its sequence number and its capture timestamp.
+        """
+        while True:
+            slot = self.latest
+            if slot < 0:
+                return None, 0, 0.0
+
+            seq = self.slot_seqs[slot]
+            if seq < 0:
+                time.sleep(0)  # The writer lapped the ring and is refilling this slot, let it finish
+                continue
+            if seq <= last_seq:
+                return None, seq, self.timestamps[slot]
+
+            timestamp = self.timestamps[slot]
+            frame = self.buffers[slot].copy()
+            if self.slot_seqs[slot] == seq:
+                self.n_copies += 1
+                return frame, seq, timestamp
+            time.sleep(0)  # The frame was overwritten while copying, retry with the newest one
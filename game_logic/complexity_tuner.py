@@ -0,0 +1,122 @@
+import logging
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class ComplexityAutoTuner:
+    def __init__(self, pose_detector, target_fps=15, window_size=30, headroom=0.6, cooldown_s=5,
+                 min_complexity=0, max_complexity=1):
+        """
+        Steps the model complexity of a live PoseDetector to hold a target frame rate.
+
+        Frame latencies are averaged over a sliding window. When the average exceeds the frame budget the
+        complexity is stepped down; when it stays below headroom * budget it is stepped up, unless that
+        complexity was already too slow on this machine. New graphs are built on a background thread and
+        installed between frames, so the inference thread never waits for a graph to load.
+
+        Parameters:
+        pose_detector (PoseDetector): Live pose detector to tune.
+        target_fps (float, optional): Frame rate to hold. Defaults to 15.
+        window_size (int, optional): Number of frame latencies averaged per decision. Defaults to 30.
+        headroom (float, optional): Fraction of the frame budget below which complexity is stepped up. Defaults to 0.6.
+        cooldown_s (float, optional): Minimum time between switches in seconds. Defaults to 5.
+        min_complexity (int, optional): Lowest model complexity to use. Defaults to 0.
+        max_complexity (int, optional): Highest model complexity to use. Defaults to 1, since MediaPipe downloads
+            the heavy model (2) on first use and running it can stall a live round. Raise it only where the
+            heavy model is bundled.
+        """
+        self.pose_detector = pose_detector
+        self.budget_ms = 1000 / target_fps
+        self.headroom = headroom
+        self.cooldown_s = cooldown_s
+        self.min_complexity = min_complexity
+        self.max_complexity = max_complexity
+
+        self.latencies = deque(maxlen=window_size)
+        self.last_switch_time = time.monotonic()
+        self.too_slow_complexity = max_complexity + 1  # Lowest complexity measured too slow for the target
+        self.pending_switch = None  # (from, to, before_ms) while a new graph is being built or measured
+        self.ready_pose = None  # Graph built by the background thread, installed by the next record()
+        self.unavailable = set()  # Complexities whose graph could not be built (e.g. model download failed)
+        self.build_thread = None
+
+    def record(self, latency_ms):
+        """
+        Records the end-to-end latency of one frame. Must be called from the inference thread.
+
+        Parameters:
+        latency_ms (float): Time spent on the frame in milliseconds.
+        """
+        if self.ready_pose is not None:
+            self.install_ready_pose()
+            return  # This frame ran on the previous graph
+
+        if self.pending_switch is not None and self.pending_switch[1] != self.pose_detector.model_complexity:
+            if self.pending_switch[1] in self.unavailable:
+                self.pending_switch = None  # The build failed, keep the current graph
+            return  # Still building the new graph
+
+        self.latencies.append(latency_ms)
+        if len(self.latencies) < self.latencies.maxlen:
+            return
+
+        mean_ms = sum(self.latencies) / len(self.latencies)
+        if self.pending_switch is not None:
+            from_complexity, to_complexity, before_ms = self.pending_switch
+            logger.info("model_complexity %d -> %d: %.1f ms -> %.1f ms per frame (budget %.1f ms)",
+                        from_complexity, to_complexity, before_ms, mean_ms, self.budget_ms)
+            self.pending_switch = None
+
+        if time.monotonic() - self.last_switch_time < self.cooldown_s:
+            return
+
+        complexity = self.pose_detector.model_complexity
+        if mean_ms > self.budget_ms and complexity > self.min_complexity:
+            self.too_slow_complexity = min(self.too_slow_complexity, complexity)
+            if complexity - 1 not in self.unavailable:
+                self.switch(complexity - 1, mean_ms)
+        elif (mean_ms < self.budget_ms * self.headroom and complexity < self.max_complexity
+              and complexity + 1 < self.too_slow_complexity and complexity + 1 not in self.unavailable):
+            self.switch(complexity + 1, mean_ms)
+
+    def switch(self, model_complexity, before_ms):
+        """
+        Starts building a pose graph with the given complexity on a background thread.
+
+        Parameters:
+        model_complexity (int): New model complexity.
+        before_ms (float): Mean frame latency measured with the current complexity.
+        """
+        self.pending_switch = (self.pose_detector.model_complexity, model_complexity, before_ms)
+        self.last_switch_time = time.monotonic()
+
+        def build():
+            try:
+                self.ready_pose = (self.pose_detector.create_pose(model_complexity), model_complexity)
+            except Exception as e:
+                # MediaPipe downloads the lite and heavy models on first use, which fails on offline kiosks
+                logger.warning("Cannot build model_complexity %d, keeping %d: %s",
+                               model_complexity, self.pose_detector.model_complexity, e)
+                self.unavailable.add(model_complexity)
+
+        self.build_thread = threading.Thread(target=build, daemon=True)
+        self.build_thread.start()
+
+    def install_ready_pose(self):
+        """Installs the graph built by switch() and closes the previous one off the inference thread."""
+        pose, model_complexity = self.ready_pose
+        self.ready_pose = None
+        old_pose = self.pose_detector.set_pose(pose, model_complexity)
+        self.latencies.clear()
+        self.last_switch_time = time.monotonic()
+        threading.Thread(target=old_pose.close, daemon=True).start()
+
+    def close(self):
+        """Closes a graph that was built but never installed. The detector's own graph is left to its owner."""
+        if self.ready_pose is not None:
+            pose, _ = self.ready_pose
+            self.ready_pose = None
+            pose.close()
@@ -0,0 +1,146 @@
+import math
+import threading
+import time
+
+
+def seconds_left(round_time, elapsed_ms):
+    """
+    Compute the countdown shown for a round and the game time of its next tick.
+
+    Parameters:
+    round_time (int): Length of the round in seconds.
+    elapsed_ms (float): Game time elapsed since the round started in milliseconds.
+
+    Returns:
+    tuple: (time_left, next_tick_ms) - Whole seconds left, rounded up, and the game time at which the shown
+           value next changes, or None once the round is over.
+    """
+    remaining_ms = round_time * 1000 - elapsed_ms
+    time_left = max(0, math.ceil(remaining_ms / 1000))
+    if remaining_ms <= 0:
+        return time_left, None
+    # Deadlines are absolute, so a late tick does not delay the following ones
+    return time_left, (round_time - time_left + 1) * 1000
+
+
+class GameClock:
+    def __init__(self, widget=None, time_ns=time.monotonic_ns):
+        """
+        Pausable game time based on time.monotonic_ns(), with callbacks scheduled at game times.
+
+        Game time is the monotonic time elapsed since start() minus the time spent paused, so it never jumps
+        with wall-clock or NTP changes and does not advance while paused. Callbacks are scheduled at absolute
+        game times with the widget's after(), so periodic callbacks that schedule the next one from the
+        current deadline never accumulate drift. Pausing cancels the pending after() calls and resuming
+        schedules them again for their remaining game time, which moves them forward by the paused time.
+
+        elapsed_ms() can be read from any thread. Scheduling must happen on the Tk thread.
+
+        Parameters:
+        widget (tk.Widget, optional): Widget whose after() runs scheduled callbacks. Defaults to None (no scheduling).
+        time_ns (function, optional): Monotonic time source in nanoseconds. Defaults to time.monotonic_ns.
+        """
+        self.widget = widget
+        self.time_ns = time_ns
+        self.lock = threading.Lock()
+        self.start_ns = None
+        self.pause_ns = None  # time_ns() time the clock was paused at, None while running
+        self.paused_ns = 0  # Total time spent paused since start()
+        self.timers = {}  # Dictionary to store timer id: [game time (ms), callback, after() job]
+        self.next_timer_id = 0
+
+    def start(self):
+        """Start the game time at zero, cancelling the callbacks scheduled before."""
+        self.stop()
+        with self.lock:
+            self.start_ns = self.time_ns()
+            self.pause_ns = None
+            self.paused_ns = 0
+
+    def elapsed_ms(self):
+        """Return the game time in milliseconds, 0 before start()."""
+        with self.lock:
+            if self.start_ns is None:
+                return 0.0
+            now_ns = self.pause_ns if self.pause_ns is not None else self.time_ns()
+            return (now_ns - self.start_ns - self.paused_ns) / 1e6
+
+    def is_paused(self):
+        """Return True while the clock is paused."""
+        return self.pause_ns is not None
+
+    def pause(self):
+        """Stop the game time and hold the scheduled callbacks."""
+        with self.lock:
+            if self.start_ns is None or self.pause_ns is not None:
+                return
+            self.pause_ns = self.time_ns()
+        for timer in self.timers.values():
+            self.cancel_job(timer)
+
+    def resume(self):
+        """Restart the game time where it was paused and reschedule the held callbacks."""
+        with self.lock:
+            if self.pause_ns is None:
+                return
+            self.paused_ns += self.time_ns() - self.pause_ns
+            self.pause_ns = None
+        for timer_id in list(self.timers):
+            self.schedule(timer_id)
+
+    def call_at(self, time_ms, callback):
+        """
+        Call a function on the Tk loop once the game time reaches time_ms.
+
+        Parameters:
+        time_ms (float): Game time in milliseconds.
+        callback (function): Function called without arguments.
+
+        Returns:
+        int: Timer id, to be passed to cancel().
+        """
+        self.next_timer_id += 1
+        self.timers[self.next_timer_id] = [time_ms, callback, None]
+        if not self.is_paused():
+            self.schedule(self.next_timer_id)
+        return self.next_timer_id
+
+    def call_later(self, delay_ms, callback):
+        """Call a function on the Tk loop once delay_ms of game time has passed. Returns the timer id."""
+        return self.call_at(self.elapsed_ms() + delay_ms, callback)
+
+    def cancel(self, timer_id):
+        """Cancel a scheduled callback. Unknown or already called timers are ignored."""
+        timer = self.timers.pop(timer_id, None)
+        if timer is not None:
+            self.cancel_job(timer)
+
+    def stop(self):
+        """Cancel every scheduled callback."""
+        for timer_id in list(self.timers):
+            self.cancel(timer_id)
+
+    def schedule(self, timer_id):
+        """Schedule the after() call of a timer for its remaining game time."""
+        timer = self.timers[timer_id]
+        self.cancel_job(timer)
+        delay_ms = max(0, math.ceil(timer[0] - self.elapsed_ms()))
+        timer[2] = self.widget.after(delay_ms, lambda: self.fire(timer_id))
+
+    def cancel_job(self, timer):
+        """Cancel the pending after() call of a timer."""
+        if timer[2] is not None:
+            self.widget.after_cancel(timer[2])
+            timer[2] = None
+
+    def fire(self, timer_id):
+        """Run a timer's callback, or schedule it again if after() fired before its game time."""
+        timer = self.timers.get(timer_id)
+        if timer is None:
+            return
+        timer[2] = None
+        if self.elapsed_ms() < timer[0]:
+            self.schedule(timer_id)
+            return
+        del self.timers[timer_id]
+        timer[1]()
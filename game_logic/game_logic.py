@@ -1,117 +1,197 @@
 import threading
 import time
-import cv2
-from game_logic.pose_detector import PoseDetector
+from game_logic.game_clock import GameClock
+from game_logic.pose_filter import OneEuroFilter, HoldConfirmation
 from game_logic.player_manager import PlayerManager
 
-def current_time_ms():
-    return round(time.time() * 1000)
-
 class GameLogic:
-    def __init__(self, reference_images, camera_feed, on_score_update, on_combo_update):
+    def __init__(self, reference_images, vision_service, on_score_update, on_combo_update, target_fps=None,
+                 reference_assets=None, game_clock=None, hold_ms=300):
         """
         Initialize GameLogic.
 
         Parameters:
         reference_images (list): List of paths to reference images.
-        camera_feed (CameraFeed): Object to get live camera feed.
-        on_score_update (function): Callback to update the score in the UI.
+        vision_service (VisionService): Long-lived camera and pose detectors the round attaches to.
+        on_score_update (function): Callback to update the score in the UI. Called from the game thread.
+        on_combo_update (function): Callback to update the score multiplier in the UI, called from the game thread
+            only when the multiplier changes.
+        target_fps (float, optional): Maximum pose inference rate. Defaults to None (every new camera frame).
+        reference_assets (ReferenceAssetCache, optional): Decoded reference images shared with the GUI. Defaults to None.
+        game_clock (GameClock, optional): Clock of the round, the combo timeout is measured in its game time.
+            Defaults to None (a new clock started now).
+        hold_ms (float, optional): Time the live pose must keep matching the reference pose to score. Defaults to 300.
         """
         self.game_running = True
         self.pm = PlayerManager.get_instance()
         self.reference_images = reference_images
-        self.camera_feed = camera_feed
+        self.vision_service = vision_service
+        self.camera_feed = vision_service.camera_feed
         self.on_score_update = on_score_update
         self.on_combo_update = on_combo_update
         self.pose_id = 0
         self.combo_timeout = 5000
-        self.last_match_time = 0
+        if game_clock is None:
+            game_clock = GameClock()
+            game_clock.start()
+        self.game_clock = game_clock
+        self.last_match_time = -self.combo_timeout  # Game time of the last match (ms)
         self.max_combo = 10
         self.score_multiplier = 1  # Adjust this value to control score multiplier
+        self.reported_multiplier = 1  # Last score multiplier passed to on_combo_update
+        self.target_fps = target_fps
+        self.frame_wait_timeout = 0.1  # Seconds to wait for a camera frame before re-checking game state
+        self.last_frame_seq = 0  # Sequence number of the last camera frame processed
         # self.reference_pose_img = None
         self.reference_pose = []
         # self.live_pose_img = None
         self.live_pose = []
+        self.thread = None
+
+        # Pose detectors are kept warm by the vision service, reference landmarks are loaded once per app run
+        self.live_pose_estimator = vision_service.live_pose_estimator
+        self.complexity_tuner = vision_service.complexity_tuner
+        self.pose_matcher = vision_service.get_pose_matcher(self.reference_images, reference_assets)
 
-        # Load initial reference image and pose detector
-        self.current_reference_image = cv2.imread(self.reference_images[self.pose_id])
-        self.live_pose_detector = PoseDetector()
-        self.static_pose_detector = PoseDetector(static_image_mode=True)
+        # Smooth landmark jitter and require matches to hold, so a single lucky frame does not score
+        self.landmark_filter = OneEuroFilter()
+        self.hold_confirmation = HoldConfirmation(hold_ms)
 
     def compare_poses(self):
         """
         Compare the pose from the camera feed with the reference pose.
         Display the reference pose and live pose with landmarks drawn.
         """
-        self.reference_pose_img, self.reference_pose = self.get_current_reference_pose()
+        self.reference_pose = self.get_current_reference_pose()
+        frame_interval = 1 / self.target_fps if self.target_fps else 0
+        next_inference_time = time.monotonic()
+
+        # Wait for the previous round to finish its last frame, then own the live detector until the end
+        self.vision_service.attach()
+        try:
+            self.run_loop(frame_interval, next_inference_time)
+        finally:
+            self.vision_service.detach()
+
+    def run_loop(self, frame_interval, next_inference_time):
+        """
+        Process camera frames until the game ends.
 
+        Parameters:
+        frame_interval (float): Minimum time between inferences in seconds.
+        next_inference_time (float): time.monotonic() time of the first inference.
+        """
         while self.game_running:
-            img = self.camera_feed.get_frame()
-            self.live_pose_img, self.live_pose = self.live_pose_detector.get_pose_img_and_landmarks(img)
-
-            # Display both images side by side
-            # cv2.imshow('Live Pose', self.live_pose_img)
-            # cv2.imshow('Ref Pose', self.reference_pose_img)
-
-            # Compare poses
-            if len(self.live_pose) != 0 and len(self.reference_pose) != 0:
-                match = self.live_pose_detector.compare_pose(self.reference_pose, self.live_pose)
-                if match:
-                    self.last_match_time = current_time_ms()  # Reset combo timer
-                    self.update_score()
-
-                    # Load a new reference image when a pose is successfully matched
-                    self.next_photo()
+            # Throttle inference to the target rate
+            delay = next_inference_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+            # Block until the camera produced a frame that has not been processed yet
+            img, seq, timestamp = self.camera_feed.wait_for_frame(self.last_frame_seq, self.frame_wait_timeout)
+            if img is not None:
+                self.last_frame_seq = seq
+                next_inference_time = max(next_inference_time + frame_interval, time.monotonic())
+                start = time.perf_counter()
+                self.process_frame(img, timestamp * 1000)
+                if self.complexity_tuner is not None:
+                    self.complexity_tuner.record((time.perf_counter() - start) * 1000)
 
             # Break the loop if 'q' is pressed
             # if cv2.waitKey(1) & 0xFF == ord('q'):
             #     self.game_running = False
             
             # Reset score multiplier if combo breaks
-            if current_time_ms() - self.last_match_time >= self.combo_timeout:
-                self.update_combo()
-                self.on_combo_update(self.score_multiplier)
+            self.expire_combo()
 
         # cv2.destroyAllWindows()
 
+    def process_frame(self, img, timestamp_ms=None):
+        """
+        Detect the live pose in a camera frame and score it against the current reference pose.
+
+        Parameters:
+        img (numpy.ndarray): Camera frame in BGR format.
+        timestamp_ms (float, optional): Capture time of the frame in milliseconds. Defaults to now.
+        """
+        if timestamp_ms is None:
+            timestamp_ms = time.monotonic() * 1000
+
+        # One color conversion and inference per frame, landmarks missing in this frame are carried over
+        # from recent frames
+        self.live_pose = self.live_pose_estimator.update(img, timestamp_ms, draw=True)
+        self.live_pose_img = self.live_pose_estimator.annotated_img
+
+        # Show the skeleton overlay on the video label at no extra inference cost
+        if self.live_pose_img is not None:
+            self.camera_feed.show_annotated_frame(self.live_pose_img)
+
+        # Display both images side by side
+        # cv2.imshow('Live Pose', self.live_pose_img)
+        # cv2.imshow('Ref Pose', self.reference_pose_img)
+
+        # Compare poses
+        if len(self.live_pose) != 0 and len(self.reference_pose) != 0:
+            # Smooth the live landmarks in place, then check the match; reference angles are precomputed
+            self.landmark_filter.filter(self.live_pose.data[:, :2], timestamp_ms)
+            match = self.pose_matcher.is_match(self.live_pose, self.pose_id)
+            if self.hold_confirmation.update(match, timestamp_ms):
+                self.last_match_time = self.game_clock.elapsed_ms()  # Reset combo timer
+
+                # Load a new reference image when a pose is successfully matched, before the UI is told to show it
+                self.next_photo()
+                self.update_score()
+
     def next_photo(self):
         self.pose_id = (self.pose_id + 1) % len(self.reference_images)
-        self.current_reference_image = cv2.imread(self.reference_images[self.pose_id])
-        _, self.reference_pose = self.get_current_reference_pose()
+        self.reference_pose = self.get_current_reference_pose()
+        self.hold_confirmation.reset()  # The new pose must be held from scratch
 
     def get_current_reference_pose(self):
-        return self.static_pose_detector.get_pose_img_and_landmarks(self.current_reference_image)
-        
+        return self.vision_service.get_reference_pose(self.reference_images[self.pose_id])
 
     def update_score(self):
         """
         Update player score based on the current multiplier and combo status.
         """
         self.update_combo()
-        self.on_combo_update(self.score_multiplier)
+        self.notify_combo()
 
         gain = 1 * self.score_multiplier
         new_score = self.pm.get_player_score() + gain
         self.pm.set_player_score(new_score)
         self.on_score_update()  # Callback to update score text in the UI
 
+    def notify_combo(self):
+        """Pass the score multiplier to on_combo_update, only if it changed since it was last passed."""
+        if self.score_multiplier != self.reported_multiplier:
+            self.reported_multiplier = self.score_multiplier
+            self.on_combo_update(self.score_multiplier)
+
     def start_game(self):
         """
         Start the game logic in a separate thread.
         """
-        threading.Thread(target=self.compare_poses, daemon=True).start()
+        self.thread = threading.Thread(target=self.compare_poses, daemon=True)
+        self.thread.start()
     
     def is_combo(self):
         """
         Check if the player has made a consecutive match within the given timeout.
         """
-        current_time = current_time_ms()
+        current_time = self.game_clock.elapsed_ms()
         if current_time - self.last_match_time < self.combo_timeout:
             return True
         else:
             self.last_match_time = current_time
             return False
 
+    def expire_combo(self):
+        """Reset the score multiplier once combo_timeout of game time has passed since the last match."""
+        if self.game_clock.elapsed_ms() - self.last_match_time >= self.combo_timeout:
+            self.update_combo()
+            self.notify_combo()
+
     def update_combo(self):
         if self.is_combo():
             self.score_multiplier += 1
@@ -119,8 +199,11 @@ class GameLogic:
         else:
             self.score_multiplier = 1  # Reset multiplier if no consecutive match
 
-    def end_game(self):
+    def close(self):
         """
-        Logic for ending the game and decreasing chances after the session ends.
+        End the game and detach from the vision service.
+
+        The game loop detaches as soon as its current frame is done, so this never blocks the caller on an
+        inference. The camera and the pose graphs stay loaded for the next round.
         """
         self.game_running = False
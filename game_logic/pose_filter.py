@@ -0,0 +1,119 @@
+import math
+import numpy as np
+from game_logic.pose_landmarks import NUM_LANDMARKS
+
+
+class OneEuroFilter:
+    def __init__(self, shape=(NUM_LANDMARKS, 2), min_cutoff=1.5, beta=0.01, d_cutoff=1.0, reset_after_ms=300):
+        """
+        One-Euro low-pass filter over a stream of landmark arrays.
+
+        Every coordinate is smoothed with a cutoff frequency that rises with its speed: jitter on a held pose
+        is filtered strongly while fast movements keep up with little lag. All state lives in arrays allocated
+        here and every frame is filtered in place, so filtering costs O(1) per frame with no allocation.
+
+        Parameters:
+        shape (tuple, optional): Shape of the filtered arrays. Defaults to (NUM_LANDMARKS, 2) for pixel x, y.
+        min_cutoff (float, optional): Cutoff frequency in Hz for still landmarks. Lower smooths more. Defaults to 1.5.
+        beta (float, optional): Increase of the cutoff per pixel/s of speed. Higher lags less. Defaults to 0.01.
+        d_cutoff (float, optional): Cutoff frequency in Hz of the speed estimate. Defaults to 1.0.
+        reset_after_ms (float, optional): Gap between frames after which the filter restarts from the new
+            frame instead of smoothing towards it. Defaults to 300.
+        """
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset_after_ms = reset_after_ms
+
+        self.value = np.zeros(shape, dtype=np.float32)  # Filtered values of the last frame
+        self.speed = np.zeros(shape, dtype=np.float32)  # Filtered speed of the last frame, per second
+        self.alpha = np.zeros(shape, dtype=np.float32)  # Per-coordinate smoothing factor
+        self.scratch = np.zeros(shape, dtype=np.float32)
+        self.last_time_ms = None
+
+    def reset(self):
+        """Restart from the next frame."""
+        self.last_time_ms = None
+
+    def filter(self, values, timestamp_ms):
+        """
+        Smooth a new frame in place.
+
+        Parameters:
+        values (numpy.ndarray): Array of the filter's shape, replaced by its filtered values.
+        timestamp_ms (float): Time of the frame in milliseconds.
+
+        Returns:
+        numpy.ndarray: values, filtered.
+        """
+        dt_ms = None if self.last_time_ms is None else timestamp_ms - self.last_time_ms
+        self.last_time_ms = timestamp_ms
+        if dt_ms is None or dt_ms <= 0 or dt_ms > self.reset_after_ms:
+            np.copyto(self.value, values)
+            self.speed.fill(0)
+            return values
+        dt = dt_ms / 1000
+
+        # Smooth the speed with a fixed cutoff: speed += a_d * ((values - value) / dt - speed)
+        ratio = 2 * math.pi * self.d_cutoff * dt
+        np.subtract(values, self.value, out=self.scratch)
+        self.scratch /= dt
+        self.scratch -= self.speed
+        self.scratch *= ratio / (1 + ratio)
+        self.speed += self.scratch
+
+        # Smoothing factor from a speed-dependent cutoff: alpha = r / (1 + r), r = 2 * pi * cutoff * dt
+        np.abs(self.speed, out=self.alpha)
+        self.alpha *= self.beta
+        self.alpha += self.min_cutoff
+        self.alpha *= 2 * math.pi * dt
+        np.add(self.alpha, 1, out=self.scratch)
+        self.alpha /= self.scratch
+
+        # value += alpha * (values - value)
+        np.subtract(values, self.value, out=self.scratch)
+        self.scratch *= self.alpha
+        self.value += self.scratch
+        np.copyto(values, self.value)
+        return values
+
+
+class HoldConfirmation:
+    def __init__(self, hold_ms=300, grace_ms=100):
+        """
+        Confirms a match only once it has held for hold_ms.
+
+        Frames that do not match break the hold only if no match is seen again within grace_ms, so a single
+        dropped or jittery frame does not restart it.
+
+        Parameters:
+        hold_ms (float, optional): Time a match must hold to be confirmed, in milliseconds. Defaults to 300.
+        grace_ms (float, optional): Longest gap between matching frames that keeps the hold. Defaults to 100.
+        """
+        self.hold_ms = hold_ms
+        self.grace_ms = grace_ms
+        self.hold_start_ms = None  # Time of the first matching frame of the current hold
+        self.last_match_ms = None
+
+    def reset(self):
+        """Forget the current hold, e.g. when the reference pose changes."""
+        self.hold_start_ms = None
+        self.last_match_ms = None
+
+    def update(self, match, timestamp_ms):
+        """
+        Records whether a frame matched.
+
+        Parameters:
+        match (bool): Whether the frame matched.
+        timestamp_ms (float): Time of the frame in milliseconds.
+
+        Returns:
+        bool: True if the match has held for hold_ms, False otherwise.
+        """
+        if not match:
+            return False
+        if self.hold_start_ms is None or timestamp_ms - self.last_match_ms > self.grace_ms:
+            self.hold_start_ms = timestamp_ms
+        self.last_match_ms = timestamp_ms
+        return timestamp_ms - self.hold_start_ms >= self.hold_ms
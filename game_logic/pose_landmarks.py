@@ -0,0 +1,119 @@
+import numpy as np
+
+NUM_LANDMARKS = 33  # Number of landmarks in a MediaPipe pose
+REQUIRED_LANDMARKS = [11, 12, 13, 14, 15, 16, 19, 20, 23, 24]  # Landmarks required for a complete pose
+
+# Joint angles compared between poses, as (p1, p2, p3) landmark IDs with p2 as the vertex
+ANGLES_TO_COMPARE = [
+    (11, 13, 15),  # Left elbow
+    (12, 14, 16),  # Right elbow
+    (13, 11, 23),  # Left shoulder-hip
+    (14, 12, 24),  # Right shoulder-hip
+    (11, 12, 24),  # Shoulder-torso
+    (12, 11, 23),  # Shoulder-torso reverse
+]
+ANGLE_TRIPLES = np.array(ANGLES_TO_COMPARE, dtype=np.intp)
+
+
+def calculate_angles(xy, triples=ANGLE_TRIPLES):
+    """
+    Calculates joint angles for one or many poses in a single vectorized call.
+
+    Parameters:
+    xy (numpy.ndarray): Landmark pixel coordinates of shape (..., 33, 2).
+    triples (numpy.ndarray, optional): Array of (p1, p2, p3) landmark IDs of shape (k, 3). Defaults to ANGLE_TRIPLES.
+
+    Returns:
+    numpy.ndarray: Angles in degrees in [0, 360) of shape (..., k).
+    """
+    p1 = xy[..., triples[:, 0], :]
+    p2 = xy[..., triples[:, 1], :]
+    p3 = xy[..., triples[:, 2], :]
+    v1 = p1 - p2
+    v3 = p3 - p2
+    angles = np.degrees(np.arctan2(v3[..., 1], v3[..., 0]) - np.arctan2(v1[..., 1], v1[..., 0]))
+    return np.mod(angles, 360)
+
+
+class PoseLandmarks:
+    __slots__ = ('data', 'present')
+
+    def __init__(self, data=None, present=None):
+        """
+        Compact landmark set of one pose.
+
+        Parameters:
+        data (numpy.ndarray, optional): Array of shape (33, 4) holding (x, y, z, visibility) per landmark,
+            with x, y and z in pixels. Defaults to all zeros.
+        present (numpy.ndarray, optional): Boolean mask of shape (33,) of detected landmarks. Defaults to none present.
+        """
+        self.data = np.zeros((NUM_LANDMARKS, 4), dtype=np.float32) if data is None else np.asarray(data, dtype=np.float32)
+        self.present = np.zeros(NUM_LANDMARKS, dtype=bool) if present is None else np.asarray(present, dtype=bool)
+
+    @classmethod
+    def from_mediapipe(cls, pose_landmarks, width, height):
+        """
+        Build the landmark set from a MediaPipe result.
+
+        Parameters:
+        pose_landmarks (NormalizedLandmarkList): results.pose_landmarks of a MediaPipe Pose process() call.
+        width (int): Width of the processed image in pixels.
+        height (int): Height of the processed image in pixels.
+
+        Returns:
+        PoseLandmarks: Landmarks in pixel coordinates, all marked present.
+        """
+        values = (value for lm in pose_landmarks.landmark for value in (lm.x, lm.y, lm.z, lm.visibility))
+        data = np.fromiter(values, dtype=np.float32, count=NUM_LANDMARKS * 4).reshape(NUM_LANDMARKS, 4)
+        data[:, :3] *= (width, height, width)  # MediaPipe scales z like x
+        return cls(data, np.ones(NUM_LANDMARKS, dtype=bool))
+
+    @classmethod
+    def from_dict(cls, values):
+        """Rebuild a landmark set serialized with to_dict()."""
+        if not values:
+            return cls()
+        return cls(values['data'], values['present'])
+
+    def to_dict(self):
+        """Serialize the landmark set to a JSON-compatible dictionary."""
+        return {'data': self.data.tolist(), 'present': self.present.tolist()}
+
+    def __len__(self):
+        """Return the number of detected landmarks."""
+        return int(np.count_nonzero(self.present))
+
+    @property
+    def xy(self):
+        """Pixel coordinates of shape (33, 2)."""
+        return self.data[:, :2]
+
+    @property
+    def visibility(self):
+        """Visibility of shape (33,)."""
+        return self.data[:, 3]
+
+    def angles(self, triples=ANGLE_TRIPLES):
+        """
+        Calculates the given joint angles of the pose.
+
+        Parameters:
+        triples (numpy.ndarray, optional): Array of (p1, p2, p3) landmark IDs of shape (k, 3). Defaults to ANGLE_TRIPLES.
+
+        Returns:
+        numpy.ndarray: Angles in degrees of shape (k,).
+        """
+        return calculate_angles(self.xy, triples)
+
+    def is_complete(self, required_landmarks):
+        """
+        Check if all required landmarks are detected.
+
+        Parameters:
+        required_landmarks (list): List of landmark indices required for a complete pose.
+
+        Returns:
+        tuple: (n_fulfilled, is_complete) - Number of required landmarks present and whether all are present.
+        """
+        n_fulfilled = int(np.count_nonzero(self.present[required_landmarks]))
+        return n_fulfilled, n_fulfilled == len(required_landmarks)
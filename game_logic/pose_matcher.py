@@ -0,0 +1,106 @@
+import numpy as np
+from game_logic.pose_landmarks import ANGLE_TRIPLES, calculate_angles
+
+
+def angle_deltas(angles1, angles2):
+    """
+    Calculates the absolute difference between angles, the short way around the circle.
+
+    Parameters:
+    angles1, angles2 (numpy.ndarray): Angles in degrees, broadcastable against each other.
+
+    Returns:
+    numpy.ndarray: Differences in degrees in [0, 180], so that 359 and 1 are 2 apart.
+    """
+    deltas = np.abs(angles1 - angles2) % 360
+    return np.minimum(deltas, 360 - deltas)
+
+
+class PoseMatcher:
+    def __init__(self, reference_poses, threshold=23, triples=ANGLE_TRIPLES):
+        """
+        Scores live poses against a whole library of reference poses at once.
+
+        The joint angles of all reference poses are computed once and stacked into a matrix, so scoring
+        a live pose against every reference is a single broadcasted NumPy operation.
+
+        Parameters:
+        reference_poses (list): List of PoseLandmarks. Empty entries (no complete pose) never match.
+        threshold (int, optional): Maximum angle difference allowed for a match. Defaults to 23.
+        triples (numpy.ndarray, optional): Array of (p1, p2, p3) landmark IDs of shape (k, 3). Defaults to ANGLE_TRIPLES.
+        """
+        self.threshold = threshold
+        self.triples = triples
+        self.valid = np.array([len(pose) != 0 for pose in reference_poses], dtype=bool)
+
+        xy = np.stack([pose.xy for pose in reference_poses]) if reference_poses else np.zeros((0, 33, 2), np.float32)
+        self.reference_angles = calculate_angles(xy, triples)  # Shape (N, k)
+        self.reference_angles[~self.valid] = np.nan
+
+    def __len__(self):
+        """Return the number of reference poses."""
+        return len(self.valid)
+
+    def score(self, live_pose):
+        """
+        Scores a live pose against every reference pose.
+
+        Parameters:
+        live_pose (PoseLandmarks): Landmarks of the live pose.
+
+        Returns:
+        tuple: (deltas, similarity) - Per-joint angle differences in degrees in [0, 180] of shape (N, k)
+               (NaN for references without a pose) and an overall similarity in [0, 1] of shape (N,).
+        """
+        deltas = angle_deltas(self.reference_angles, live_pose.angles(self.triples))
+        similarity = np.clip(1 - deltas.mean(axis=1) / 180, 0, 1)
+        return deltas, np.nan_to_num(similarity, nan=0.0)
+
+    def matches(self, live_pose):
+        """
+        Checks a live pose against every reference pose.
+
+        Parameters:
+        live_pose (PoseLandmarks): Landmarks of the live pose.
+
+        Returns:
+        numpy.ndarray: Boolean mask of shape (N,) of the reference poses matched within the threshold.
+        """
+        deltas, _ = self.score(live_pose)
+        with np.errstate(invalid='ignore'):
+            return np.all(deltas <= self.threshold, axis=1)
+
+    def is_match(self, live_pose, index):
+        """
+        Checks a live pose against a single reference pose using its precomputed angles.
+
+        Parameters:
+        live_pose (PoseLandmarks): Landmarks of the live pose.
+        index (int): Index of the reference pose.
+
+        Returns:
+        bool: True if the poses match within the threshold, False otherwise.
+        """
+        if not self.valid[index]:
+            return False
+        deltas = angle_deltas(self.reference_angles[index], live_pose.angles(self.triples))
+        return bool(np.all(deltas <= self.threshold))
+
+    def best_match(self, live_pose):
+        """
+        Finds the most similar reference pose that the live pose matches.
+
+        Parameters:
+        live_pose (PoseLandmarks): Landmarks of the live pose.
+
+        Returns:
+        tuple: (index, similarity) - Index of the best matching reference pose and its similarity,
+               or (-1, 0.0) if no reference pose matches.
+        """
+        deltas, similarity = self.score(live_pose)
+        with np.errstate(invalid='ignore'):
+            matched = np.all(deltas <= self.threshold, axis=1)
+        if not matched.any():
+            return -1, 0.0
+        index = int(np.argmax(np.where(matched, similarity, -1)))
+        return index, float(similarity[index])
@@ -0,0 +1,92 @@
+from bisect import bisect_left, insort
+
+
+class RankedIndex:
+    def __init__(self):
+        """
+        Leaderboard kept sorted by score, with the position of every player found by binary search.
+
+        Entries are (-score, seq, key) tuples in a sorted list, so the best score comes first. seq is bumped
+        whenever a player's score changes, which orders equal scores the same way as re-sorting the whole
+        leaderboard with a stable sort: a player who reaches a score is placed after those who already had it.
+        A dictionary maps every player to its entry, so finding a player is a bisect instead of a scan.
+
+        Rank and score lookups take O(log n). Updates take O(log n) comparisons plus one list insert and
+        delete, which move pointers with memmove and stay in the microseconds at 100k players.
+        """
+        self.entries = []  # Sorted list of (-score, seq, key)
+        self.positions = {}  # Dictionary to store key: entry in self.entries
+        self.seq = 0
+
+    def __len__(self):
+        """Return the number of players on the leaderboard."""
+        return len(self.entries)
+
+    def __contains__(self, key):
+        """Return True if the player is on the leaderboard."""
+        return key in self.positions
+
+    def update(self, key, score):
+        """
+        Put a player on the leaderboard, keeping their highest score.
+
+        Parameters:
+        key (tuple): The player's (name, cluster).
+        score (int): The new score of the player.
+
+        Returns:
+        bool: True if the player was added or their score went up, False otherwise.
+        """
+        entry = self.positions.get(key)
+        if entry is not None:
+            if score <= -entry[0]:
+                return False
+            del self.entries[bisect_left(self.entries, entry)]
+
+        self.seq += 1
+        entry = (-score, self.seq, key)
+        insort(self.entries, entry)
+        self.positions[key] = entry
+        return True
+
+    def remove(self, key):
+        """Remove a player from the leaderboard, if they are on it."""
+        entry = self.positions.pop(key, None)
+        if entry is not None:
+            del self.entries[bisect_left(self.entries, entry)]
+
+    def get_score(self, key):
+        """Return the leaderboard score of a player, or None if they are not on the leaderboard."""
+        entry = self.positions.get(key)
+        return -entry[0] if entry is not None else None
+
+    def get_rank(self, key):
+        """
+        Return the 1-based rank of a player.
+
+        Parameters:
+        key (tuple): The player's (name, cluster).
+
+        Returns:
+        int: The rank of the player. If the player is not on the leaderboard, return -1.
+        """
+        entry = self.positions.get(key)
+        if entry is None:
+            return -1
+        return bisect_left(self.entries, entry) + 1
+
+    def get_top(self, limit):
+        """
+        Return the best players.
+
+        Parameters:
+        limit (int): Maximum number of players to return.
+
+        Returns:
+        list: List of ((name, cluster), score), sorted by score in descending order.
+        """
+        return [(key, -negative_score) for negative_score, _, key in self.entries[:limit]]
+
+    def items(self):
+        """Return the whole leaderboard as a list of ((name, cluster), score), sorted by score in descending order."""
+        return self.get_top(len(self.entries))
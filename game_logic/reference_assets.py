@@ -0,0 +1,148 @@
+import os
+import queue
+import threading
+from collections import OrderedDict
+import numpy as np
+from PIL import Image
+
+REFERENCE_POSES_DIR = 'assets/reference_poses/'
+REFERENCE_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.webp']
+
+
+def list_reference_images(directory=REFERENCE_POSES_DIR):
+    """
+    List the reference images of the game, in play order.
+
+    The vision service memoizes reference poses by this list, so the warm-up thread and the game screen
+    must both build it with this function.
+
+    Parameters:
+    directory (str, optional): Directory of the reference images. Defaults to REFERENCE_POSES_DIR.
+
+    Returns:
+    list: List of paths to reference images.
+    """
+    return [os.path.join(directory, file) for file in os.listdir(directory)
+            if os.path.splitext(file)[1].lower() in REFERENCE_EXTENSIONS]
+
+
+class ReferenceAsset:
+    __slots__ = ('rgb', 'display', 'photo', 'bgr_copy')
+
+    def __init__(self, rgb, display):
+        """
+        Decoded reference image. The GUI displays it and the reference pose cache detects landmarks from it
+        when an image has no cached entry yet, so such an image is decoded only once.
+
+        Parameters:
+        rgb (numpy.ndarray): Full-size image in RGB format. Must not be modified.
+        display (PIL.Image.Image): Image resized for display.
+        """
+        self.rgb = rgb
+        self.display = display
+        self.photo = None  # ImageTk.PhotoImage of display, created lazily on the Tk thread
+        self.bgr_copy = None  # Contiguous BGR copy of rgb, created lazily
+
+    @property
+    def bgr(self):
+        """Full-size image in BGR format, as a contiguous array OpenCV can use. Must not be modified."""
+        if self.bgr_copy is None:
+            self.bgr_copy = np.ascontiguousarray(self.rgb[..., ::-1])
+        return self.bgr_copy
+
+
+class ReferenceAssetCache:
+    def __init__(self, reference_images, display_size=(700, 525), capacity=8, prefetch_count=2):
+        """
+        Decodes and resizes reference images once and keeps the most recently used ones in memory.
+
+        Upcoming references are decoded on a background thread, so switching to the next pose only has to
+        look up an already decoded image.
+
+        Parameters:
+        reference_images (list): List of paths to reference images, in play order.
+        display_size (tuple, optional): Size the images are resized to for display. Defaults to (700, 525).
+        capacity (int, optional): Maximum number of decoded images kept in memory. Defaults to 8.
+        prefetch_count (int, optional): Number of upcoming images decoded ahead of time. Defaults to 2.
+        """
+        self.reference_images = reference_images
+        self.display_size = display_size
+        self.capacity = max(capacity, prefetch_count + 1)  # Prefetched images must not evict the current one
+        self.prefetch_count = prefetch_count
+        self.assets = OrderedDict()  # Dictionary to store path: ReferenceAsset, least recently used first
+        self.lock = threading.Lock()
+        self.prefetch_queue = queue.Queue()
+        threading.Thread(target=self.prefetch_loop, daemon=True).start()
+
+    def load(self, path):
+        """
+        Decodes and resizes one reference image.
+
+        Parameters:
+        path (str): Path of the reference image.
+
+        Returns:
+        ReferenceAsset: The decoded image.
+        """
+        with Image.open(path) as image:
+            image = image.convert('RGB')
+        display = image.resize(self.display_size, resample=Image.BICUBIC)
+        return ReferenceAsset(np.asarray(image), display)
+
+    def get(self, path):
+        """
+        Returns the decoded reference image, decoding it now if it was not cached or prefetched.
+
+        Parameters:
+        path (str): Path of the reference image.
+
+        Returns:
+        ReferenceAsset: The decoded image.
+        """
+        with self.lock:
+            asset = self.assets.get(path)
+            if asset is not None:
+                self.assets.move_to_end(path)
+                return asset
+
+        asset = self.load(path)
+        self.put(path, asset)
+        return asset
+
+    def put(self, path, asset):
+        """Stores a decoded image as the most recently used one, evicting the least recently used ones."""
+        with self.lock:
+            self.assets[path] = asset
+            self.assets.move_to_end(path)
+            while len(self.assets) > self.capacity:
+                self.assets.popitem(last=False)
+
+    def prefetch(self, index):
+        """
+        Schedules the images following the given reference index to be decoded in the background.
+
+        Parameters:
+        index (int): Index of the current reference image.
+        """
+        for offset in range(1, self.prefetch_count + 1):
+            self.prefetch_queue.put(self.reference_images[(index + offset) % len(self.reference_images)])
+
+    def prefetch_loop(self):
+        """Decodes scheduled images on the background thread until close() is called."""
+        while True:
+            path = self.prefetch_queue.get()
+            if path is None:
+                return
+            with self.lock:
+                cached = path in self.assets
+            if not cached:
+                try:
+                    self.put(path, self.load(path))
+                except OSError:
+                    pass  # get() will report the error if the image is actually needed
+
+    def close(self):
+        """Stops the prefetch thread and releases the cached images."""
+        self.prefetch_queue.put(None)
+        with self.lock:
+            self.assets.clear()
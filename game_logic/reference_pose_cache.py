@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import cv2
+import numpy as np
+from game_logic.pose_landmarks import PoseLandmarks
+
+CACHE_VERSION = 2
+
+
+class ReferencePoseCache:
+    def __init__(self, pose_detector, cache_path='assets/reference_pose_cache.json'):
+        """
+        Initialize the on-disk landmark index for reference poses.
+
+        Every entry is keyed by the content hash of the reference image plus a fingerprint of the
+        detector settings, so an entry is rebuilt automatically whenever an image changes or the
+        static detector is configured differently.
+
+        Parameters:
+        pose_detector (PoseDetector): Static-image detector used to build missing entries.
+        cache_path (str, optional): Path of the JSON index file. Defaults to 'assets/reference_pose_cache.json'.
+        """
+        self.pose_detector = pose_detector
+        self.cache_path = cache_path
+        self.settings_key = self.get_settings_key(pose_detector.settings)
+        self.entries = {}  # Dictionary to store "<content hash>:<settings key>": serialized landmarks (or None)
+        self.landmarks_by_path = {}  # Dictionary to store image path: PoseLandmarks
+
+    @staticmethod
+    def get_settings_key(settings):
+        """Return a short fingerprint of the detector settings."""
+        encoded = json.dumps(settings, sort_keys=True).encode()
+        return hashlib.sha1(encoded).hexdigest()[:12]
+
+    @staticmethod
+    def get_key(data, settings_key):
+        """Return the index key of an image given its file content and the detector settings key."""
+        return f"{hashlib.sha1(data).hexdigest()}:{settings_key}"
+
+    def load(self, reference_images, reference_assets=None):
+        """
+        Load the index from disk and make sure every reference image has an up-to-date entry.
+
+        Parameters:
+        reference_images (list): List of paths to reference images.
+        reference_assets (ReferenceAssetCache, optional): Decoded images to detect missing entries from.
+            Defaults to None (decode from the file).
+
+        Returns:
+        None
+        """
+        self.read_index()
+        self.update(reference_images, reference_assets)
+
+    def update(self, reference_images, reference_assets=None):
+        """
+        Make sure every reference image has an up-to-date entry in the loaded index.
+
+        Images that are new or whose content changed since the index was written are run through the
+        static detector once. The index is written back only if it changed.
+
+        Parameters:
+        reference_images (list): List of paths to reference images.
+        reference_assets (ReferenceAssetCache, optional): Decoded images to detect missing entries from.
+            Defaults to None (decode from the file).
+
+        Returns:
+        None
+        """
+        used_keys = set()
+        changed = False
+        for path in reference_images:
+            with open(path, 'rb') as file:
+                data = file.read()
+            key = self.get_key(data, self.settings_key)
+            used_keys.add(key)
+
+            if key not in self.entries:
+                if reference_assets is not None:
+                    img = reference_assets.get(path).bgr
+                else:
+                    img = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+                self.entries[key] = self.detect(img)
+                changed = True
+
+            self.landmarks_by_path[path] = PoseLandmarks.from_dict(self.entries[key])
+
+        # Drop entries of images that were removed or replaced
+        if used_keys != set(self.entries):
+            self.entries = {key: value for key, value in self.entries.items() if key in used_keys}
+            changed = True
+
+        if changed:
+            self.write_index()
+
+    def detect(self, img):
+        """
+        Run the static detector on a reference image.
+
+        Parameters:
+        img (numpy.ndarray): Reference image in BGR format.
+
+        Returns:
+        dict: The serialized PoseLandmarks, or None if the pose is incomplete.
+        """
+        try:
+            return self.pose_detector.get_complete_pose_landmarks(img).to_dict()
+        except Exception:
+            return None
+
+    def get(self, path):
+        """
+        Return the cached landmarks of a reference image.
+
+        Parameters:
+        path (str): Path of a reference image passed to load().
+
+        Returns:
+        PoseLandmarks: The landmarks of the reference pose, empty if no complete pose was found.
+        """
+        landmarks = self.landmarks_by_path.get(path)
+        return landmarks if landmarks is not None else PoseLandmarks()
+
+    def read_index(self):
+        """Read the index file, starting from an empty index if it is missing or unreadable."""
+        try:
+            with open(self.cache_path, 'r') as file:
+                data = json.load(file)
+        except (FileNotFoundError, ValueError):
+            data = {}
+
+        if data.get('version') == CACHE_VERSION:
+            self.entries = data.get('entries', {})
+        else:
+            self.entries = {}
+
+    def write_index(self):
+        """Write the index file atomically so an interrupted write never leaves a corrupt cache."""
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump({'version': CACHE_VERSION, 'entries': self.entries}, file)
+        os.replace(tmp_path, self.cache_path)
@@ -0,0 +1,279 @@
+import os
+import sqlite3
+import threading
+from game_logic.leaderboard_store import LEADERBOARD_PATH
+from game_logic.player_manager import PlayerManager
+from game_logic.ranked_index import RankedIndex
+
+# The database lives next to leaderboard.json
+DATABASE_PATH = os.path.splitext(LEADERBOARD_PATH)[0] + '.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    name TEXT NOT NULL,
+    cluster TEXT NOT NULL,
+    score INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL,
+    best_score INTEGER,  -- Score on the leaderboard, NULL if the player has not finished a game yet
+    seq INTEGER,  -- Order among equal leaderboard scores: bumped whenever best_score changes
+    PRIMARY KEY (name, cluster)
+);
+CREATE INDEX IF NOT EXISTS players_leaderboard ON players (best_score DESC, seq) WHERE best_score IS NOT NULL;
+CREATE INDEX IF NOT EXISTS players_cluster_leaderboard ON players (cluster, best_score DESC, seq) WHERE best_score IS NOT NULL;
+CREATE TABLE IF NOT EXISTS clusters (
+    cluster TEXT PRIMARY KEY,
+    total INTEGER NOT NULL,  -- Sum of the leaderboard scores of the cluster's players
+    count INTEGER NOT NULL  -- Number of the cluster's players on the leaderboard
+);
+"""
+
+
+class SqlitePlayerManager(PlayerManager):
+    def __init__(self, path=DATABASE_PATH):
+        """
+        PlayerManager keeping players and the leaderboard in an SQLite database instead of in memory.
+
+        (name, cluster) lookups use the primary key and top-N queries read the first rows of an index on the
+        leaderboard score. Ranks are served by in-memory RankedIndex mirrors of the global and cluster
+        leaderboards, filled from the database on load, since an SQL rank needs COUNT(*) over every player
+        ahead, which is O(rank). Every leaderboard update runs in its own transaction. On first use the
+        database is filled from leaderboard.json and its journal.
+
+        Scores set during a game are kept in memory and written in one transaction when the game ends
+        (update_leaderboard()), when the current player changes or on save_leaderboard(), so the game thread
+        never waits for a commit.
+
+        Leaderboard ties are ordered like the JSON backend's stable sort: a player whose score goes up is
+        placed after the players who already had that score.
+
+        Parameters:
+        path (str, optional): Path of the database. Defaults to DATABASE_PATH.
+        """
+        self.path = path
+        self.lock = threading.Lock()  # Scores are updated from the game thread, everything else from the Tk thread
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        self.pending_scores = {}  # Dictionary to store (name, cluster): score set since the last flush
+        super().__init__()
+
+    def load_leaderboard(self):
+        """Migrate leaderboard.json into the database if the database is still empty."""
+        with self.lock:
+            n_players = self.conn.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+        if n_players == 0 and (os.path.exists(self.store.path) or os.path.exists(self.store.journal_path)):
+            super().load_leaderboard()
+            self.migrate(self.players, self.leaderboard.items())
+        self.players = {}  # Not used, the database is the only copy
+        self.leaderboard = RankedIndex()
+        self.cluster_leaderboards = {}
+        self.cluster_totals = {}
+
+        with self.lock, self.conn:
+            if self.conn.execute("SELECT COUNT(*) FROM clusters").fetchone()[0] == 0:
+                # Databases created before cluster totals were kept, fill them once
+                self.conn.execute("INSERT INTO clusters (cluster, total, count) SELECT cluster, SUM(best_score), COUNT(*) "
+                                  "FROM players WHERE best_score IS NOT NULL GROUP BY cluster")
+            self.seq = self.conn.execute("SELECT COALESCE(MAX(seq), 0) FROM players").fetchone()[0]
+            rows = self.conn.execute("SELECT name, cluster, best_score FROM players WHERE best_score IS NOT NULL "
+                                     "ORDER BY seq").fetchall()
+        for name, cluster, best_score in rows:
+            self.index_score((name, cluster), best_score)  # In seq order, so ties keep their order
+
+    def index_score(self, key, score):
+        """Put a leaderboard score on the in-memory rank mirrors. The cluster totals live in the database."""
+        self.leaderboard.update(key, score)
+        self.cluster_leaderboards.setdefault(key[1], RankedIndex()).update(key, score)
+
+    def migrate(self, players, leaderboard):
+        """
+        Insert players and leaderboard entries loaded by the JSON backend.
+
+        Parameters:
+        players (dict): Dictionary of (name, cluster): [score, attempts].
+        leaderboard (list): List of ((name, cluster), score), sorted by score in descending order.
+        """
+        rows = {key: [score, attempts, None, None] for key, (score, attempts) in players.items()}
+        for seq, (key, best_score) in enumerate(leaderboard, start=1):
+            rows.setdefault(key, [0, self.max_attempts, None, None])[2:] = [best_score, seq]
+
+        with self.lock, self.conn:
+            self.conn.executemany("INSERT INTO players (name, cluster, score, attempts, best_score, seq) "
+                                  "VALUES (?, ?, ?, ?, ?, ?)", [(*key, *row) for key, row in rows.items()])
+            self.conn.execute("INSERT INTO clusters (cluster, total, count) SELECT cluster, SUM(best_score), COUNT(*) "
+                              "FROM players WHERE best_score IS NOT NULL GROUP BY cluster")
+
+    def save_leaderboard(self):
+        """Write the scores set since the last flush. Leaderboard updates are committed as they happen."""
+        self.flush_scores()
+
+    def flush_scores(self):
+        """Write the scores set by set_player_score() in one transaction."""
+        with self.lock:
+            if not self.pending_scores:
+                return
+            with self.conn:
+                self.conn.executemany("UPDATE players SET score = MAX(score, ?) WHERE name = ? AND cluster = ?",
+                                      [(score, *key) for key, score in self.pending_scores.items()])
+            self.pending_scores = {}
+
+    def set_current_player(self, name, cluster):
+        """Set the current player, writing the previous player's score first."""
+        self.flush_scores()
+        super().set_current_player(name, cluster)
+
+    def add_player(self, name, cluster):
+        """Add a new player if not exists."""
+        try:
+            with self.lock, self.conn:
+                self.conn.execute("INSERT INTO players (name, cluster, attempts) VALUES (?, ?, ?)",
+                                  (name, cluster, self.max_attempts))
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Player {name} from cluster {cluster} already exists.")
+
+    def get_player(self, name, cluster):
+        """Return the (score, attempts, best_score, seq) row of a player, or None if it does not exist."""
+        with self.lock:
+            return self.conn.execute("SELECT score, attempts, best_score, seq FROM players WHERE name = ? AND cluster = ?",
+                                     (name, cluster)).fetchone()
+
+    def player_exists(self, name, cluster):
+        """Check if a player with the given name and cluster exists."""
+        return self.get_player(name, cluster) is not None
+
+    def get_remaining_attempts(self, name=None, cluster=None):
+        """Return the remaining attempts for a player."""
+        if name is None or cluster is None:
+            # If no parameters are passed, use current player
+            name, cluster = self.get_current_player()
+
+        row = self.get_player(name, cluster)
+        return row[1] if row is not None else 0
+
+    def decrement_player_attempts(self, name, cluster):
+        """Decrement the attempts for a player."""
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE players SET attempts = attempts - 1 WHERE name = ? AND cluster = ?", (name, cluster))
+
+    def update_leaderboard(self, name=None, cluster=None, score=None):
+        """
+        Update the leaderboard with the player's score.
+        If the player is already in the leaderboard, the highest score between the old score and the new score is kept.
+
+        Parameters:
+        name (str, optional): The name of the player. Defaults to None.
+        cluster (str, optional): The cluster of the player. Defaults to None.
+        score (int, optional): The new score of the player. Defaults to None.
+
+        Returns:
+        None
+        """
+        if name is None or cluster is None or score is None:
+            # If no parameters are passed, update the current player
+            name, cluster = self.get_current_player()
+            score = self.get_player_score()
+        self.flush_scores()
+
+        with self.lock, self.conn:
+            row = self.conn.execute("SELECT best_score FROM players WHERE name = ? AND cluster = ?",
+                                    (name, cluster)).fetchone()
+            if row is not None and row[0] is not None and score <= row[0]:
+                return  # Not a new best score
+
+            self.seq += 1
+            if row is None:
+                self.conn.execute("INSERT INTO players (name, cluster, attempts, best_score, seq) VALUES (?, ?, ?, ?, ?)",
+                                  (name, cluster, self.max_attempts, score, self.seq))
+            else:
+                self.conn.execute("UPDATE players SET best_score = ?, seq = ? WHERE name = ? AND cluster = ?",
+                                  (score, self.seq, name, cluster))
+
+            # Keep the cluster totals in the same transaction
+            old_score = row[0] if row is not None else None
+            self.conn.execute("INSERT INTO clusters (cluster, total, count) VALUES (?, ?, 1) "
+                              "ON CONFLICT (cluster) DO UPDATE SET total = total + ?, count = count + ?",
+                              (cluster, score, score - (old_score or 0), int(old_score is None)))
+        self.index_score((name, cluster), score)
+
+    def get_player_score(self):
+        """
+        Retrieve the score of the current player.
+
+        Returns:
+        int: The score of the current player.
+
+        Raises:
+        ValueError: If the current player is not set.
+        """
+        if self.current_player:
+            score = self.get_player(*self.current_player)[0]
+            with self.lock:
+                return max(score, self.pending_scores.get(self.current_player, score))
+        else:
+            raise ValueError("Current player is not set.")
+
+    def set_player_score(self, score):
+        """
+        Update the score of the current player, keeping the maximum of the given score and the current score.
+
+        Called from the game thread on every match, so the score is only kept in memory until flush_scores().
+
+        Parameters:
+        score (int): The score to be set for the current player.
+
+        Raises:
+        ValueError: If the current player is not set.
+        """
+        if self.current_player:
+            with self.lock:
+                key = self.current_player
+                self.pending_scores[key] = max(score, self.pending_scores.get(key, score))
+        else:
+            raise ValueError("Current player is not set.")
+
+    def get_top_players(self, limit=5):
+        """Return the top players from the leaderboard."""
+        with self.lock:
+            rows = self.conn.execute("SELECT name, cluster, best_score FROM players WHERE best_score IS NOT NULL "
+                                     "ORDER BY best_score DESC, seq LIMIT ?", (limit,)).fetchall()
+        return [((name, cluster), score) for name, cluster, score in rows]
+
+    def get_cluster_leaderboard(self, cluster, limit=None):
+        """
+        Retrieve the leaderboard of one cluster.
+
+        Parameters:
+        cluster (str): The cluster.
+        limit (int, optional): Maximum number of players to return. Defaults to None (all players).
+
+        Returns:
+        list: A list of ((name, cluster), score), sorted in descending order based on the score.
+        """
+        with self.lock:
+            rows = self.conn.execute("SELECT name, cluster, best_score FROM players WHERE cluster = ? AND best_score IS NOT NULL "
+                                     "ORDER BY best_score DESC, seq LIMIT ?", (cluster, -1 if limit is None else limit)).fetchall()
+        return [((name, cluster), score) for name, cluster, score in rows]
+
+    def get_cluster_standings(self):
+        """
+        Retrieve the standings of all clusters from the running totals, without scanning the players.
+
+        Returns:
+        list: A list of (cluster, total score, number of ranked players, average score), sorted by total
+              score in descending order.
+        """
+        with self.lock:
+            rows = self.conn.execute("SELECT cluster, total, count FROM clusters WHERE count > 0").fetchall()
+        standings = [(cluster, total, count, total / count) for cluster, total, count in rows]
+        return sorted(standings, key=lambda x: x[1], reverse=True)
+
+    def get_leaderboard(self) -> list:
+        """
+        Retrieve the leaderboard as a list of tuples. Each tuple contains player's name, cluster, and score.
+
+        Returns:
+        list: A list of ((name, cluster), score), sorted in descending order based on the score.
+        """
+        with self.lock:
+            rows = self.conn.execute("SELECT name, cluster, best_score FROM players WHERE best_score IS NOT NULL "
+                                     "ORDER BY best_score DESC, seq").fetchall()
+        return [((name, cluster), score) for name, cluster, score in rows]
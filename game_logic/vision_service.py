@@ -0,0 +1,150 @@
+import os
+import threading
+import numpy as np
+from camera.camera_feed import CameraFeed
+from game_logic.pose_detector import PoseDetector
+from game_logic.complexity_tuner import ComplexityAutoTuner
+from game_logic.pose_estimator import IncrementalPoseEstimator
+from game_logic.pose_matcher import PoseMatcher
+from game_logic.pose_embedding import PoseIndex
+from game_logic.reference_pose_cache import ReferencePoseCache
+
+
+class VisionService:
+    _instance = None
+    _instance_lock = threading.Lock()  # The service may be created by the warm-up thread and the Tk thread
+    # Frame rate the live model complexity is tuned to hold, e.g. 15 (unset or 0 keeps the complexity fixed)
+    auto_tune_fps = float(os.environ.get('POSE_STRIKER_AUTO_TUNE_FPS', 0)) or None
+
+    @staticmethod
+    def get_instance():
+        """Static access method for the Singleton."""
+        with VisionService._instance_lock:
+            if VisionService._instance is None:
+                VisionService(VisionService.auto_tune_fps)
+        return VisionService._instance
+
+    def __init__(self, auto_tune_fps=None):
+        """
+        Private constructor to ensure only one instance exists.
+
+        Opens the camera and loads the pose graphs once for the lifetime of the app. Game rounds attach to
+        the service instead of opening the camera and loading MediaPipe again, so a new round starts
+        without any model load or camera open.
+
+        Parameters:
+        auto_tune_fps (float, optional): Frame rate the live model complexity is tuned to hold, e.g. 15.
+            Defaults to None, which keeps the complexity fixed.
+        """
+        if VisionService._instance is not None:
+            raise Exception("This class is a Singleton!")
+        else:
+            self.live_pose_detector = PoseDetector()
+            try:
+                self.static_pose_detector = PoseDetector(static_image_mode=True)
+            except Exception:
+                self.live_pose_detector.close()
+                raise
+            self.camera_feed = CameraFeed()
+            self.live_pose_estimator = IncrementalPoseEstimator(self.live_pose_detector)
+            self.complexity_tuner = ComplexityAutoTuner(self.live_pose_detector, auto_tune_fps) if auto_tune_fps else None
+            self.reference_pose_cache = ReferencePoseCache(self.static_pose_detector)
+            self.pose_matchers = {}  # Dictionary to store tuple of reference image paths: PoseMatcher
+            self.pose_indexes = {}  # Dictionary to store tuple of reference image paths: PoseIndex
+            self.reference_lock = threading.Lock()  # Reference poses are loaded by the warm-up thread
+            self.lock = threading.Lock()  # Held by the round running inference on the live detector
+            VisionService._instance = self  # Only a fully built service is shared
+
+    def warm_up(self, frame_size=(480, 640)):
+        """
+        Runs one dummy inference on each detector so the first real frame does not pay for graph initialization.
+
+        Parameters:
+        frame_size (tuple, optional): Size (height, width) of the dummy frame. Defaults to (480, 640).
+        """
+        dummy = np.zeros((*frame_size, 3), dtype=np.uint8)
+        with self.lock:
+            self.live_pose_detector.process_frame(dummy.copy(), draw=False)
+            self.live_pose_detector.roi = None
+        self.static_pose_detector.get_pose_landmarks(dummy.copy())
+
+    def get_pose_matcher(self, reference_images, reference_assets=None):
+        """
+        Return a PoseMatcher for the reference images, loading their landmarks only the first time.
+
+        Images without a cached entry are run through the static detector, so the first call should happen
+        off the Tk thread; VisionWarmUp makes it for the game's reference images.
+
+        Parameters:
+        reference_images (list): List of paths to reference images.
+        reference_assets (ReferenceAssetCache, optional): Decoded reference images to detect missing landmarks
+            from. Defaults to None.
+
+        Returns:
+        PoseMatcher: Matcher of the reference poses, in the order of reference_images.
+        """
+        key = tuple(reference_images)
+        with self.reference_lock:
+            pose_matcher = self.pose_matchers.get(key)
+            if pose_matcher is None:
+                self.reference_pose_cache.load(reference_images, reference_assets)
+                pose_matcher = PoseMatcher([self.reference_pose_cache.get(path) for path in reference_images])
+                self.pose_matchers[key] = pose_matcher
+        return pose_matcher
+
+    def get_pose_index(self, reference_images, reference_assets=None):
+        """
+        Return a nearest-neighbour PoseIndex of the reference images, building it only the first time.
+
+        Parameters:
+        reference_images (list): List of paths to reference images.
+        reference_assets (ReferenceAssetCache, optional): Decoded reference images to detect missing landmarks
+            from. Defaults to None.
+
+        Returns:
+        PoseIndex: Index of the reference poses, in the order of reference_images.
+        """
+        key = tuple(reference_images)
+        self.get_pose_matcher(reference_images, reference_assets)  # Loads the reference landmarks
+        with self.reference_lock:
+            pose_index = self.pose_indexes.get(key)
+            if pose_index is None:
+                pose_index = PoseIndex([self.reference_pose_cache.get(path) for path in reference_images])
+                self.pose_indexes[key] = pose_index
+        return pose_index
+
+    def get_reference_pose(self, path):
+        """Return the cached landmarks of a reference image loaded by get_pose_matcher()."""
+        return self.reference_pose_cache.get(path)
+
+    def attach(self):
+        """
+        Start a round on the live detector. Blocks until the previous round has finished its last frame.
+
+        Must be called from the thread that runs the round's inference, and paired with detach().
+        """
+        self.lock.acquire()
+        self.live_pose_estimator.reset()  # Landmarks of the previous player must not carry over
+
+    def detach(self):
+        """End the round started by attach(). The camera and the pose graphs stay loaded."""
+        self.lock.release()
+
+    def close(self, timeout=1.0):
+        """
+        Release the camera and the pose graphs when the app exits.
+
+        Parameters:
+        timeout (float, optional): Maximum time in seconds to wait for a running round to finish its frame.
+            If it does not, the graphs are left to the process exit. Defaults to 1.0.
+        """
+        self.camera_feed.stop()
+        if self.lock.acquire(timeout=timeout):
+            try:
+                if self.complexity_tuner is not None:
+                    self.complexity_tuner.close()
+                self.live_pose_detector.close()
+                self.static_pose_detector.close()
+            finally:
+                self.lock.release()
+        VisionService._instance = None
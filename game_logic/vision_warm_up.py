@@ -0,0 +1,83 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class VisionWarmUp:
+    _instance = None
+
+    @staticmethod
+    def get_instance():
+        """Static access method for the Singleton."""
+        if VisionWarmUp._instance is None:
+            VisionWarmUp()
+        return VisionWarmUp._instance
+
+    def __init__(self):
+        """
+        Private constructor to ensure only one instance exists.
+
+        Imports the vision stack, opens the camera, runs a first inference and loads the reference poses on
+        a background thread while the menu is shown, so the first round does not freeze the Tk thread with
+        model loads or static-image inference for reference images missing from the pose cache. This module only imports the
+        standard library, so the menu can use it without loading cv2 or mediapipe.
+        """
+        if VisionWarmUp._instance is not None:
+            raise Exception("This class is a Singleton!")
+        else:
+            VisionWarmUp._instance = self
+            self.ready = threading.Event()  # Set once the vision service is warm (or failed to start)
+            self.error = None  # Exception raised while warming up, if any
+            self.thread = None
+            self.start_time = None
+            self.time_to_first_inference_ms = None
+
+    def start(self, start_time=None):
+        """
+        Start warming up the vision service on a background thread. Calling it again has no effect.
+
+        Parameters:
+        start_time (float, optional): time.perf_counter() time the app started at, used to report the time
+            to first inference. Defaults to now.
+        """
+        if self.thread is not None:
+            return
+        self.start_time = time.perf_counter() if start_time is None else start_time
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        """Import the vision stack, build the vision service, run one dummy inference and load the reference poses."""
+        try:
+            from game_logic.vision_service import VisionService  # Imports cv2 and mediapipe off the Tk thread
+            from game_logic.reference_assets import list_reference_images
+            vision_service = VisionService.get_instance()
+            vision_service.warm_up()
+            self.time_to_first_inference_ms = (time.perf_counter() - self.start_time) * 1000
+            logger.info("Time to first inference: %.0f ms", self.time_to_first_inference_ms)
+            vision_service.get_pose_matcher(list_reference_images())
+        except Exception as e:
+            # Rounds fall back to building the service when they start
+            self.error = e
+            logger.warning("Vision warm-up failed: %s", e)
+        finally:
+            self.ready.set()
+
+    def is_ready(self):
+        """Return True once the warm-up has finished, whether it succeeded or not."""
+        return self.ready.is_set()
+
+    def close(self, timeout=1.0):
+        """
+        Release the vision service when the app exits.
+
+        Parameters:
+        timeout (float, optional): Maximum time in seconds to wait for a running warm-up. Defaults to 1.0.
+        """
+        if self.thread is None or not self.ready.wait(timeout):
+            return  # The vision stack was never loaded, or is still loading and dies with the process
+        from game_logic.vision_service import VisionService
+        if VisionService._instance is not None:
+            VisionService._instance.close()
@@ -0,0 +1,98 @@
+import threading
+from PIL import Image, ImageTk
+
+# Decor images used by the screens, as (path, size)
+DECOR_ASSETS = [
+    (r"assets/decor/main_menu.png", (1600, 900)),
+    (r"assets/decor/start.png", (150, 40)),
+    (r"assets/decor/game frame.png", (1600, 900)),
+    (r"assets/decor/game review.png", (1600, 900)),
+    (r"assets/decor/did.png", (412, 105)),
+    (r"assets/decor/made.png", (412, 105)),
+    (r"assets/decor/not.png", (412, 105)),
+    (r"assets/decor/nice.png", (412, 105)),
+    (r"assets/decor/play again.png", (131, 35)),
+    (r"assets/decor/menu.png", (131, 35)),
+]
+
+
+class AssetManager:
+    _instance = None
+
+    @staticmethod
+    def get_instance():
+        """Static access method for the Singleton."""
+        if AssetManager._instance is None:
+            AssetManager()
+        return AssetManager._instance
+
+    def __init__(self):
+        """Private constructor to ensure only one instance exists."""
+        if AssetManager._instance is not None:
+            raise Exception("This class is a Singleton!")
+        else:
+            AssetManager._instance = self
+            self.images = {}  # Dictionary to store (path, size): resized PIL image
+            self.photos = {}  # Dictionary to store (path, size): ImageTk.PhotoImage
+            self.lock = threading.Lock()
+
+    def get_image(self, path, size):
+        """
+        Return the image at path resized to size, loading and resizing it only the first time.
+
+        Parameters:
+        path (str): Path of the image.
+        size (tuple): Size (width, height) to resize the image to.
+
+        Returns:
+        PIL.Image.Image: The resized image.
+        """
+        key = (path, size)
+        with self.lock:
+            image = self.images.get(key)
+        if image is None:
+            with Image.open(path) as original:
+                image = original.resize(size, Image.LANCZOS)  # Resize image using LANCZOS
+            with self.lock:
+                image = self.images.setdefault(key, image)
+        return image
+
+    def get_photo(self, path, size):
+        """
+        Return a PhotoImage of the image at path resized to size. Must be called on the Tk thread.
+
+        The PhotoImage is kept alive by the manager, so callers do not need to hold a reference to it.
+
+        Parameters:
+        path (str): Path of the image.
+        size (tuple): Size (width, height) to resize the image to.
+
+        Returns:
+        ImageTk.PhotoImage: The resized image.
+        """
+        key = (path, size)
+        photo = self.photos.get(key)
+        if photo is None:
+            photo = ImageTk.PhotoImage(self.get_image(path, size))
+            self.photos[key] = photo
+        return photo
+
+    def warm_up(self, assets=None):
+        """
+        Load and resize images on a background thread so screens can be built without decoding them.
+
+        Parameters:
+        assets (list, optional): List of (path, size) to load. Defaults to DECOR_ASSETS.
+
+        Returns:
+        threading.Thread: The started loader thread.
+        """
+        assets = DECOR_ASSETS if assets is None else assets
+
+        def load_all():
+            for path, size in assets:
+                self.get_image(path, size)
+
+        thread = threading.Thread(target=load_all, daemon=True)
+        thread.start()
+        return thread
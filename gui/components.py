@@ -3,26 +3,87 @@ from tkinter import ttk
 
 class ScrollableLeaderboard(tk.Frame):
     def __init__(self, parent,width=550,height=550):
+        """
+        Scrollable leaderboard that only creates widgets for the rows in view.
+
+        Rows are Labels placed on a canvas whose scroll region covers the whole leaderboard. A pool of
+        just enough Labels to fill the view is moved to the visible positions while scrolling and only
+        re-configured when their text changes, so rendering costs O(visible rows) however many players
+        the leaderboard holds.
+
+        Parameters:
+        parent (tk.Widget): Parent widget.
+        width (int, optional): Width of the list in pixels. Defaults to 550.
+        height (int, optional): Height of the list in pixels. Defaults to 550.
+        """
         super().__init__(parent)
         self.canvas = tk.Canvas(self,width=width,height=height,bg="gold2")
         self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = tk.Frame(self.canvas)
-        
-        self.scrollable_frame.bind(
-            "<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.configure(yscrollcommand=self.on_scroll)
+        self.canvas.bind("<Configure>", lambda e: self.render())
 
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
 
+        self.data = []  # Leaderboard entries [(name, cluster), score]
+        self.rows = []  # Pool of (canvas window, label) recycled between the visible positions
+        self.row_texts = []  # Text currently shown by each pooled label
+        self.row_pady = 2
+        self.row_height = None  # Measured from the first label
+
     def update_leaderboard(self, data):
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        for index, (name, score) in enumerate(data):
-            tk.Label(self.scrollable_frame,font='Arial 17 bold',bg="#B28D09",fg="snow",text=f"{index + 1}.   {name[0]}  |  {name[1]}  |  {score} Points                                                 ").pack(anchor="w", pady=2,)
+        """
+        Show new leaderboard entries. Only the rows in view are re-rendered, and only if they changed.
+
+        Parameters:
+        data (list): List of ((name, cluster), score), sorted by score in descending order.
+        """
+        self.data = data
+        if not self.rows:
+            self.create_row()
+        self.canvas.configure(scrollregion=(0, 0, 0, len(self.data) * self.row_height))
+        self.render()
+
+    @staticmethod
+    def format_row(index, entry):
+        """Return the text of the leaderboard row at the given 0-based index."""
+        name, score = entry
+        return f"{index + 1}.   {name[0]}  |  {name[1]}  |  {score} Points                                                 "
+
+    def create_row(self):
+        """Add a label to the pool of row widgets."""
+        label = tk.Label(self.canvas,font='Arial 17 bold',bg="#B28D09",fg="snow",text=" ")
+        window = self.canvas.create_window((0, 0), window=label, anchor="nw", state="hidden")
+        self.rows.append((window, label))
+        self.row_texts.append(None)
+        if self.row_height is None:
+            self.row_height = label.winfo_reqheight() + 2 * self.row_pady
+
+    def on_scroll(self, first, last):
+        """Move the scrollbar and render the rows that scrolled into view."""
+        self.scrollbar.set(first, last)
+        self.render()
+
+    def render(self):
+        """Place pooled labels on the visible rows, growing the pool if the view got taller."""
+        if not self.rows:
+            self.create_row()
+        view_height = max(self.canvas.winfo_height(), int(self.canvas.cget("height")))
+        while len(self.rows) < view_height // self.row_height + 2:
+            self.create_row()
+
+        first = max(0, int(self.canvas.canvasy(0)) // self.row_height)
+        for slot, (window, label) in enumerate(self.rows):
+            index = first + slot
+            if index >= len(self.data):
+                self.canvas.itemconfigure(window, state="hidden")
+                continue
+            text = self.format_row(index, self.data[index])
+            if text != self.row_texts[slot]:
+                label.config(text=text)
+                self.row_texts[slot] = text
+            self.canvas.coords(window, 0, index * self.row_height + self.row_pady)
+            self.canvas.itemconfigure(window, state="normal")
 
 class DropdownMenu(ttk.Combobox):
     def __init__(self, parent, values, label_text="CLUSTER  :", width=40):
@@ -1,49 +1,40 @@
 import tkinter as tk
-from camera.camera_feed import CameraFeed
 from game_logic.player_manager import PlayerManager
 from game_logic.game_logic import GameLogic
-from PIL import Image, ImageTk
-import threading
-import time
-import os
+from game_logic.game_clock import GameClock, seconds_left
+from game_logic.reference_assets import ReferenceAssetCache, list_reference_images
+from game_logic.vision_service import VisionService
+from gui.asset_manager import AssetManager
+from gui.ui_event_bus import UIEventBus
+from PIL import ImageTk
 
 class GameFrame(tk.Frame):
-    def __init__(self, parent, timer_running=True):
+    def __init__(self, parent, screen_manager, round_time=90):
 
         super().__init__(parent)
-        self.time_left = 90  # Time limit for the game
+        self.screen_manager = screen_manager
+        self.round_time = round_time  # Time limit for the game
+        self.time_left = round_time
 
-        # Load and resize background image using Pillow
-        image = Image.open(r"assets/decor/game frame.png")
-        resized_image = image.resize((1600,900), Image.LANCZOS)  # Resize image using LANCZOS
-
-        self.bg_image = ImageTk.PhotoImage(resized_image)
+        # Background image, loaded and resized once by the asset manager
+        self.bg_image = AssetManager.get_instance().get_photo(r"assets/decor/game frame.png", (1600, 900))
 
         # Create a label to hold the background image
         self.bg_label = tk.Label(self, image=self.bg_image)
         self.bg_label.place(relx=0, y=0, relwidth=1, relheight=1)  # Make it full screen
 
-        pm = PlayerManager.get_instance()
-
         # Middle frame for reference image, score, timer, and combo
         self.middle_frame = tk.Frame(self)
         self.middle_frame.pack(pady=0)  # Set pady to 0 for no vertical padding
 
-        # Define the possible extensions
-        extensions = ['.png', '.jpg', '.jpeg', '.webp']
-
-        # Create the list of reference images
-        reference_poses_dir = 'assets/reference_poses/'
-        self.reference_images = [os.path.join(reference_poses_dir, file) for file in os.listdir(reference_poses_dir) if os.path.splitext(file)[1].lower() in extensions]
+        # Create the list of reference images, the same list the vision warm-up loaded the poses of
+        self.reference_images = list_reference_images()
 
         self.pose_id = 0
 
-        # Step 1: Load a new image
-        self.reference_img = Image.open(self.reference_images[self.pose_id])
-        self.reference_img = self.reference_img.resize((700, 525), resample=3)
-
-        # Step 2: Create a new ImageTk.PhotoImage object
-        self.reference_imgtk = ImageTk.PhotoImage(self.reference_img)
+        # Decoded and resized reference images, shared with the game logic and kept across rounds
+        self.reference_assets = ReferenceAssetCache(self.reference_images, display_size=(700, 525))
+        self.reference_imgtk = self.get_reference_photo()
 
         # Reference label without background color
         self.reference_label = tk.Label(self.middle_frame, image=self.reference_imgtk)
@@ -54,7 +45,7 @@ class GameFrame(tk.Frame):
         self.overlay_frame.place(x=20, y=20)
 
         # Score label (Top-left)
-        self.score_label = tk.Label(self.overlay_frame, text=f"Score: {pm.get_player_score()}", font=("Arial", 30))
+        self.score_label = tk.Label(self.overlay_frame, text="", font=("Arial", 30))
         self.score_label.pack(side=tk.LEFT, padx=10)
 
         # Combo label (Top-right)
@@ -69,10 +60,6 @@ class GameFrame(tk.Frame):
         self.video_label = tk.Label(self.middle_frame, width=750, height=750)
         self.video_label.pack(side=tk.RIGHT, padx=0)  # Set padx to 0 for no horizontal padding
 
-        self.camera_feed = CameraFeed(self.video_label)
-        self.timer_running = timer_running
-        threading.Thread(target=self.update_timer, daemon=True).start()
-
         # Skip Pose button
         self.skip_pose_button = tk.Button(self, text="Skip Pose", command=self.skip_pose, bg="gold2")
         self.skip_pose_button.place(relx=0.46, rely=0.85, anchor=tk.CENTER, width=100, height=30)
@@ -81,61 +68,127 @@ class GameFrame(tk.Frame):
         self.give_up_button = tk.Button(self, text="Give Up", command=self.end_game, bg="#C7253E")
         self.give_up_button.place(relx=0.55, rely=0.85, anchor=tk.CENTER, width=100, height=30)
 
-        # Game Logic initialization
-        self.game_logic = GameLogic(self.reference_images, self.camera_feed, self.update_score, self.update_combo_text)
+        # Score and combo updates posted by the game thread, applied on the Tk loop
+        self.ui_events = UIEventBus(self)
+        self.ui_events.subscribe('score', self.update_score)
+        self.ui_events.subscribe('combo', self.update_combo_text)
+
+        # Monotonic game time driving the round timer and the combo timeout
+        self.game_clock = GameClock(self)
+
+        # Per-session state, created in on_show() and released in on_hide()
+        self.camera_feed = None
+        self.game_logic = None
+        self.timer_job = None
+
+    def on_show(self):
+        """Reset the round state, attach to the warm camera and detectors and start the game loop and the timer."""
+        pm = PlayerManager.get_instance()
+        self.time_left = self.round_time
+        self.pose_id = 0
+        self.score_label.config(text=f"Score: {pm.get_player_score()}")
+        self.combo_label.config(text="")
+        self.timer_label.config(text=f"Time left: {self.time_left}")
+        self.reference_imgtk = self.get_reference_photo()
+        self.reference_label.config(image=self.reference_imgtk)
+        self.video_label.config(image='')
+
+        try:
+            vision_service = VisionService.get_instance()
+        except Exception as error:
+            # The warm-up failed and so did this retry, the round cannot start without the camera and model
+            self.screen_manager.show('main_menu')
+            self.screen_manager.get_screen('main_menu').show_vision_error(error)
+            return
+        self.camera_feed = vision_service.camera_feed
+        self.camera_feed.attach(self.video_label)
+
+        # Game Logic initialization, its callbacks run on the game thread and only post events
+        self.game_clock.start()
+        game_logic = GameLogic(self.reference_images, vision_service,
+                               lambda: self.ui_events.post('score', game_logic),
+                               lambda combo: self.ui_events.post('combo', game_logic, combo),
+                               reference_assets=self.reference_assets, game_clock=self.game_clock)
+        self.game_logic = game_logic
+        self.ui_events.start()
         self.game_logic.start_game()
+        self.update_timer()
+
+    def on_hide(self):
+        """Stop the timer and the game loop and detach from the camera, which stays open for the next round."""
+        self.game_clock.stop()
+        self.timer_job = None
+        self.ui_events.stop()
+        if self.game_logic is not None:
+            self.game_logic.close()
+            self.game_logic = None
+        if self.camera_feed is not None:
+            self.camera_feed.detach()
+            self.camera_feed = None
+
+    def destroy(self):
+        self.on_hide()
+        self.reference_assets.close()
+        super().destroy()
 
     def update_timer(self):
-        while self.time_left > 0 and self.timer_running:
-            time.sleep(1)
-            self.time_left -= 1
-            self.timer_label.config(text=f"Time left: {self.time_left}")
-        if self.timer_running:  # this is executed upon timer timeout, not upon Give Up button press
+        """Show the seconds left and schedule the next tick at the next whole second of game time."""
+        self.time_left, next_tick_ms = seconds_left(self.round_time, self.game_clock.elapsed_ms())
+        self.timer_label.config(text=f"Time left: {self.time_left}")
+        if next_tick_ms is not None:
+            self.timer_job = self.game_clock.call_at(next_tick_ms, self.update_timer)
+        else:
+            self.timer_job = None
             self.end_game()
 
-    def update_score(self):
+    def update_score(self, game_logic):
+        if game_logic is not self.game_logic:
+            return  # Posted by the game thread of a round that has ended
         pm = PlayerManager.get_instance()
         self.score_label.config(text=f"Score: {pm.get_player_score()}")
-        self.change_ref_photo()
+        self.change_ref_photo(game_logic.pose_id)
 
-    def update_combo_text(self, combo):
+    def update_combo_text(self, game_logic, combo):
+        if game_logic is not self.game_logic:
+            return
         if combo > 1:
             self.combo_label.config(text=f'{combo}x')
         else:
             self.combo_label.config(text="")
 
     def end_game(self):
+        if self.game_logic is None:
+            return  # The round has already ended
+
         pm = PlayerManager.get_instance()
         pm.decrement_player_attempts(*pm.get_current_player())
         pm.update_leaderboard()
 
-        self.game_logic.end_game()
-        self.timer_running = False
-        self.camera_feed.stop()
-        self.pack_forget()
-
-        # Transition to session review
-        from gui.game_review import GameReview
-        game_review = GameReview(self.master)
-        game_review.pack(fill=tk.BOTH, expand=True)
+        # Transition to session review, which ends this round through on_hide()
+        self.screen_manager.show('game_review')
 
     def skip_pose(self):
-        self.change_ref_photo()
         self.game_logic.next_photo()
+        self.change_ref_photo(self.game_logic.pose_id)
 
-    def change_ref_photo(self):
-        self.pose_id += 1
-        self.pose_id %= len(self.reference_images)
+    def change_ref_photo(self, pose_id):
+        if pose_id == self.pose_id:
+            return  # Already shown
+        self.pose_id = pose_id
 
-        # Step 1: Load a new image
-        self.reference_img = Image.open(self.reference_images[self.pose_id])
-        self.reference_img = self.reference_img.resize((700, 525), resample=3)
+        # Step 1: Get the decoded image, prefetched in the background in most cases
+        self.reference_imgtk = self.get_reference_photo()
 
-        # Step 2: Create a new ImageTk.PhotoImage object
-        self.reference_imgtk = ImageTk.PhotoImage(self.reference_img)
-
-        # Step 3: Update the label to display the new image
+        # Step 2: Update the label to display the new image
         self.reference_label.config(image=self.reference_imgtk)
 
-        # Step 4: Keep a reference to the new image to avoid garbage collection
+        # Step 3: Keep a reference to the new image to avoid garbage collection
         self.reference_label.image = self.reference_imgtk
+
+    def get_reference_photo(self):
+        """Return the PhotoImage of the current reference pose and start decoding the next ones."""
+        asset = self.reference_assets.get(self.reference_images[self.pose_id])
+        if asset.photo is None:
+            asset.photo = ImageTk.PhotoImage(asset.display)
+        self.reference_assets.prefetch(self.pose_id)
+        return asset.photo
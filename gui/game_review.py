@@ -1,37 +1,56 @@
 import tkinter as tk
 from gui.components import ScrollableLeaderboard
 from game_logic.player_manager import PlayerManager
-from PIL import Image, ImageTk
+from gui.asset_manager import AssetManager
 
 
 class GameReview(tk.Frame):
-    def __init__(self, parent):
+    def __init__(self, parent, screen_manager):
         super().__init__(parent)
-        # Load and resize background image using Pillow
-        image = Image.open(r"assets/decor/game review.png")
-        resized_image = image.resize((1600, 900), Image.LANCZOS)  # Resize image using LANCZOS
+        self.screen_manager = screen_manager
+        self.pm = PlayerManager.get_instance()
+        assets = AssetManager.get_instance()
 
-        self.bg_image = ImageTk.PhotoImage(resized_image)
+        # Background image, loaded and resized once by the asset manager
+        self.bg_image = assets.get_photo(r"assets/decor/game review.png", (1600, 900))
 
         # Create a label to hold the background image
         self.bg_label = tk.Label(self, image=self.bg_image)
         self.bg_label.place(relx=0, y=0, relwidth=1, relheight=1)  # Make it full screen
 
+        # Congratulatory image, set in on_show() based on the player's rank
+        self.congrats_image = None
+        self.congrats_label = tk.Label(self, bg="#D6AC18")
+        self.congrats_label.place(relx=0.5, rely=0.09, anchor=tk.CENTER)
+
+        # Player's rank within their cluster and the cluster's place among all clusters
+        self.cluster_rank_label = tk.Label(self, font=('Arial 17 bold'), fg="#384987", bg="#E6CF00")
+        self.cluster_rank_label.place(relx=0.5, rely=0.24, anchor=tk.CENTER)
+
+        self.leaderboard_display = ScrollableLeaderboard(self)
+        self.leaderboard_display.place(relx=0.5, rely=0.48, anchor=tk.CENTER, width=550, height=357)
+
+        # Player's ranking row (only shown if player is not in top 5)
+        self.player_ranking_label = tk.Label(self, font=('Arial 22 bold'), fg="#384987", bg="#E6CF00")
+
+        # Attempts left label
+        self.attempts_label = tk.Label(self, font=('Arial 17 bold'), fg="#384987", bg="#E6CF00")
+        self.attempts_label.place(relx=0.5, rely=0.795, anchor=tk.CENTER)
+
+        # Play Again button (only shown if attempts are left)
+        self.play_again_button_image_tk = assets.get_photo(r"assets/decor/play again.png", (131, 35))  # Path to play again image
+        self.play_again_button = tk.Button(self, image=self.play_again_button_image_tk, command=self.play_again, bg="gold2")
+
+        # Main Menu button
+        self.main_menu_button_image_tk = assets.get_photo(r"assets/decor/menu.png", (131, 35))  # Path to main menu image
+        self.main_menu_button = tk.Button(self, image=self.main_menu_button_image_tk, command=self.return_to_main_menu, bg="gold2")
+
+    def on_show(self):
+        """Show the rank, leaderboard and remaining attempts of the round that just ended."""
         # Player's rank and score have been added to the leaderboard in end_game() in game_frame.py
         # Here, we only need to get the rank
-        self.pm = PlayerManager.get_instance()
         player_rank = self.pm.get_player_rank()
 
-        # Congratulatory message based on the player's rank
-        if player_rank == 1:
-            message = "You Did It!"
-        elif player_rank <= 5:
-            message = "You Made It!"
-        elif player_rank <= 10:
-            message = "Not Bad!"
-        else:
-            message = "Nice Try!"
-
         # Congratulatory image based on the player's rank
         if player_rank == 1:
             image_message = r"assets/decor/did.png"  # Path for the first rank image
@@ -43,68 +62,48 @@ class GameReview(tk.Frame):
             image_message = r"assets/decor/nice.png"  # Path for the rank 11+ image
 
         # Load and display the congratulatory image
-        congrats_image = Image.open(image_message)
-        congrats_resized_image = congrats_image.resize((412, 105), Image.LANCZOS)  # Adjust the size as needed
-        self.congrats_image = ImageTk.PhotoImage(congrats_resized_image)
-
-        self.congrats_label = tk.Label(self, image=self.congrats_image, bg="#D6AC18")
-        self.congrats_label.pack(pady=0)
-        self.congrats_label.place(relx=0.5, rely=0.09, anchor=tk.CENTER)
+        self.congrats_image = AssetManager.get_instance().get_photo(image_message, (412, 105))  # Adjust the size as needed
+        self.congrats_label.config(image=self.congrats_image)
 
-        self.leaderboard_display = ScrollableLeaderboard(self)
         self.leaderboard_display.update_leaderboard(self.pm.get_leaderboard())
-        self.leaderboard_display.place(relx=0.5, rely=0.48, anchor=tk.CENTER, width=550, height=357)
+        self.update_cluster_rank()
 
         # Player's ranking row (only show if player is not in top 5)
         if player_rank > 5:
-            self.player_ranking_label = tk.Label(self, text=f"Your Rank: {player_rank} (Score: {self.pm.get_player_score()})", font=('Arial 22 bold'), fg="#384987", bg="#E6CF00")
-            self.player_ranking_label.pack(pady=10)
+            self.player_ranking_label.config(text=f"Your Rank: {player_rank} (Score: {self.pm.get_player_score()})")
             self.player_ranking_label.place(relx=0.5, rely=0.76, anchor=tk.CENTER)
+        else:
+            self.player_ranking_label.place_forget()
 
-        # Attempts left label
         chances = self.pm.get_remaining_attempts()
-        self.attempts_label = tk.Label(self, text=f"Attempts Left: {chances}", font=('Arial 17 bold'), fg="#384987", bg="#E6CF00")
-        self.attempts_label.pack(pady=5)
-        self.attempts_label.place(relx=0.5, rely=0.795, anchor=tk.CENTER)
+        self.attempts_label.config(text=f"Attempts Left: {chances}")
 
         # Play Again button (only show if attempts are left)
         if chances > 0:
-            self.play_again_button_image = Image.open(r"assets/decor/play again.png")  # Path to play again image
-            self.play_again_button_image_resized = self.play_again_button_image.resize((131, 35), Image.LANCZOS)  # Resize
-            self.play_again_button_image_tk = ImageTk.PhotoImage(self.play_again_button_image_resized)
-
-            self.play_again_button = tk.Button(self, image=self.play_again_button_image_tk, command=self.play_again, bg="gold2")
-            self.play_again_button.pack(pady=5)
             self.play_again_button.place(relx=0.6, rely=0.88, anchor=tk.CENTER, width=150, height=45)
-
-            # Main Menu button
-            self.main_menu_button_image = Image.open(r"assets/decor/menu.png")  # Path to main menu image
-            self.main_menu_button_image_resized = self.main_menu_button_image.resize((131, 35), Image.LANCZOS)  # Resize
-            self.main_menu_button_image_tk = ImageTk.PhotoImage(self.main_menu_button_image_resized)
-
-            self.main_menu_button = tk.Button(self, image=self.main_menu_button_image_tk, command=self.return_to_main_menu, bg="gold2")
-            self.main_menu_button.pack(pady=5)
             self.main_menu_button.place(relx=0.4, rely=0.88, anchor=tk.CENTER, width=150, height=45)
-
         else:
-            self.main_menu_button_image = Image.open(r"assets/decor/menu.png")  # Path to main menu image
-            self.main_menu_button_image_resized = self.main_menu_button_image.resize((131, 35), Image.LANCZOS)  # Resize
-            self.main_menu_button_image_tk = ImageTk.PhotoImage(self.main_menu_button_image_resized)
-
-            self.main_menu_button = tk.Button(self, image=self.main_menu_button_image_tk, command=self.return_to_main_menu, bg="gold2")
-            self.main_menu_button.pack(pady=5)
+            self.play_again_button.place_forget()
             self.main_menu_button.place(relx=0.5, rely=0.88, anchor=tk.CENTER, width=150, height=45)
 
+    def update_cluster_rank(self):
+        """Show the player's rank in their cluster and the cluster's place in the cluster standings."""
+        cluster = self.pm.get_current_player()[1]
+        cluster_rank = self.pm.get_player_cluster_rank()
+        standings = [standing[0] for standing in self.pm.get_cluster_standings()]
+        if cluster_rank == -1 or cluster not in standings:
+            self.cluster_rank_label.config(text=f"{cluster}: no score yet")
+            return
+        self.cluster_rank_label.config(text=f"{cluster} Rank: {cluster_rank}  |  "
+                                            f"{cluster}: #{standings.index(cluster) + 1} of {len(standings)} clusters")
+
+    def on_hide(self):
+        """The review holds no per-session resources."""
+        pass
+
     def play_again(self):
-        self.pack_forget()  # Hide review frame
-        # Go back to the main game frame (this part depends on how you manage transitions)
-        from gui.game_frame import GameFrame
-        game_frame = GameFrame(self.master)
-        game_frame.pack(fill=tk.BOTH, expand=True)
+        # Go back to the main game frame, which starts a new round
+        self.screen_manager.show('game')
 
     def return_to_main_menu(self):
-        self.pack_forget()
-        # Go back to main menu
-        from gui.main_menu import MainMenu
-        main_menu = MainMenu(self.master)
-        main_menu.pack(fill=tk.BOTH, expand=True)
+        self.screen_manager.show('main_menu')
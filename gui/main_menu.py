@@ -1,18 +1,16 @@
 import tkinter as tk
-from PIL import Image, ImageTk
+from gui.asset_manager import AssetManager
 from gui.components import ScrollableLeaderboard, DropdownMenu
-from gui.game_frame import GameFrame
 from game_logic.player_manager import PlayerManager
+from game_logic.vision_warm_up import VisionWarmUp
 
 class MainMenu(tk.Frame):
-    def __init__(self, parent):
+    def __init__(self, parent, screen_manager):
         super().__init__(parent)
+        self.screen_manager = screen_manager
 
-        # Load and resize background image using Pillow
-        image = Image.open(r"assets/decor/main_menu.png")
-        resized_image = image.resize((1600,900), Image.LANCZOS)  # Resize image using LANCZOS
-
-        self.bg_image = ImageTk.PhotoImage(resized_image)
+        # Background image, loaded and resized once by the asset manager
+        self.bg_image = AssetManager.get_instance().get_photo(r"assets/decor/main_menu.png", (1600, 900))
 
         # Create a label to hold the background image
         self.bg_label = tk.Label(self, image=self.bg_image)
@@ -46,15 +44,18 @@ class MainMenu(tk.Frame):
                                                                   "Cluster 21", "Cluster 22"])
 
         # Load start button image
-        start_image = Image.open(r"assets/decor/start.png")
-        start_image_resized = start_image.resize((150, 40), Image.LANCZOS)  # Resize if needed
-        self.start_image_tk = ImageTk.PhotoImage(start_image_resized)
+        self.start_image_tk = AssetManager.get_instance().get_photo(r"assets/decor/start.png", (150, 40))
 
         # Start button with image
         self.start_button = tk.Button(self, image=self.start_image_tk, command=self.start_game, bg="#EC008C", bd=0)
         self.start_button.pack(pady=30)
         self.start_button.place(relx=0.5, rely=0.92, anchor=tk.CENTER, width=150, height=40)
 
+        # Camera and pose model status, the game can only start once they are warm
+        self.vision_status_label = tk.Label(self, font='Arial 12 bold', fg="#384987", bg="gold2")
+        self.vision_status_label.place(relx=0.5, rely=0.97, anchor=tk.CENTER)
+        self.vision_status_job = None
+
 
     def create_leaderboard_frame(self):
 
@@ -67,7 +68,43 @@ class MainMenu(tk.Frame):
         self.leaderboard_display.place(relx=0.5, rely=0.55, anchor=tk.CENTER, width=550, height=380)
         self.leaderboard_display.pack(pady=10)
 
+    def on_show(self):
+        """Reset the player input and refresh the leaderboard for a new visitor."""
+        self.name_entry.delete(0, tk.END)
+        self.cluster_dropdown.set('')
         self.update_leaderboard()
+        self.update_vision_status()
+
+    def on_hide(self):
+        """Stop polling the vision warm-up."""
+        if self.vision_status_job is not None:
+            self.after_cancel(self.vision_status_job)
+            self.vision_status_job = None
+
+    def update_vision_status(self):
+        """Show whether the camera and pose model are ready, polling until the warm-up has finished."""
+        self.vision_status_job = None
+        vision_warm_up = VisionWarmUp.get_instance()
+        if not vision_warm_up.is_ready():
+            self.vision_status_label.config(text="Loading camera and pose model...")
+            self.start_button.config(state=tk.DISABLED)
+            self.vision_status_job = self.after(100, self.update_vision_status)
+        elif vision_warm_up.error is not None:
+            # The round will try to start the vision service itself
+            self.vision_status_label.config(text="Pose model could not be preloaded")
+            self.start_button.config(state=tk.NORMAL)
+        else:
+            self.vision_status_label.config(text="Ready!")
+            self.start_button.config(state=tk.NORMAL)
+
+    def show_vision_error(self, error):
+        """
+        Show why the camera and pose model could not be started for a round.
+
+        Parameters:
+        error (Exception): Error raised while starting the vision service.
+        """
+        self.vision_status_label.config(text=f"Camera or pose model could not be started: {error}")
 
     def update_leaderboard(self):
         pm = PlayerManager.get_instance()
@@ -86,6 +123,4 @@ class MainMenu(tk.Frame):
                     pm.add_player(player_name, player_cluster)
                 pm.set_current_player(player_name, player_cluster)
 
-                self.pack_forget()  # Hide main menu
-                game_frame = GameFrame(self.master)
-                game_frame.pack(fill=tk.BOTH, expand=True)
+                self.screen_manager.show('game')
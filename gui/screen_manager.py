@@ -0,0 +1,72 @@
+import tkinter as tk
+
+
+class ScreenManager:
+    def __init__(self, root):
+        """
+        Keeps one instance of every screen and switches between them.
+
+        Screens are built the first time they are shown and reused afterwards. Instead of rebuilding their
+        widgets, screens reset their per-session state in on_show() and release per-session resources
+        (camera, game thread, pose graphs) in on_hide(), so memory stays flat however many rounds are played.
+
+        Parameters:
+        root (tk.Tk): Window the screens are packed into.
+        """
+        self.root = root
+        self.screens = {}  # Dictionary to store name: screen
+        self.current = None
+
+    def create_screen(self, name):
+        """
+        Builds a screen. Screens are imported here so the game's dependencies are only loaded when needed.
+
+        Parameters:
+        name (str): One of 'main_menu', 'game', 'game_review'.
+
+        Returns:
+        tk.Frame: The new screen.
+        """
+        if name == 'main_menu':
+            from gui.main_menu import MainMenu
+            return MainMenu(self.root, self)
+        if name == 'game':
+            from gui.game_frame import GameFrame
+            return GameFrame(self.root, self)
+        if name == 'game_review':
+            from gui.game_review import GameReview
+            return GameReview(self.root, self)
+        raise ValueError(f"Unknown screen: {name}")
+
+    def get_screen(self, name):
+        """Return the screen with the given name, building it the first time."""
+        screen = self.screens.get(name)
+        if screen is None:
+            screen = self.create_screen(name)
+            self.screens[name] = screen
+        return screen
+
+    def show(self, name):
+        """
+        Hide the current screen and show the given one, starting a new session on it.
+
+        Parameters:
+        name (str): Name of the screen to show.
+        """
+        screen = self.get_screen(name)
+        if self.current is not None:
+            self.current.pack_forget()
+            self.current.on_hide()
+        self.current = screen
+        screen.on_show()
+        if self.current is screen:  # on_show() may have moved on to another screen
+            screen.pack(fill=tk.BOTH, expand=True)
+
+    def close(self):
+        """End the current session and destroy every screen."""
+        if self.current is not None:
+            self.current.on_hide()
+            self.current = None
+        for screen in self.screens.values():
+            screen.destroy()
+        self.screens.clear()
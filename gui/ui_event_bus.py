@@ -0,0 +1,65 @@
+import threading
+
+
+class UIEventBus:
+    def __init__(self, widget, interval_ms=16):
+        """
+        Hands events from worker threads to handlers running on the Tk main loop.
+
+        Worker threads only post events, which never touches Tk. The Tk loop drains them every interval_ms
+        with after(). Events are coalesced per drain: if an event is posted several times in between, its
+        handler runs once with the latest arguments.
+
+        Parameters:
+        widget (tk.Widget): Widget whose after() schedules the drain.
+        interval_ms (int, optional): Time between drains in milliseconds. Defaults to 16 (one frame at 60 Hz).
+        """
+        self.widget = widget
+        self.interval_ms = interval_ms
+        self.handlers = {}  # Dictionary to store event name: handler
+        self.pending = {}  # Dictionary to store event name: latest arguments, in posting order
+        self.lock = threading.Lock()
+        self.drain_job = None
+
+    def subscribe(self, name, handler):
+        """
+        Register the handler of an event. Handlers run on the Tk thread.
+
+        Parameters:
+        name (str): Name of the event.
+        handler (function): Function called with the event's arguments.
+        """
+        self.handlers[name] = handler
+
+    def post(self, name, *args):
+        """
+        Post an event. Can be called from any thread.
+
+        Parameters:
+        name (str): Name of the event.
+        *args: Arguments passed to the handler. They replace those of a pending event with the same name.
+        """
+        with self.lock:
+            self.pending.pop(name, None)
+            self.pending[name] = args
+
+    def start(self):
+        """Start draining events on the Tk loop."""
+        if self.drain_job is None:
+            self.drain()
+
+    def stop(self):
+        """Stop draining events and drop the pending ones."""
+        if self.drain_job is not None:
+            self.widget.after_cancel(self.drain_job)
+            self.drain_job = None
+        with self.lock:
+            self.pending = {}
+
+    def drain(self):
+        """Run the handlers of the events posted since the last drain."""
+        with self.lock:
+            events, self.pending = self.pending, {}
+        for name, args in events.items():
+            self.handlers[name](*args)
+        self.drain_job = self.widget.after(self.interval_ms, self.drain)
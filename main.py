@@ -1,5 +1,11 @@
+import logging
+import time
 import tkinter as tk
-from gui.main_menu import MainMenu
+from gui.asset_manager import AssetManager
+from gui.screen_manager import ScreenManager
+from game_logic.vision_warm_up import VisionWarmUp
+
+logger = logging.getLogger(__name__)
 
 # Function to toggle fullscreen mode
 def toggle_fullscreen(event=None):
@@ -13,6 +19,10 @@ def exit_fullscreen(event=None):
 def main():
     global root
 
+    start_time = time.perf_counter()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s: %(message)s")
+
     root = tk.Tk()
     root.title("Pose Striker")
     root.geometry("800x600")
@@ -21,9 +31,25 @@ def main():
     root.attributes("-fullscreen", True)
     root.bind("<Escape>", exit_fullscreen)  # Bind Escape to exit fullscreen
 
-    # Initialize Main Menu
-    main_menu = MainMenu(root)
-    main_menu.pack(fill=tk.BOTH, expand=True)
+    # Load and resize the screen images in the background while the menu is built
+    AssetManager.get_instance().warm_up()
+
+    # Import the vision stack, open the camera and warm the pose graphs in the background, game rounds
+    # attach to them once they are ready
+    vision_warm_up = VisionWarmUp.get_instance()
+    vision_warm_up.start(start_time)
+
+    # Initialize Main Menu, screens are built once and reused across rounds
+    screen_manager = ScreenManager(root)
+    screen_manager.show('main_menu')
+    root.after_idle(lambda: logger.info("Time to interactive: %.0f ms", (time.perf_counter() - start_time) * 1000))
+
+    # Release the camera and the pose graphs before the window goes away
+    def close():
+        screen_manager.close()
+        vision_warm_up.close()
+        root.destroy()
+    root.protocol("WM_DELETE_WINDOW", close)
 
     # Bind F11 to toggle fullscreen
     root.bind("<F11>", toggle_fullscreen)
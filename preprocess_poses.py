@@ -0,0 +1,154 @@
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+import numpy as np
+
+from game_logic.pose_detector import PoseDetector
+from game_logic.pose_embedding import embed_poses
+from game_logic.pose_landmarks import NUM_LANDMARKS, REQUIRED_LANDMARKS, ANGLES_TO_COMPARE
+from game_logic.reference_assets import REFERENCE_EXTENSIONS
+from game_logic.reference_pose_cache import ReferencePoseCache
+
+# Pose detector owned by each worker process
+worker_detector = None
+
+
+def init_worker():
+    """Create one static-image pose detector per worker process."""
+    global worker_detector
+    cv2.setNumThreads(1)  # One process per core already, avoid oversubscription
+    worker_detector = PoseDetector(static_image_mode=True)
+
+
+def process_image(path):
+    """
+    Detect the pose of one reference image.
+
+    Parameters:
+    path (str): Path of the reference image.
+
+    Returns:
+    dict: Cache key, landmarks, joint angles and quality stats of the image.
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+    settings_key = ReferencePoseCache.get_settings_key(worker_detector.settings)
+    img = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+
+    start = time.perf_counter()
+    try:
+        landmarks = worker_detector.get_complete_pose_landmarks(img)
+    except Exception:
+        landmarks = None
+    detect_ms = (time.perf_counter() - start) * 1000
+
+    # Quality of the last estimation, also for images that are not complete
+    last_landmarks = worker_detector.landmarks
+    n_fulfilled, _ = last_landmarks.is_complete(REQUIRED_LANDMARKS)
+    visibility = last_landmarks.visibility[REQUIRED_LANDMARKS]
+
+    return {
+        'path': path,
+        'key': ReferencePoseCache.get_key(data, settings_key),
+        'landmarks': landmarks,
+        'angles': landmarks.angles() if landmarks is not None else None,
+        'n_fulfilled': n_fulfilled,
+        'mean_visibility': float(np.mean(visibility)),
+        'min_visibility': float(np.min(visibility)),
+        'detect_ms': detect_ms,
+    }
+
+
+def write_library(results, output_path):
+    """
+    Write the processed reference library to a compressed NumPy archive.
+
+    Landmarks are stored as (x, y, z, visibility) with a presence mask, missing angles as NaN. Normalized
+    embeddings (see embed_poses()) are stored with their validity mask, ready to be put in a KD-tree.
+
+    Parameters:
+    results (list): Results returned by process_image().
+    output_path (str): Path of the .npz file to write.
+
+    Returns:
+    None
+    """
+    n = len(results)
+    landmarks = np.zeros((n, NUM_LANDMARKS, 4), dtype=np.float32)
+    present = np.zeros((n, NUM_LANDMARKS), dtype=bool)
+    angles = np.full((n, len(ANGLES_TO_COMPARE)), np.nan, dtype=np.float32)
+    for i, result in enumerate(results):
+        if result['landmarks'] is not None:
+            landmarks[i] = result['landmarks'].data
+            present[i] = result['landmarks'].present
+            angles[i] = result['angles']
+    embeddings, embedding_valid = embed_poses(landmarks, present)
+
+    tmp_path = output_path + '.tmp.npz'
+    np.savez_compressed(
+        tmp_path,
+        paths=np.array([result['path'] for result in results]),
+        landmarks=landmarks,
+        present=present,
+        angles=angles,
+        embeddings=embeddings,
+        embedding_valid=embedding_valid,
+        complete=np.array([result['landmarks'] is not None for result in results]),
+        n_fulfilled=np.array([result['n_fulfilled'] for result in results], dtype=np.int8),
+        mean_visibility=np.array([result['mean_visibility'] for result in results], dtype=np.float32),
+        min_visibility=np.array([result['min_visibility'] for result in results], dtype=np.float32),
+        detect_ms=np.array([result['detect_ms'] for result in results], dtype=np.float32),
+    )
+    os.replace(tmp_path, output_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-process the reference pose library in parallel.")
+    parser.add_argument('--input', default='assets/reference_poses/', help="Directory of reference images.")
+    parser.add_argument('--output', default='assets/reference_pose_library.npz', help="Binary library to write.")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Number of worker processes.")
+    parser.add_argument('--no-cache', action='store_true', help="Do not update the game's reference pose cache.")
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    paths = sorted(os.path.join(args.input, file) for file in os.listdir(args.input)
+                   if os.path.splitext(file)[1].lower() in REFERENCE_EXTENSIONS)
+    if not paths:
+        print(f"No reference images found in {args.input}")
+        return
+
+    # Spawn fresh workers so no MediaPipe graph state is inherited through fork
+    start = time.perf_counter()
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=context, initializer=init_worker) as executor:
+        results = list(executor.map(process_image, paths, chunksize=max(1, len(paths) // (args.workers * 4))))
+    elapsed = time.perf_counter() - start
+
+    write_library(results, args.output)
+
+    if not args.no_cache:
+        # Seed the game's landmark index so the first round needs no inference. Entries are only added or
+        # replaced, images outside --input keep theirs
+        cache = ReferencePoseCache(PoseDetector(static_image_mode=True))
+        cache.read_index()
+        cache.entries.update({result['key']: result['landmarks'].to_dict() if result['landmarks'] is not None else None
+                              for result in results})
+        cache.write_index()
+
+    incomplete = [result['path'] for result in results if result['landmarks'] is None]
+    print(f"Processed {len(paths)} images with {args.workers} workers in {elapsed:.2f} s "
+          f"({len(paths) / elapsed:.1f} images/sec)")
+    print(f"Wrote {args.output}")
+    if incomplete:
+        print(f"Cannot get complete landmarks for {len(incomplete)} image(s):")
+        for path in incomplete:
+            print(f"  {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import functools
+import os
+import sys
+
+import pytest
+
+# Modules are imported as top-level packages (game_logic, gui, camera), as main.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_logic import player_manager
+from game_logic.leaderboard_store import LeaderboardStore
+from game_logic.player_manager import PlayerManager
+
+
+@pytest.fixture
+def leaderboard_path(tmp_path, monkeypatch):
+    """Point PlayerManager at a temporary leaderboard.json and reset the singleton around the test."""
+    path = str(tmp_path / 'leaderboard.json')
+    monkeypatch.setattr(player_manager, 'LeaderboardStore', functools.partial(LeaderboardStore, path))
+    monkeypatch.setattr(PlayerManager, '_instance', None)
+    return path
+
+
+@pytest.fixture
+def new_player_manager(leaderboard_path, monkeypatch):
+    """Return a function creating a fresh PlayerManager of the given class, as if the app restarted."""
+    def create(cls=PlayerManager, *args):
+        monkeypatch.setattr(PlayerManager, '_instance', None)
+        return cls(*args)
+    return create
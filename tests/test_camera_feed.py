@@ -0,0 +1,56 @@
+import numpy as np
+
+from camera import camera_feed
+from camera.camera_feed import CameraFeed
+
+
+class FakeCapture:
+    """Stands in for cv2.VideoCapture and returns a new frame on every read."""
+
+    def __init__(self, index):
+        self.n_reads = 0
+
+    def read(self, frame=None):
+        self.n_reads += 1
+        return True, np.full((4, 6, 3), self.n_reads, np.uint8)
+
+    def release(self):
+        pass
+
+
+class FakeLabel:
+    """Stands in for tk.Label. after() jobs are run by the test."""
+
+    def __init__(self):
+        self.jobs = []
+
+    def after(self, delay_ms, callback):
+        self.jobs.append(callback)
+        return len(self.jobs)
+
+    def after_cancel(self, job):
+        pass
+
+    def config(self, **options):
+        pass
+
+
+def test_one_ring_buffer_copy_per_displayed_frame(monkeypatch):
+    monkeypatch.setattr(camera_feed.cv2, 'VideoCapture', FakeCapture)
+    monkeypatch.setattr(camera_feed.ImageTk, 'PhotoImage', lambda image: image)
+    label = FakeLabel()
+    feed = CameraFeed(label, threaded=False)  # Every update_feed() reads and displays one frame
+    for _ in range(4):
+        label.jobs.pop()()
+
+    stats = feed.get_copy_stats()
+    assert stats['displayed_frames'] == 5
+    assert stats['ring_buffer_copies'] == stats['displayed_frames']
+    assert stats['copies_per_displayed_frame'] == 3
+
+    # A frame already on screen is not copied again
+    feed.annotated_frame = (np.zeros((4, 6, 3), np.uint8), float('inf'))
+    feed.displayed_annotated_frame = feed.annotated_frame
+    label.jobs.pop()()
+    assert feed.get_copy_stats()['ring_buffer_copies'] == 5
+    feed.running = False
@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from game_logic.player_manager import PlayerManager
+from game_logic.sqlite_player_manager import SqlitePlayerManager
+
+
+@pytest.fixture(params=['json', 'sqlite'])
+def pm(request, new_player_manager, tmp_path):
+    if request.param == 'sqlite':
+        return new_player_manager(SqlitePlayerManager, str(tmp_path / 'leaderboard.db'))
+    return new_player_manager(PlayerManager)
+
+
+def standings_by_cluster(pm):
+    return {cluster: (total, count) for cluster, total, count, _ in pm.get_cluster_standings()}
+
+
+def test_totals_follow_score_updates(pm):
+    pm.update_leaderboard('ann', 'Cluster 1', 40)
+    pm.update_leaderboard('bob', 'Cluster 1', 20)
+    pm.update_leaderboard('cid', 'Cluster 2', 50)
+    assert pm.get_cluster_standings() == [('Cluster 1', 60, 2, 30.0), ('Cluster 2', 50, 1, 50.0)]
+
+    pm.update_leaderboard('bob', 'Cluster 1', 35)  # New best: total moves by the difference, count stays
+    assert standings_by_cluster(pm)['Cluster 1'] == (75, 2)
+    pm.update_leaderboard('ann', 'Cluster 1', 10)  # Not a new best: nothing changes
+    assert standings_by_cluster(pm)['Cluster 1'] == (75, 2)
+    pm.update_leaderboard('dan', 'Cluster 2', 30)  # New player: count goes up
+    assert pm.get_cluster_standings() == [('Cluster 2', 80, 2, 40.0), ('Cluster 1', 75, 2, 37.5)]
+
+
+def test_totals_and_cluster_ranks_match_a_full_scan(pm):
+    rng = random.Random(0)
+    for _ in range(300):
+        name, cluster = f"player{rng.randrange(60)}", f"Cluster {rng.randint(1, 22)}"
+        if not pm.player_exists(name, cluster):
+            pm.add_player(name, cluster)
+        pm.update_leaderboard(name, cluster, rng.randrange(0, 300, 10))
+
+    leaderboard = pm.get_leaderboard()
+    expected = {}
+    for (_, cluster), score in leaderboard:
+        total, count = expected.get(cluster, (0, 0))
+        expected[cluster] = (total + score, count + 1)
+    assert standings_by_cluster(pm) == expected
+
+    for cluster in expected:
+        cluster_leaderboard = [entry for entry in leaderboard if entry[0][1] == cluster]
+        assert pm.get_cluster_leaderboard(cluster) == cluster_leaderboard
+        assert pm.get_cluster_leaderboard(cluster, 3) == cluster_leaderboard[:3]
+        for rank, (key, _) in enumerate(cluster_leaderboard, start=1):
+            assert pm.get_player_cluster_rank(*key) == rank
+
+
+def test_totals_survive_a_restart(pm, new_player_manager):
+    pm.update_leaderboard('ann', 'Cluster 1', 40)
+    pm.update_leaderboard('ann', 'Cluster 1', 70)
+    pm.update_leaderboard('bob', 'Cluster 3', 20)
+    expected = pm.get_cluster_standings()
+    if isinstance(pm, SqlitePlayerManager):
+        reopened = new_player_manager(SqlitePlayerManager, pm.path)
+    else:
+        reopened = new_player_manager(PlayerManager)
+    assert reopened.get_cluster_standings() == expected == [('Cluster 1', 70, 1, 70.0), ('Cluster 3', 20, 1, 20.0)]
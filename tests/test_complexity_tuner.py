@@ -0,0 +1,115 @@
+import time
+
+from game_logic.complexity_tuner import ComplexityAutoTuner
+
+
+class FakePose:
+    def __init__(self, model_complexity):
+        self.model_complexity = model_complexity
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeDetector:
+    """Stands in for PoseDetector: builds fake graphs, optionally failing for some complexities."""
+
+    def __init__(self, model_complexity=1, failing=()):
+        self.model_complexity = model_complexity
+        self.pose = FakePose(model_complexity)
+        self.failing = set(failing)
+
+    def create_pose(self, model_complexity):
+        if model_complexity in self.failing:
+            raise RuntimeError("model download failed")
+        return FakePose(model_complexity)
+
+    def set_pose(self, pose, model_complexity):
+        old_pose, self.pose = self.pose, pose
+        self.model_complexity = model_complexity
+        return old_pose
+
+
+def make_tuner(detector, **kwargs):
+    """Tuner at 10 FPS (100 ms budget, step up below 60 ms) deciding every 3 frames without cooldown."""
+    return ComplexityAutoTuner(detector, target_fps=10, window_size=3, cooldown_s=0, **kwargs)
+
+
+def feed(tuner, latency_ms, frames=3):
+    """Record frames and wait for a graph build that they started."""
+    for _ in range(frames):
+        tuner.record(latency_ms)
+    if tuner.build_thread is not None:
+        tuner.build_thread.join()
+
+
+def test_steps_up_then_back_down_and_remembers_too_slow():
+    detector = FakeDetector(model_complexity=1)
+    tuner = make_tuner(detector, max_complexity=2)
+
+    feed(tuner, 50)  # Well within the headroom
+    assert tuner.pending_switch == (1, 2, 50)
+    tuner.record(50)  # Installs the new graph between frames
+    assert detector.model_complexity == 2
+
+    feed(tuner, 150)  # Over budget
+    tuner.record(150)
+    assert detector.model_complexity == 1
+    assert tuner.too_slow_complexity == 2
+
+    feed(tuner, 50, frames=6)  # Fast again, but 2 was measured too slow
+    assert detector.model_complexity == 1
+    assert tuner.pending_switch is None
+
+
+def test_dead_band_keeps_complexity():
+    detector = FakeDetector(model_complexity=1)
+    tuner = make_tuner(detector, max_complexity=2)
+    feed(tuner, 80, frames=9)  # Between headroom * budget and budget
+    assert detector.model_complexity == 1
+    assert tuner.pending_switch is None
+
+
+def test_default_does_not_step_up_to_the_heavy_model():
+    detector = FakeDetector(model_complexity=1)
+    tuner = make_tuner(detector)
+    feed(tuner, 10, frames=9)
+    assert detector.model_complexity == 1
+    assert tuner.build_thread is None
+
+
+def test_steps_down_to_min_complexity_only():
+    detector = FakeDetector(model_complexity=1)
+    tuner = make_tuner(detector)
+    feed(tuner, 150)
+    tuner.record(150)
+    assert detector.model_complexity == 0
+    feed(tuner, 150, frames=6)
+    assert detector.model_complexity == 0
+    assert tuner.build_thread is not None and tuner.pending_switch is None
+
+
+def test_failed_build_keeps_current_graph():
+    detector = FakeDetector(model_complexity=1, failing={0})
+    tuner = make_tuner(detector)
+    feed(tuner, 150)
+    assert tuner.unavailable == {0}
+    tuner.record(150)
+    assert tuner.pending_switch is None
+    feed(tuner, 150, frames=6)  # Never retries the unavailable complexity
+    assert detector.model_complexity == 1
+    assert tuner.unavailable == {0}
+
+
+def test_old_graph_is_closed_after_install():
+    detector = FakeDetector(model_complexity=1)
+    old_pose = detector.pose
+    tuner = make_tuner(detector)
+    feed(tuner, 150)
+    tuner.record(150)
+    for _ in range(100):
+        if old_pose.closed:
+            break
+        time.sleep(0.01)
+    assert old_pose.closed
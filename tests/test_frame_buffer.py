@@ -0,0 +1,97 @@
+import threading
+import time
+
+from camera.frame_buffer import FrameRingBuffer
+
+
+def write_frame(ring, value, shape=(4, 6, 3), timestamp=0.0):
+    """Write a frame filled with value and publish it. Returns its sequence number."""
+    ring.begin_write(shape)[:] = value
+    return ring.commit(timestamp)
+
+
+class OverwritingBuffers:
+    """Stands in for FrameRingBuffer.buffers and lets the writer publish a new frame during the first copy."""
+
+    def __init__(self, ring, value):
+        self.ring = ring
+        self.value = value
+        self.buffers = ring.buffers
+        self.shape, self.dtype = ring.buffers.shape, ring.buffers.dtype
+
+    def __getitem__(self, slot):
+        return self
+
+    def copy(self):
+        frame = self.buffers[self.ring.latest].copy()
+        if self.value is not None:
+            self.ring.buffers = self.buffers  # Later copies read the buffers directly
+            write_frame(self.ring, self.value)
+            self.value = None
+        return frame
+
+
+def test_get_latest_returns_newest_frame():
+    ring = FrameRingBuffer(size=3)
+    assert ring.get_latest() == (None, 0, 0.0)
+    for value in range(1, 5):
+        write_frame(ring, value, timestamp=value / 10)
+    frame, seq, timestamp = ring.get_latest()
+    assert (seq, timestamp) == (4, 0.4)
+    assert (frame == 4).all()
+    assert ring.get_latest(last_seq=4)[0] is None
+
+
+def test_torn_read_is_rejected():
+    ring = FrameRingBuffer(size=1)  # The writer always refills the only slot
+    write_frame(ring, 1)
+    ring.buffers = OverwritingBuffers(ring, 2)
+    frame, seq, _ = ring.get_latest()
+    assert seq == 2
+    assert (frame == 2).all()
+
+
+def test_reader_waits_for_the_slot_being_written():
+    ring = FrameRingBuffer(size=1)
+    write_frame(ring, 1)
+    ring.begin_write((4, 6, 3))[:] = 2  # The only slot is being written
+    result = []
+    reader = threading.Thread(target=lambda: result.append(ring.get_latest()))
+    reader.start()
+    time.sleep(0.05)
+    assert reader.is_alive()
+    ring.commit(0.0)
+    reader.join(timeout=1)
+    frame, seq, _ = result[0]
+    assert seq == 2
+    assert (frame == 2).all()
+
+
+def test_resolution_change_invalidates_every_slot():
+    ring = FrameRingBuffer(size=3)
+    for value in range(1, 4):
+        write_frame(ring, value)
+    stale_slot = ring.latest
+
+    ring.begin_write((8, 10, 3))  # New resolution, not published yet
+    assert all(seq <= 0 for seq in ring.slot_seqs)
+    assert ring.get_latest() == (None, 0, 0.0)
+
+    # A reader that picked the newest slot before the reallocation must not copy the uninitialized buffer
+    ring.latest = stale_slot
+    assert ring.get_latest(last_seq=2)[0] is None
+    ring.latest = -1
+
+    ring.buffers[ring.write_slot][:] = 7
+    seq = ring.commit(1.0)
+    frame, latest_seq, _ = ring.get_latest()
+    assert latest_seq == seq == 4
+    assert frame.shape == (8, 10, 3)
+    assert (frame == 7).all()
+
+
+def test_wait_for_frame_times_out():
+    ring = FrameRingBuffer()
+    write_frame(ring, 1)
+    assert ring.wait_for_frame(last_seq=1, timeout=0.01)[0] is None
+    assert (ring.wait_for_frame(last_seq=0, timeout=0.01)[0] == 1).all()
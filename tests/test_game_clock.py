@@ -0,0 +1,188 @@
+import types
+
+import pytest
+
+from game_logic.game_clock import GameClock, seconds_left
+from game_logic.game_logic import GameLogic
+from game_logic.player_manager import PlayerManager
+
+
+class FakeTime:
+    """Monotonic time source in nanoseconds that only moves when told to."""
+
+    def __init__(self):
+        self.now_ns = 5_000_000_000  # Monotonic time does not start at zero
+
+    def __call__(self):
+        return self.now_ns
+
+    def advance(self, ms):
+        self.now_ns += int(ms * 1e6)
+
+
+class FakeWidget:
+    """Records after() calls instead of running a Tk loop."""
+
+    def __init__(self):
+        self.jobs = {}  # Dictionary to store job id: (delay ms, callback)
+        self.next_job = 0
+
+    def after(self, delay_ms, callback):
+        self.next_job += 1
+        self.jobs[self.next_job] = (delay_ms, callback)
+        return self.next_job
+
+    def after_cancel(self, job):
+        del self.jobs[job]
+
+    def run_pending(self, fake_time, late_ms=0):
+        """Advance time to the earliest pending job (plus late_ms) and run it. Returns its delay."""
+        job = min(self.jobs, key=lambda job: self.jobs[job][0])
+        delay_ms, callback = self.jobs.pop(job)
+        fake_time.advance(delay_ms + late_ms)
+        callback()
+        return delay_ms
+
+
+@pytest.fixture
+def fake_time():
+    return FakeTime()
+
+
+@pytest.fixture
+def clock(fake_time):
+    clock = GameClock(FakeWidget(), time_ns=fake_time)
+    clock.start()
+    return clock
+
+
+def test_elapsed_ms_follows_the_time_source(clock, fake_time):
+    assert GameClock(time_ns=fake_time).elapsed_ms() == 0.0
+    assert clock.elapsed_ms() == 0.0
+    fake_time.advance(1234.5)
+    assert clock.elapsed_ms() == 1234.5
+    clock.start()
+    assert clock.elapsed_ms() == 0.0
+
+
+def test_seconds_left():
+    assert seconds_left(90, 0) == (90, 1000)
+    assert seconds_left(90, 1) == (90, 1000)
+    assert seconds_left(90, 1000) == (89, 2000)
+    assert seconds_left(90, 1500) == (89, 2000)
+    assert seconds_left(90, 89_999) == (1, 90_000)
+    assert seconds_left(90, 90_000) == (0, None)
+    assert seconds_left(90, 95_000) == (0, None)
+
+
+def test_round_timer_does_not_drift_with_late_ticks(clock, fake_time):
+    ticks = []
+
+    def update_timer():
+        # Same loop as GameFrame.update_timer()
+        time_left, next_tick_ms = seconds_left(3, clock.elapsed_ms())
+        ticks.append((clock.elapsed_ms(), time_left))
+        if next_tick_ms is not None:
+            clock.call_at(next_tick_ms, update_timer)
+
+    update_timer()
+    while clock.widget.jobs:
+        clock.widget.run_pending(fake_time, late_ms=30)  # Every tick runs 30 ms late
+    assert ticks == [(0, 3), (1030, 2), (2030, 1), (3030, 0)]
+
+
+def test_early_after_is_rescheduled(clock, fake_time):
+    fired = []
+    clock.call_at(1000, lambda: fired.append(clock.elapsed_ms()))
+    assert clock.widget.run_pending(fake_time, late_ms=-10) == 1000  # Tk fired 10 ms early
+    assert fired == []
+    assert clock.widget.run_pending(fake_time) == 10
+    assert fired == [1000]
+
+
+def test_cancel_and_stop(clock, fake_time):
+    fired = []
+    first = clock.call_later(500, lambda: fired.append(1))
+    clock.call_later(800, lambda: fired.append(2))
+    clock.cancel(first)
+    clock.cancel(first)  # Ignored
+    assert len(clock.widget.jobs) == 1
+    clock.stop()
+    assert clock.widget.jobs == {} and clock.timers == {}
+    fake_time.advance(1000)
+    assert fired == []
+
+
+@pytest.fixture
+def game_logic(new_player_manager, clock):
+    pm = new_player_manager()
+    pm.add_player('ann', 'Cluster 1')
+    pm.set_current_player('ann', 'Cluster 1')
+    vision_service = types.SimpleNamespace(camera_feed=None, live_pose_estimator=None, complexity_tuner=None,
+                                           get_pose_matcher=lambda *args: None, get_reference_pose=lambda path: None)
+    combos = []
+    game_logic = GameLogic(['pose0.png', 'pose1.png'], vision_service, lambda: None, combos.append, game_clock=clock)
+    game_logic.combos = combos
+    return game_logic
+
+
+def test_combo_window_uses_game_time(game_logic, fake_time):
+    pm = PlayerManager.get_instance()
+
+    def match_at(ms):
+        # The game loop checks the combo window on every frame, then process_frame() confirms a match
+        fake_time.advance(ms - game_logic.game_clock.elapsed_ms())
+        game_logic.expire_combo()
+        game_logic.last_match_time = game_logic.game_clock.elapsed_ms()
+        game_logic.update_score()
+
+    match_at(1000)
+    assert (game_logic.score_multiplier, pm.get_player_score()) == (2, 2)
+    match_at(4000)
+    match_at(8999)  # 4999 ms after the previous match, still in the window
+    assert (game_logic.score_multiplier, pm.get_player_score()) == (4, 9)
+    match_at(13999)  # Exactly 5000 ms later: the combo broke before this match
+    assert (game_logic.score_multiplier, pm.get_player_score()) == (2, 11)
+    assert game_logic.combos == [2, 3, 4, 1, 2]
+
+    fake_time.advance(4999)
+    game_logic.expire_combo()
+    assert game_logic.score_multiplier == 2
+    fake_time.advance(1)
+    game_logic.expire_combo()
+    assert game_logic.score_multiplier == 1
+    assert game_logic.combos[-1] == 1
+
+
+def test_pause_freezes_elapsed_time(clock, fake_time):
+    fake_time.advance(1000)
+    clock.pause()
+    assert clock.is_paused()
+    fake_time.advance(5000)
+    assert clock.elapsed_ms() == 1000
+    clock.pause()  # Ignored while paused
+    clock.resume()
+    assert not clock.is_paused()
+    assert clock.elapsed_ms() == 1000
+    fake_time.advance(250)
+    assert clock.elapsed_ms() == 1250
+    clock.resume()  # Ignored while running
+    assert clock.elapsed_ms() == 1250
+
+
+def test_resume_moves_pending_timers_forward(clock, fake_time):
+    fired = []
+    clock.call_at(1000, lambda: fired.append((fake_time.now_ns, clock.elapsed_ms())))
+    start_ns = fake_time.now_ns
+    fake_time.advance(400)
+    clock.pause()
+    assert clock.widget.jobs == {}  # Held while paused
+    clock.call_at(1200, lambda: fired.append((fake_time.now_ns, clock.elapsed_ms())))
+    assert clock.widget.jobs == {}
+    fake_time.advance(3000)
+
+    clock.resume()
+    assert sorted(delay for delay, _ in clock.widget.jobs.values()) == [600, 800]  # Remaining game time
+    clock.widget.run_pending(fake_time)
+    clock.widget.run_pending(fake_time, late_ms=-600)  # Both after() delays count from the resume
+    assert fired == [(start_ns + 4_000_000_000, 1000), (start_ns + 4_200_000_000, 1200)]
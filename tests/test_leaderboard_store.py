@@ -0,0 +1,97 @@
+import os
+import random
+
+from game_logic.leaderboard_store import LeaderboardStore
+
+
+def play_random_games(pm, rng, n_games):
+    for _ in range(n_games):
+        name, cluster = f"player{rng.randrange(30)}", f"Cluster {rng.randint(1, 3)}"
+        if not pm.player_exists(name, cluster):
+            pm.add_player(name, cluster)
+        pm.set_current_player(name, cluster)
+        pm.set_player_score(pm.get_player_score() + rng.choice([0, 10, 20]))
+        pm.decrement_player_attempts(name, cluster)
+        pm.update_leaderboard()
+
+
+def state(pm):
+    return pm.players, pm.get_leaderboard(), pm.get_cluster_standings()
+
+
+def test_store_round_trip(tmp_path):
+    store = LeaderboardStore(str(tmp_path / 'leaderboard.json'), compact_every=2)
+    assert store.read_snapshot() == ({}, [])
+    assert store.read_journal() == []
+
+    store.append(('ann', 'Cluster 1'), [30, 2], 30)
+    store.append(('bob', 'Cluster 2'), None, 10)
+    assert store.needs_compaction()
+    assert LeaderboardStore(store.path).read_journal() == [(('ann', 'Cluster 1'), [30, 2], 30),
+                                                           (('bob', 'Cluster 2'), None, 10)]
+
+    store.compact({('ann', 'Cluster 1'): [30, 2]}, [(('ann', 'Cluster 1'), 30), (('bob', 'Cluster 2'), 10)])
+    assert not store.needs_compaction()
+    assert not os.path.exists(store.path + '.tmp')
+    reopened = LeaderboardStore(store.path)
+    assert reopened.read_snapshot() == ({('ann', 'Cluster 1'): [30, 2]},
+                                        [(('ann', 'Cluster 1'), 30), (('bob', 'Cluster 2'), 10)])
+    assert reopened.read_journal() == []
+
+
+def test_store_stops_reading_at_a_torn_line(tmp_path):
+    store = LeaderboardStore(str(tmp_path / 'leaderboard.json'))
+    store.append(('ann', 'Cluster 1'), [30, 1], 30)
+    with open(store.journal_path, 'a') as file:
+        file.write('{"player": "bob:Cluster 2", "val')
+    assert store.read_journal() == [(('ann', 'Cluster 1'), [30, 1], 30)]
+    assert store.has_torn_journal
+    assert store.n_journal_entries == 1
+
+
+def test_snapshot_plus_journal_reproduce_the_state(leaderboard_path, new_player_manager):
+    pm = new_player_manager()
+    pm.store.compact_every = 25
+    play_random_games(pm, random.Random(0), 60)
+    assert os.path.getsize(leaderboard_path) > 0
+    assert pm.store.n_journal_entries == 10  # 60 games: compacted twice, 10 entries in the journal
+    expected = state(pm)
+
+    restarted = new_player_manager()
+    assert state(restarted) == expected
+    assert os.path.getsize(leaderboard_path + '.journal') == 0  # Replayed entries are compacted on load
+
+
+def test_torn_journal_line_is_dropped(leaderboard_path, new_player_manager):
+    pm = new_player_manager()
+    play_random_games(pm, random.Random(1), 20)
+    expected = state(pm)
+
+    # Crash in the middle of appending the next game
+    with open(leaderboard_path + '.journal', 'a') as file:
+        file.write('{"player": "player99:Cluster 1", "value": [50, 1], "sco')
+
+    restarted = new_player_manager()
+    assert restarted.store.n_journal_entries == 0
+    assert state(restarted) == expected
+    assert ('player99', 'Cluster 1') not in restarted.players
+
+    # New results go after the dropped line and survive the next restart
+    restarted.add_player('ann', 'Cluster 2')
+    restarted.update_leaderboard('ann', 'Cluster 2', 1000)
+    assert new_player_manager().get_player_rank('ann', 'Cluster 2') == 1
+
+
+def test_compaction_interrupted_before_truncating_the_journal(leaderboard_path, new_player_manager):
+    pm = new_player_manager()
+    play_random_games(pm, random.Random(2), 20)
+    expected = state(pm)
+    with open(leaderboard_path + '.journal') as file:
+        journal = file.read()
+
+    # Crash after the new snapshot was renamed into place but before the journal was emptied
+    pm.save_leaderboard()
+    with open(leaderboard_path + '.journal', 'w') as file:
+        file.write(journal)
+
+    assert state(new_player_manager()) == expected  # Replaying absolute values is harmless
@@ -0,0 +1,103 @@
+import numpy as np
+
+from game_logic.pose_embedding import PoseIndex, embed_poses
+from game_logic.pose_landmarks import NUM_LANDMARKS, PoseLandmarks
+
+
+def random_pose(rng):
+    """Return a complete pose with an upright torso and limbs spread around a 640x480 frame."""
+    data = np.zeros((NUM_LANDMARKS, 4), dtype=np.float32)
+    data[:, :2] = rng.uniform((100, 50), (540, 430), size=(NUM_LANDMARKS, 2))
+    data[[11, 12, 23, 24], :2] = [(370, 150), (270, 150), (355, 300), (285, 300)] + rng.normal(0, 10, size=(4, 2))
+    data[:, 2] = rng.uniform(-50, 50, size=NUM_LANDMARKS)
+    data[:, 3] = rng.uniform(0.5, 1, size=NUM_LANDMARKS)
+    return PoseLandmarks(data, np.ones(NUM_LANDMARKS, dtype=bool))
+
+
+def transformed(pose, scale=1.0, shift=(0, 0), angle=0.0, noise=0.0, rng=None):
+    """Return a copy of a pose scaled, rotated about the origin, shifted and perturbed in x, y."""
+    data = pose.data.copy()
+    cos, sin = np.cos(angle), np.sin(angle)
+    x, y = data[:, 0].copy(), data[:, 1].copy()
+    data[:, 0] = (x * cos - y * sin) * scale + shift[0]
+    data[:, 1] = (x * sin + y * cos) * scale + shift[1]
+    data[:, 2] *= scale
+    if noise:
+        data[:, :2] += rng.normal(0, noise, size=(NUM_LANDMARKS, 2))
+    return PoseLandmarks(data, pose.present.copy())
+
+
+def vars_of(pose):
+    """Return the (data, present) arguments of embed_poses() for a pose."""
+    return pose.data, pose.present
+
+
+def test_embedding_ignores_scale_and_translation():
+    rng = np.random.default_rng(0)
+    pose = random_pose(rng)
+    embedding, valid = embed_poses(pose.data, pose.present)
+    moved, moved_valid = embed_poses(*vars_of(transformed(pose, scale=2.5, shift=(-120, 75))))
+    assert valid and moved_valid
+    np.testing.assert_allclose(embedding, moved, atol=1e-4)
+
+
+def test_embedding_ignores_visibility_by_default():
+    rng = np.random.default_rng(1)
+    pose = random_pose(rng)
+    less_visible = PoseLandmarks(pose.data.copy(), pose.present)
+    less_visible.data[:, 3] *= 0.3
+    np.testing.assert_array_equal(embed_poses(*vars_of(pose))[0], embed_poses(*vars_of(less_visible))[0])
+
+
+def test_min_visibility_drops_the_pose_instead_of_scaling_it():
+    rng = np.random.default_rng(2)
+    pose = random_pose(rng)
+    pose.data[13, 3] = 0.2  # Left elbow
+    assert embed_poses(*vars_of(pose), min_visibility=0.1)[1]
+    assert not embed_poses(*vars_of(pose), min_visibility=0.5)[1]
+
+
+def test_align_torso_ignores_rotation():
+    rng = np.random.default_rng(3)
+    pose = random_pose(rng)
+    embedding, _ = embed_poses(*vars_of(pose), align_torso=True)
+    rotated, _ = embed_poses(*vars_of(transformed(pose, angle=0.4)), align_torso=True)
+    np.testing.assert_allclose(embedding, rotated, atol=1e-4)
+
+
+def test_missing_torso_landmark_is_invalid():
+    pose = random_pose(np.random.default_rng(4))
+    pose.present[23] = False  # Left hip
+    embedding, valid = embed_poses(*vars_of(pose))
+    assert not valid
+    assert not embedding.any()
+
+
+def test_index_finds_perturbed_reference():
+    rng = np.random.default_rng(5)
+    references = [random_pose(rng) for _ in range(50)]
+    pose_index = PoseIndex(references)
+    assert len(pose_index) == 50
+    for i, reference in enumerate(references):
+        live_pose = transformed(reference, scale=rng.uniform(0.5, 2), shift=rng.uniform(-100, 100, 2), noise=1.0, rng=rng)
+        index, distance = pose_index.nearest(live_pose)
+        assert index == i
+        assert distance < 0.2
+
+
+def test_index_skips_incomplete_references():
+    rng = np.random.default_rng(6)
+    references = [random_pose(rng) for _ in range(3)]
+    references[1].present[:] = False
+    pose_index = PoseIndex(references)
+    assert len(pose_index) == 2
+    indices, distances = pose_index.query(references[2], k=5)
+    assert list(indices) == [2, 0]
+    assert distances[0] == 0
+    assert pose_index.nearest(references[1]) == (-1, float('inf'))
+
+
+def test_empty_index():
+    pose_index = PoseIndex([])
+    assert len(pose_index) == 0
+    assert pose_index.nearest(random_pose(np.random.default_rng(7))) == (-1, float('inf'))
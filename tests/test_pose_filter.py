@@ -0,0 +1,91 @@
+import math
+
+import numpy as np
+
+from game_logic.pose_filter import HoldConfirmation, OneEuroFilter
+
+
+def run(one_euro, values, interval_ms=33.0):
+    """Filter a sequence of scalar frames at a fixed interval and return the filtered values."""
+    frame = np.zeros((1, 1), dtype=np.float32)
+    out = []
+    for i, value in enumerate(values):
+        frame[0, 0] = value
+        out.append(float(one_euro.filter(frame, i * interval_ms)[0, 0]))
+    return out
+
+
+def test_first_frame_passes_through_and_filters_in_place():
+    one_euro = OneEuroFilter(shape=(33, 2))
+    frame = np.full((33, 2), 100, dtype=np.float32)
+    assert one_euro.filter(frame, 0.0) is frame
+    np.testing.assert_array_equal(frame, 100)
+
+
+def test_still_value_follows_the_min_cutoff():
+    # Without speed, every frame moves by alpha = r / (1 + r) with r = 2 * pi * min_cutoff * dt
+    one_euro = OneEuroFilter(shape=(1, 1), min_cutoff=1.0, beta=0.0)
+    out = run(one_euro, [0.0, 10.0])
+    r = 2 * math.pi * 1.0 * 0.033
+    assert out[1] == np.float32(10 * r / (1 + r))
+
+
+def test_lower_min_cutoff_smooths_jitter_more():
+    rng = np.random.default_rng(0)
+    jitter = 100 + rng.normal(0, 3, 300)
+    residuals = []
+    for min_cutoff in (0.5, 1.5, 10.0):
+        out = np.array(run(OneEuroFilter(shape=(1, 1), min_cutoff=min_cutoff, beta=0.0), jitter))
+        residuals.append(np.std(out[50:] - 100))
+    assert residuals[0] < residuals[1] < residuals[2] < np.std(jitter[50:] - 100)
+
+
+def test_beta_reduces_lag_on_fast_movement():
+    ramp = [i * 20.0 for i in range(60)]  # 600 px/s
+    lags = [ramp[-1] - run(OneEuroFilter(shape=(1, 1), min_cutoff=1.0, beta=beta), ramp)[-1] for beta in (0.0, 0.05)]
+    assert 0 < lags[1] < lags[0] / 3
+
+
+def test_gap_restarts_the_filter():
+    one_euro = OneEuroFilter(shape=(1, 1), reset_after_ms=300)
+    frame = np.zeros((1, 1), dtype=np.float32)
+    one_euro.filter(frame, 0.0)
+    frame[0, 0] = 50
+    assert one_euro.filter(frame, 100.0)[0, 0] < 50  # Smoothed
+    frame[0, 0] = 80
+    assert one_euro.filter(frame, 500.0)[0, 0] == 80  # 400 ms gap: starts over from the new frame
+    frame[0, 0] = 90
+    one_euro.reset()
+    assert one_euro.filter(frame, 533.0)[0, 0] == 90
+
+
+def test_hold_confirms_after_hold_ms():
+    hold = HoldConfirmation(hold_ms=300, grace_ms=100)
+    confirmed = [hold.update(True, t) for t in range(0, 400, 50)]
+    assert confirmed == [False, False, False, False, False, False, True, True]  # From 300 ms on
+
+
+def feed(hold, matches, interval_ms=50):
+    """Record one frame per interval_ms and return the times at which the hold was confirmed."""
+    return [i * interval_ms for i, match in enumerate(matches) if hold.update(match, i * interval_ms)]
+
+
+def test_hold_survives_short_drops():
+    hold = HoldConfirmation(hold_ms=300, grace_ms=100)
+    # A single missed frame leaves a 100 ms gap between matches, within the grace period
+    assert feed(hold, [True, True, False, True, True, True, True]) == [300]
+
+
+def test_hold_restarts_when_the_match_drops():
+    hold = HoldConfirmation(hold_ms=300, grace_ms=100)
+    # Two missed frames leave a 150 ms gap: the hold starts over at 250 ms
+    assert feed(hold, [True, True, True, True] + [False, False] + [True] * 8) == [600, 650]
+    assert not hold.update(False, 700)  # A frame without a match is never confirmed
+
+
+def test_hold_reset_forgets_the_hold():
+    hold = HoldConfirmation(hold_ms=300, grace_ms=100)
+    assert feed(hold, [True] * 6) == []  # Held from 0 to 250 ms
+    hold.reset()  # New reference pose
+    confirmed = [t for t in range(300, 700, 50) if hold.update(True, t)]
+    assert confirmed == [600, 650]
@@ -0,0 +1,50 @@
+import numpy as np
+
+from game_logic.pose_landmarks import NUM_LANDMARKS, PoseLandmarks
+from game_logic.pose_matcher import PoseMatcher, angle_deltas
+
+TRIPLES = np.array([(0, 1, 2), (3, 4, 5)], dtype=np.intp)
+
+
+def pose_with_angles(*angles):
+    """Return a pose whose TRIPLES joints have the given angles in degrees."""
+    data = np.zeros((NUM_LANDMARKS, 4), dtype=np.float32)
+    present = np.zeros(NUM_LANDMARKS, dtype=bool)
+    for (p1, p2, p3), angle in zip(TRIPLES, angles):
+        vertex = np.array([100.0 + 200 * p2, 200.0])
+        data[p2, :2] = vertex
+        data[p1, :2] = vertex + (100, 0)
+        data[p3, :2] = vertex + 100 * np.array([np.cos(np.radians(angle)), np.sin(np.radians(angle))])
+        present[[p1, p2, p3]] = True
+    return PoseLandmarks(data, present)
+
+
+def test_angle_deltas_wrap_around():
+    np.testing.assert_allclose(angle_deltas(np.array([359.0, 10, 180, 90]), np.array([1.0, 350, 0, 90])),
+                               [2, 20, 180, 0])
+
+
+def test_score_across_the_seam():
+    matcher = PoseMatcher([pose_with_angles(359, 180)], threshold=10, triples=TRIPLES)
+    deltas, similarity = matcher.score(pose_with_angles(1, 181))
+    np.testing.assert_allclose(deltas, [[2, 1]], atol=1e-2)
+    np.testing.assert_allclose(similarity, [1 - 1.5 / 180], atol=1e-4)
+    assert matcher.is_match(pose_with_angles(1, 181), 0)
+    assert not matcher.is_match(pose_with_angles(20, 181), 0)
+
+
+def test_best_match_picks_the_closest_matching_reference():
+    references = [
+        pose_with_angles(90, 90),
+        pose_with_angles(5, 170),  # Matches, 7 and 6 degrees off
+        pose_with_angles(357, 178),  # Matches across the seam, 1 and 2 degrees off
+        PoseLandmarks(),  # No pose, never matches
+        pose_with_angles(2, 90),  # Close on the first joint only
+    ]
+    matcher = PoseMatcher(references, threshold=10, triples=TRIPLES)
+    live_pose = pose_with_angles(358, 176)
+    assert list(matcher.matches(live_pose)) == [False, True, True, False, False]
+    index, similarity = matcher.best_match(live_pose)
+    assert index == 2
+    assert similarity > 0.98
+    assert matcher.best_match(pose_with_angles(270, 270)) == (-1, 0.0)
@@ -0,0 +1,47 @@
+import random
+
+from benchmark_leaderboard import SortedListLeaderboard
+from game_logic.ranked_index import RankedIndex
+
+
+def test_matches_resorted_list():
+    rng = random.Random(0)
+    index, oracle = RankedIndex(), SortedListLeaderboard()
+    keys = [(f"player{i}", f"Cluster {i % 5 + 1}") for i in range(80)]
+    for _ in range(2000):
+        key, score = rng.choice(keys), rng.randrange(0, 200, 10)  # Many equal scores
+        expected_changed = key not in dict(oracle.leaderboard) or score > dict(oracle.leaderboard)[key]
+        assert index.update(key, score) == expected_changed
+        oracle.update(key, score)
+
+        assert index.items() == oracle.leaderboard
+        assert index.get_top(5) == oracle.get_top(5)
+        probe = rng.choice(keys)
+        assert index.get_rank(probe) == oracle.get_rank(probe)
+        assert index.get_score(probe) == dict(oracle.leaderboard).get(probe)
+    assert len(index) == len(oracle.leaderboard)
+
+
+def test_ties_keep_the_order_scores_were_reached():
+    index = RankedIndex()
+    index.update('a', 10)
+    index.update('b', 10)
+    index.update('c', 5)
+    index.update('c', 10)  # Reaches 10 last
+    index.update('a', 10)  # Not an improvement, keeps its place
+    assert index.items() == [('a', 10), ('b', 10), ('c', 10)]
+    index.update('a', 12)
+    assert [index.get_rank(key) for key in 'abc'] == [1, 2, 3]
+
+
+def test_remove_and_missing_players():
+    index = RankedIndex()
+    for key, score in [('a', 3), ('b', 2), ('c', 1)]:
+        index.update(key, score)
+    index.remove('b')
+    index.remove('b')  # Ignored
+    assert 'b' not in index and 'a' in index
+    assert index.items() == [('a', 3), ('c', 1)]
+    assert index.get_rank('b') == -1
+    assert index.get_score('b') is None
+    assert index.get_rank('c') == 2
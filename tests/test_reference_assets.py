@@ -0,0 +1,25 @@
+import cv2
+import numpy as np
+from PIL import Image
+
+from game_logic.reference_assets import ReferenceAssetCache
+
+
+def test_bgr_is_a_cached_contiguous_copy(tmp_path):
+    rgb = np.zeros((60, 80, 3), dtype=np.uint8)
+    rgb[..., 0] = 255  # Pure red
+    path = str(tmp_path / 'pose.png')
+    Image.fromarray(rgb).save(path)
+
+    cache = ReferenceAssetCache([path], display_size=(40, 30))
+    try:
+        asset = cache.get(path)
+        bgr = asset.bgr
+        assert bgr.flags['C_CONTIGUOUS']
+        assert asset.bgr is bgr
+        np.testing.assert_array_equal(bgr[0, 0], [0, 0, 255])
+        assert asset.display.size == (40, 30)
+        assert cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY).shape == (60, 80)
+        assert not np.shares_memory(asset.rgb, bgr)
+    finally:
+        cache.close()
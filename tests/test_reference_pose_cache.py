@@ -0,0 +1,61 @@
+import numpy as np
+from PIL import Image
+
+from game_logic.pose_landmarks import NUM_LANDMARKS, PoseLandmarks
+from game_logic.reference_assets import ReferenceAssetCache
+from game_logic.reference_pose_cache import ReferencePoseCache
+
+
+class FakeDetector:
+    """Stands in for the static PoseDetector and records the images it is run on."""
+
+    settings = {'static_image_mode': True, 'model_complexity': 1}
+
+    def __init__(self):
+        self.images = []
+
+    def get_complete_pose_landmarks(self, img):
+        self.images.append(img)
+        data = np.zeros((NUM_LANDMARKS, 4), dtype=np.float32)
+        data[:, :3] = img[0, 0]  # Remember which image the pose came from
+        return PoseLandmarks(data, np.ones(NUM_LANDMARKS, dtype=bool))
+
+
+def write_images(tmp_path, colors):
+    """Write one solid-color RGB image per color and return their paths."""
+    paths = []
+    for i, color in enumerate(colors):
+        path = str(tmp_path / f'pose{i}.png')
+        Image.fromarray(np.full((8, 8, 3), color, dtype=np.uint8)).save(path)
+        paths.append(path)
+    return paths
+
+
+def test_detects_missing_entries_once(tmp_path):
+    paths = write_images(tmp_path, [(255, 0, 0), (0, 0, 255)])
+    cache_path = str(tmp_path / 'cache.json')
+    detector = FakeDetector()
+    cache = ReferencePoseCache(detector, cache_path)
+    cache.load(paths)
+    assert len(detector.images) == 2
+    np.testing.assert_array_equal(cache.get(paths[0]).data[0, :3], [0, 0, 255])  # BGR
+
+    detector = FakeDetector()
+    cache = ReferencePoseCache(detector, cache_path)
+    cache.load(paths)
+    assert detector.images == []
+    np.testing.assert_array_equal(cache.get(paths[1]).data[0, :3], [255, 0, 0])
+    assert len(cache.get(str(tmp_path / 'missing.png'))) == 0
+
+
+def test_reference_assets_are_passed_per_call(tmp_path):
+    paths = write_images(tmp_path, [(0, 255, 0)])
+    assets = ReferenceAssetCache(paths, display_size=(4, 4))
+    try:
+        detector = FakeDetector()
+        cache = ReferencePoseCache(detector, str(tmp_path / 'cache.json'))
+        cache.load(paths, assets)
+        assert detector.images[0] is assets.get(paths[0]).bgr  # Detected from the decoded image
+        assert not hasattr(cache, 'reference_assets')
+    finally:
+        assets.close()
@@ -0,0 +1,114 @@
+import random
+import sqlite3
+
+import pytest
+
+from game_logic.leaderboard_store import LeaderboardStore
+from game_logic.player_manager import PlayerManager
+from game_logic.sqlite_player_manager import SqlitePlayerManager
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    return str(tmp_path / 'leaderboard.db')
+
+
+def play_random_games(pm, rng, n_games, n_players=40):
+    """Play games like GameFrame does: add the player if needed, score, decrement attempts, update the leaderboard."""
+    for _ in range(n_games):
+        name, cluster = f"player{rng.randrange(n_players)}", f"Cluster {rng.randint(1, 4)}"
+        if not pm.player_exists(name, cluster):
+            pm.add_player(name, cluster)
+        pm.set_current_player(name, cluster)
+        pm.set_player_score(pm.get_player_score() + rng.choice([0, 10, 20, 40]))  # Equal scores are common
+        pm.decrement_player_attempts(name, cluster)
+        pm.update_leaderboard()
+
+
+def test_migrates_snapshot_and_journal(leaderboard_path, new_player_manager, database_path):
+    store = LeaderboardStore(leaderboard_path)
+    store.compact({('ann', 'Cluster 1'): [30, 1], ('bob', 'Cluster 2'): [30, 0], ('cid', 'Cluster 1'): [10, 1]},
+                  [(('ann', 'Cluster 1'), 30), (('bob', 'Cluster 2'), 30), (('cid', 'Cluster 1'), 10)])
+    store.append(('cid', 'Cluster 1'), [45, 0], 45)
+    store.append(('dan', 'Cluster 2'), [30, 1], 30)
+
+    json_pm = new_player_manager()
+    expected = json_pm.get_leaderboard()
+    pm = new_player_manager(SqlitePlayerManager, database_path)
+
+    assert pm.get_leaderboard() == expected == [(('cid', 'Cluster 1'), 45), (('ann', 'Cluster 1'), 30),
+                                                (('bob', 'Cluster 2'), 30), (('dan', 'Cluster 2'), 30)]
+    assert pm.get_remaining_attempts('cid', 'Cluster 1') == 0
+    assert pm.get_remaining_attempts('ann', 'Cluster 1') == 1
+    assert [pm.get_player_rank(*key) for key, _ in expected] == [1, 2, 3, 4]
+    assert pm.get_cluster_standings() == json_pm.get_cluster_standings() == [('Cluster 1', 75, 2, 37.5),
+                                                                             ('Cluster 2', 60, 2, 30.0)]
+
+    # The database is not migrated again, even if leaderboard.json changes afterwards
+    store.append(('eve', 'Cluster 3'), [99, 0], 99)
+    pm = new_player_manager(SqlitePlayerManager, database_path)
+    assert pm.get_leaderboard() == expected
+
+
+def test_rank_ties_follow_the_order_scores_were_reached(new_player_manager, database_path):
+    pm = new_player_manager(SqlitePlayerManager, database_path)
+    for name, score in [('ann', 50), ('bob', 50), ('cid', 60), ('bob', 60), ('ann', 40)]:
+        if not pm.player_exists(name, 'Cluster 1'):
+            pm.add_player(name, 'Cluster 1')
+        pm.update_leaderboard(name, 'Cluster 1', score)
+
+    expected = [(('cid', 'Cluster 1'), 60), (('bob', 'Cluster 1'), 60), (('ann', 'Cluster 1'), 50)]
+    assert pm.get_leaderboard() == expected
+    assert [pm.get_player_rank(*key) for key, _ in expected] == [1, 2, 3]
+    assert [pm.get_player_cluster_rank(*key) for key, _ in expected] == [1, 2, 3]
+
+    pm = new_player_manager(SqlitePlayerManager, database_path)  # seq is persisted
+    assert pm.get_leaderboard() == expected
+    assert [pm.get_player_rank(*key) for key, _ in expected] == [1, 2, 3]
+
+
+def test_matches_json_backend_on_random_games(new_player_manager, database_path):
+    pm = new_player_manager(SqlitePlayerManager, database_path)  # First, so it does not migrate the JSON results
+    play_random_games(pm, random.Random(0), 300)
+    json_pm = new_player_manager()
+    play_random_games(json_pm, random.Random(0), 300)
+
+    assert pm.get_leaderboard() == json_pm.get_leaderboard()
+    assert pm.get_top_players(5) == json_pm.get_top_players(5)
+    assert pm.get_cluster_standings() == json_pm.get_cluster_standings()
+    for key, _ in json_pm.get_leaderboard():
+        assert pm.get_player_rank(*key) == json_pm.get_player_rank(*key)
+        assert pm.get_player_cluster_rank(*key) == json_pm.get_player_cluster_rank(*key)
+    for cluster in ('Cluster 1', 'Cluster 4'):
+        assert pm.get_cluster_leaderboard(cluster, 3) == json_pm.get_cluster_leaderboard(cluster, 3)
+
+    reopened = new_player_manager(SqlitePlayerManager, database_path)
+    for key, _ in json_pm.get_leaderboard():
+        assert reopened.get_player_rank(*key) == json_pm.get_player_rank(*key)
+
+
+def test_game_scores_are_committed_when_the_game_ends(new_player_manager, database_path):
+    pm = new_player_manager(SqlitePlayerManager, database_path)
+    pm.add_player('ann', 'Cluster 1')
+    pm.set_current_player('ann', 'Cluster 1')
+    pm.set_player_score(10)
+    pm.set_player_score(25)
+    assert pm.get_player_score() == 25
+
+    reader = sqlite3.connect(database_path)
+    query = "SELECT score FROM players WHERE name = 'ann'"
+    assert reader.execute(query).fetchone() == (0,)
+    pm.update_leaderboard()
+    assert reader.execute(query).fetchone() == (25,)
+    assert pm.get_player_rank() == 1
+    reader.close()
+
+
+def test_unknown_player_rank_raises(new_player_manager, database_path):
+    pm = new_player_manager(SqlitePlayerManager, database_path)
+    pm.add_player('ann', 'Cluster 1')
+    assert pm.get_player_rank('ann', 'Cluster 1') == -1
+    assert pm.get_player_cluster_rank('ann', 'Cluster 1') == -1
+    with pytest.raises(ValueError):
+        pm.get_player_rank('bob', 'Cluster 1')
+    assert isinstance(PlayerManager._instance, SqlitePlayerManager)
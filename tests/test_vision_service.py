@@ -0,0 +1,30 @@
+import pytest
+
+from game_logic import vision_service
+from game_logic.vision_service import VisionService
+
+
+class FailingStaticDetector:
+    """Stands in for PoseDetector. The static image detector fails to load, the live one records close()."""
+
+    instances = []
+
+    def __init__(self, static_image_mode=False):
+        if static_image_mode:
+            raise RuntimeError("model not found")
+        self.closed = False
+        FailingStaticDetector.instances.append(self)
+
+    def close(self):
+        self.closed = True
+
+
+def test_failed_construction_leaves_no_instance(monkeypatch):
+    monkeypatch.setattr(VisionService, '_instance', None)
+    monkeypatch.setattr(vision_service, 'PoseDetector', FailingStaticDetector)
+    monkeypatch.setattr(vision_service, 'CameraFeed', lambda: pytest.fail("camera opened for a failed service"))
+    for _ in range(2):  # A retry builds the service again instead of returning a half-built one
+        with pytest.raises(RuntimeError):
+            VisionService.get_instance()
+        assert VisionService._instance is None
+    assert [detector.closed for detector in FailingStaticDetector.instances] == [True, True]